@@ -0,0 +1,272 @@
+"""Benchmarks for the coordinator parsing and entity update hot paths.
+
+Each case runs on synthetic data from 10 to 10k baskets / Fairteiler and reports
+the median time per call. Cases whose work does not grow with the data are timed
+once, without a size. Results are normalised by a pure-Python calibration
+loop so that baselines recorded on one machine remain comparable on another.
+
+    python -m benchmarks.run                  # compare against baselines.json
+    python -m benchmarks.run --update         # re-record baselines.json
+    python -m benchmarks.run --sizes 10,100   # only run some sizes
+    python -m benchmarks.run --threshold 0.5  # allow 50% slowdown before failing
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+
+from custom_components.foodsharing import button, geo_location
+from custom_components.foodsharing.calendar import FoodsharingCalendar
+from custom_components.foodsharing.const import CONF_KEYWORDS, CONF_LOCATIONS, DOMAIN
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+from custom_components.foodsharing.sensor import FoodsharingSensor
+
+BASELINE_FILE = Path(__file__).with_name("baselines.json")
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_THRESHOLD = 0.25
+# Only rearranges the results it is given, whatever their size
+UNSIZED_CASES = frozenset({"normalize_account_results"})
+EMAIL = "bench@example.com"
+ENTRY_ID = "bench_entry"
+CENTER = (50.0, 10.0)
+WORDS = ("Brot", "Äpfel", "Joghurt", "Käse", "Gemüse", "bread", "apples", "rice", "pasta", "Kuchen")
+
+
+def _raw_baskets(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    """Baskets as returned by /api/baskets/nearby."""
+    now = int(time.time())
+    return [
+        {
+            "id": 1_000_000 + i,
+            "description": " ".join(rng.choice(WORDS) for _ in range(12)),
+            "picture": f"/images/basket/{i}.jpg" if i % 2 else None,
+            "lat": CENTER[0] + rng.uniform(-0.05, 0.05),
+            "lon": CENTER[1] + rng.uniform(-0.05, 0.05),
+            "until": now + rng.randint(600, 86400),
+            "creator": {"id": i, "name": f"User {i}"},
+        }
+        for i in range(count)
+    ]
+
+
+def _raw_fairteiler(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    """Fairteiler as stored in coordinator data."""
+    return [
+        {
+            "id": 5_000 + i,
+            "name": f"Fairteiler {i}",
+            "latitude": CENTER[0] + rng.uniform(-0.05, 0.05),
+            "longitude": CENTER[1] + rng.uniform(-0.05, 0.05),
+            "description": " ".join(rng.choice(WORDS) for _ in range(20)),
+            "address": f"Street {i}",
+            "picture": f"https://foodsharing.de/images/fp/{i}.jpg",
+            "latest_post": {"id": i, "body": "Frisches Brot", "time": "2026-01-01", "user_name": "A"},
+        }
+        for i in range(count)
+    ]
+
+
+def _pickups(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    now = int(time.time())
+    return [
+        {
+            "id": i,
+            "time": now + rng.randint(-30 * 86400, 30 * 86400),
+            "store_name": f"Store {i}",
+            "description": "Pickup",
+            "location": f"Street {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def _make_entry() -> MagicMock:
+    entry = MagicMock()
+    entry.entry_id = ENTRY_ID
+    entry.data = {
+        CONF_LOCATIONS: [{"latitude": CENTER[0], "longitude": CENTER[1], "distance": 7}],
+        CONF_KEYWORDS: "brot, käse",
+    }
+    entry.options = {}
+    return entry
+
+
+def _make_coordinator(entry: MagicMock) -> FoodsharingCoordinator:
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), EMAIL, "pw")
+    # Detail prefetches are background requests, not part of the parsing cost
+    coordinator._prefetch_details = lambda baskets: None
+    coordinator.add_entry(entry)
+    return coordinator
+
+
+def _coordinator_data(size: int, rng: random.Random, coordinator: FoodsharingCoordinator) -> dict[str, Any]:
+    baskets = coordinator._process_baskets_for_location(ENTRY_ID, _raw_baskets(size, rng))
+    return {
+        "account": {"pickups": _pickups(size, rng), "own_baskets": [{"id": i} for i in range(min(size, 50))]},
+        "locations": {ENTRY_ID: [{"baskets": baskets, "fairteiler": _raw_fairteiler(size, rng)}]},
+    }
+
+
+def _capture_listener(module: Any, coordinator: MagicMock, entry: MagicMock) -> Callable[[], None]:
+    """Run a platform setup and return the listener it registers on the coordinator."""
+    hass = MagicMock()
+    hass.data = {DOMAIN: {ENTRY_ID: {"coordinator": coordinator, "email": EMAIL}}}
+    hass.async_create_task = lambda coro: coro.close()
+    listeners: list[Callable[[], None]] = []
+    coordinator.async_add_listener = lambda cb, *args: listeners.append(cb) or (lambda: None)
+    with patch.object(module.er, "async_get", return_value=MagicMock()):
+        asyncio.run(module.async_setup_entry(hass, entry, lambda entities: None))
+    return listeners[0]
+
+
+def build_cases(size: int) -> dict[str, Callable[[], Any]]:
+    """Return the benchmark callables for one data size."""
+    rng = random.Random(size)
+    entry = _make_entry()
+    coordinator = _make_coordinator(entry)
+    coordinator._is_first_update = True
+    raw = _raw_baskets(size, rng)
+
+    account_results: dict[str, Any] = {
+        "messages": 3,
+        "bells": ValueError("boom"),
+        "pickups": _pickups(size, rng),
+        "own_baskets": [{"id": i} for i in range(size)],
+        "global_stats": {"fetchWeight": 1},
+        "user_stats": None,
+        "profile": {"regionId": 1},
+        "bananas": {},
+        "buddies": [{"id": i} for i in range(size)],
+        "region_stats": {},
+    }
+
+    entity_coordinator = MagicMock()
+    entity_coordinator.email = EMAIL
+    entity_coordinator.entries = {ENTRY_ID: entry}
+    entity_coordinator.data = _coordinator_data(size, rng, coordinator)
+    entity_coordinator.pickup_history = coordinator.pickup_history
+    entity_coordinator.freshness = coordinator.freshness
+    for part in ("baskets", "fairteiler"):
+        coordinator.freshness.record((ENTRY_ID, 0, part), dt_util.utcnow())
+    entity_coordinator.stale = set()
+    coordinator.pickup_history._store = MagicMock()
+    coordinator.pickup_history.async_merge(entity_coordinator.data["account"]["pickups"])
+
+    geo_listener = _capture_listener(geo_location, entity_coordinator, entry)
+    button.ACTIVE_BUTTONS.clear()
+    button_listener = _capture_listener(button, entity_coordinator, entry)
+
+    sensor = FoodsharingSensor(entity_coordinator, entry, loc_idx=0, lat=CENTER[0], lon=CENTER[1])
+    calendar = FoodsharingCalendar(entity_coordinator, EMAIL)
+
+    def calendar_process_events() -> None:
+        # A changed history revision makes every call rebuild the event index
+        coordinator.pickup_history.revision += 1
+        calendar._process_events()
+
+    return {
+        "process_baskets_for_location": lambda: coordinator._process_baskets_for_location(ENTRY_ID, raw),
+        "normalize_account_results": lambda: coordinator._normalize_account_results(account_results),
+        "geo_location_update_entities": geo_listener,
+        "button_reconciliation": button_listener,
+        "sensor_attributes_serialization": lambda: json_bytes(sensor.extra_state_attributes),
+        "calendar_process_events": calendar_process_events,
+    }
+
+
+def _time_call(func: Callable[[], Any], repeat: int) -> float:
+    """Return the median seconds per call."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return statistics.median(t / number for t in timer.repeat(repeat=repeat, number=number))
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Time a fixed pure-Python workload used to normalise results across machines."""
+
+    def workload() -> None:
+        data = {str(i): i * 2 for i in range(2000)}
+        sorted(data.items(), key=lambda kv: kv[1], reverse=True)
+
+    return _time_call(workload, repeat)
+
+
+def run(sizes: tuple[int, ...], repeat: int) -> dict[str, Any]:
+    """Run all cases and return the results keyed by ``case[size]``."""
+    results: dict[str, float] = {}
+    for size in sizes:
+        for name, func in build_cases(size).items():
+            key = name if name in UNSIZED_CASES else f"{name}[{size}]"
+            if key in results:
+                continue
+            results[key] = _time_call(func, repeat)
+            print(f"{key:<45} {results[key] * 1e6:>12.1f} µs")
+    return {"calibration": calibrate(), "results": results}
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return the cases that regressed by more than ``threshold`` against the baseline."""
+    scale = current["calibration"] / baseline["calibration"]
+    regressions = []
+    for key, seconds in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        ratio = seconds / (base * scale)
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{key:<45} {ratio:>6.2f}x baseline {marker}")
+        if marker:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--update", action="store_true", help="write results to baselines.json")
+    args = parser.parse_args(argv)
+
+    sizes = tuple(int(s) for s in args.sizes.split(","))
+    current = run(sizes, args.repeat)
+
+    if args.update:
+        baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {"results": {}}
+        baseline["calibration"] = current["calibration"]
+        baseline["results"].update(current["results"])
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baselines written to {BASELINE_FILE}")
+        return 0
+
+    if not BASELINE_FILE.exists():
+        print("No baselines recorded yet, run with --update first.")
+        return 0
+
+    regressions = compare(current, json.loads(BASELINE_FILE.read_text()), args.threshold)
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,15 @@
 import logging
 from typing import Any
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 
+from .coalesce import Coalescer
 from .const import (
     CONF_DISTANCE,
     CONF_EMAIL,
@@ -19,6 +23,9 @@ from .const import (
 )
 from .coordinator import FoodsharingCoordinator
 from .helpers import mask_email
+from .metadata import MetadataCache
+from .search import MESSAGE, WALL_POST, SearchIndex
+from .spatial import BASKET, FAIRTEILER, SpatialIndex, coordinates
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,19 +37,62 @@ PLATFORMS = [
     Platform.BINARY_SENSOR,
 ]
 
+# Results of find_nearby without radius or limit
+DEFAULT_NEARBY_LIMIT = 10
+
+FIND_NEARBY_SCHEMA = vol.Schema(
+    {
+        vol.Optional("latitude"): cv.latitude,
+        vol.Optional("longitude"): cv.longitude,
+        vol.Optional("radius"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("bounding_box"): vol.All([vol.Coerce(float)], vol.Length(min=4, max=4)),
+        vol.Optional("type", default="all"): vol.In(["all", BASKET, FAIRTEILER]),
+    }
+)
+
+# Search radius around an entity without a radius attribute, in meters
+DEFAULT_SEARCH_RADIUS = 2000
+
+SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("query"): cv.string,
+        vol.Optional("type", default="all"): vol.In(["all", BASKET, WALL_POST, MESSAGE]),
+        vol.Optional("near"): cv.entity_id,
+        vol.Optional("radius"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("limit", default=10): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Foodsharing from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault("accounts", {})
+    # Answers that are the same for every account, fetched once per instance
+    shared = hass.data[DOMAIN].setdefault("shared", Coalescer())
+    # Every basket and Fairteiler any account knows, by position
+    spatial = hass.data[DOMAIN].setdefault("spatial", SpatialIndex())
+    search = hass.data[DOMAIN].setdefault("search", SearchIndex())
+    offline_accounts = hass.data[DOMAIN].setdefault("offline_accounts", set())
+    if "metadata" not in hass.data[DOMAIN]:
+        hass.data[DOMAIN]["metadata"] = MetadataCache(hass)
+        await hass.data[DOMAIN]["metadata"].async_load()
 
     email = entry.data[CONF_EMAIL]
     password = entry.data[CONF_PASSWORD]
 
     is_new_coordinator = email not in hass.data[DOMAIN]["accounts"]
     if is_new_coordinator:
-        coordinator = FoodsharingCoordinator(hass, email, password)
+        coordinator = FoodsharingCoordinator(
+            hass, email, password, shared, hass.data[DOMAIN]["metadata"], spatial, search, offline_accounts
+        )
         await coordinator.async_load_session()
+        await coordinator.pickup_history.async_load()
+        await coordinator.activity.async_load()
+        await coordinator.budget.async_load()
+        await coordinator.retry.async_load()
         hass.data[DOMAIN]["accounts"][email] = coordinator
     else:
         coordinator = hass.data[DOMAIN]["accounts"][email]
@@ -184,6 +234,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         hass.services.async_register(DOMAIN, "close_basket", handle_close_basket)
 
+    if not hass.services.has_service(DOMAIN, "find_nearby"):
+
+        async def handle_find_nearby(call: ServiceCall) -> ServiceResponse:
+            """Answer a radius, nearest or bounding box query from the known baskets and Fairteiler."""
+            index: SpatialIndex = hass.data[DOMAIN]["spatial"]
+            lat = call.data.get("latitude", hass.config.latitude)
+            lon = call.data.get("longitude", hass.config.longitude)
+            kinds = None if call.data["type"] == "all" else {call.data["type"]}
+            limit = call.data.get("limit")
+
+            if (box := call.data.get("bounding_box")) is not None:
+                results = index.in_box(*box, kinds, center=(lat, lon))
+            elif (radius := call.data.get("radius")) is not None:
+                results = index.within(lat, lon, radius, kinds)
+            else:
+                results = index.nearest(lat, lon, limit or DEFAULT_NEARBY_LIMIT, kinds)
+            return {"results": results[:limit] if limit else results}
+
+        hass.services.async_register(
+            DOMAIN,
+            "find_nearby",
+            handle_find_nearby,
+            schema=FIND_NEARBY_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    if not hass.services.has_service(DOMAIN, "search"):
+
+        async def handle_search(call: ServiceCall) -> ServiceResponse:
+            """Search the known baskets, wall posts and messages."""
+            index: SearchIndex = hass.data[DOMAIN]["search"]
+            kinds = None if call.data["type"] == "all" else {call.data["type"]}
+            near = None
+            if (entity_id := call.data.get("near")) is not None:
+                state = hass.states.get(entity_id)
+                if state is None or (position := coordinates(state.attributes)) is None:
+                    raise ServiceValidationError(f"{entity_id} has no location")
+                radius = call.data.get("radius", state.attributes.get("radius", DEFAULT_SEARCH_RADIUS))
+                near = (*position, float(radius))
+
+            results = index.search(call.data["query"], kinds, near)
+            offset = call.data["offset"]
+            return {"total": len(results), "results": results[offset : offset + call.data["limit"]]}
+
+        hass.services.async_register(
+            DOMAIN,
+            "search",
+            handle_search,
+            schema=SEARCH_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
     # Registers update listener to update config entry when options are updated.
     unsub_options_update_listener = entry.add_update_listener(options_update_listener)
     hass.data[DOMAIN][entry.entry_id]["unsub_options_update_listener"] = unsub_options_update_listener
@@ -217,6 +319,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # If no more entries for this account, remove coordinator and sentinels
         if not coordinator.entries:
+            await coordinator.async_shutdown()
             hass.data[DOMAIN]["accounts"].pop(email)
             hass.data[DOMAIN].pop(f"account_sensors_{email}", None)
             hass.data[DOMAIN].pop(f"calendars_{email}", None)
@@ -0,0 +1,101 @@
+"""Circuit breakers isolating failing Foodsharing locations and endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+# Consecutive failures that open a closed circuit
+FAILURE_THRESHOLD = 3
+# Cooldown after the first trip, doubled with every failed trial
+BASE_COOLDOWN = timedelta(minutes=5)
+MAX_COOLDOWN = timedelta(hours=6)
+# A trial whose outcome was never recorded, e.g. a cancelled one, no longer blocks after this
+TRIAL_TIMEOUT = timedelta(minutes=2)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(Exception):
+    """Raised instead of sending a request whose circuit is open."""
+
+
+@dataclass
+class Circuit:
+    """Failure state of one location or endpoint."""
+
+    failures: int = 0
+    trips: int = 0
+    open_until: datetime | None = None
+    trial_since: datetime | None = None
+
+    def state(self, now: datetime) -> str:
+        """Return closed, open, or half-open once the cooldown is over and a trial may pass."""
+        if self.open_until is None:
+            return CLOSED
+        return OPEN if now < self.open_until else HALF_OPEN
+
+
+class CircuitBreaker:
+    """Stop calling what keeps failing, and try again after an exponential cooldown.
+
+    A circuit opens after a few consecutive failures. Once its cooldown is over
+    it is half-open: the next call goes through as a trial while others are
+    still refused, and its outcome closes the circuit or opens it again for
+    twice as long. Healthy keys are not stored.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the breaker."""
+        self._circuits: dict[Hashable, Circuit] = {}
+
+    def allow(self, key: Hashable, now: datetime) -> bool:
+        """Return whether a call may go through."""
+        circuit = self._circuits.get(key)
+        if circuit is None or circuit.state(now) == CLOSED:
+            return True
+        if circuit.state(now) == OPEN:
+            return False
+        if circuit.trial_since is not None and now - circuit.trial_since < TRIAL_TIMEOUT:
+            return False
+        circuit.trial_since = now
+        return True
+
+    def record(self, key: Hashable, success: bool, now: datetime) -> str | None:
+        """Record the outcome of a call. Return the new state if the circuit opened or closed."""
+        circuit = self._circuits.get(key)
+        if success:
+            if circuit is None:
+                return None
+            del self._circuits[key]
+            return CLOSED if circuit.open_until is not None else None
+
+        if circuit is None:
+            circuit = self._circuits[key] = Circuit()
+        circuit.failures += 1
+        state = circuit.state(now)
+        if state == OPEN or (state == CLOSED and circuit.failures < FAILURE_THRESHOLD):
+            return None
+        circuit.trips += 1
+        circuit.trial_since = None
+        circuit.open_until = now + min(BASE_COOLDOWN * 2 ** (circuit.trips - 1), MAX_COOLDOWN)
+        return OPEN
+
+    def prune(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Forget the circuits whose key matches."""
+        self._circuits = {key: c for key, c in self._circuits.items() if not predicate(key)}
+
+    def as_dict(self, now: datetime) -> dict[str, Any]:
+        """Return the circuits that are not healthy for diagnostics."""
+        return {
+            "_".join(map(str, key)) if isinstance(key, tuple) else str(key): {
+                "state": circuit.state(now),
+                "failures": circuit.failures,
+                "open_until": circuit.open_until.isoformat() if circuit.open_until else None,
+            }
+            for key, circuit in self._circuits.items()
+        }
@@ -0,0 +1,163 @@
+"""Daily request budget for the Foodsharing coordinator."""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import Counter
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 300
+
+KIND_ACCOUNT = "account"
+KIND_LOCATION = "location"
+KIND_WALLS = "walls"
+# Basket detail prefetches count against the budget but are no location polls
+KIND_DETAILS = "details"
+# Session checks and logins, spent on behalf of the account polls
+KIND_LOGIN = "login"
+
+# Requests per poll: messages, bells, pickups and own baskets / baskets and Fairteiler
+ACCOUNT_COST = 4
+LOCATION_COST = 2
+
+ACCOUNT_WEIGHT = 1.0
+WALL_WEIGHT = 0.5
+# Extra weight per recent keyword match and per new basket per hour
+MATCH_WEIGHT = 2.0
+TURNOVER_WEIGHT = 0.5
+# Weight factor for slices whose entities are all disabled
+DISABLED_FACTOR = 0.1
+
+MATCH_HALF_LIFE = timedelta(days=1)
+
+
+@dataclass(slots=True)
+class Consumer:
+    """A part of the update cycle that spends requests."""
+
+    key: Hashable
+    cost: float
+    weight: float
+
+
+class RequestBudget:
+    """Count requests per local day and divide a daily budget among consumers.
+
+    Each consumer gets a share of the remaining requests for today in proportion
+    to its weight, which translates into a minimum polling interval.
+    """
+
+    def __init__(self, hass: HomeAssistant, email: str) -> None:
+        """Initialize the budget."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}_budget_{email.replace('@', '_').replace('.', '_')}",
+        )
+        self.daily_budget = 0
+        self.used: Counter[str] = Counter()
+        self.polls: Counter[str] = Counter()
+        self._day = dt_util.start_of_local_day()
+        self._match_scores: dict[Hashable, tuple[float, datetime]] = {}
+        self.planned_intervals: dict[Hashable, float] = {}
+
+    async def async_load(self) -> None:
+        """Load today's usage from storage."""
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Could not load request budget: %s", e)
+            return
+        if not isinstance(data, dict):
+            return
+
+        day = dt_util.parse_datetime(data.get("day", ""))
+        if day is not None and day == self._day:
+            self.used.update({str(k): int(v) for k, v in data.get("used", {}).items()})
+            self.polls.update({str(k): int(v) for k, v in data.get("polls", {}).items()})
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"day": self._day.isoformat(), "used": dict(self.used), "polls": dict(self.polls)}
+
+    def _roll_over(self) -> None:
+        day = dt_util.start_of_local_day()
+        if day != self._day:
+            self._day = day
+            self.used.clear()
+            self.polls.clear()
+
+    @callback
+    def async_record(self, kind: str, count: int = 1) -> None:
+        """Count requests against today's budget."""
+        self._roll_over()
+        self.used[kind] += count
+
+    @callback
+    def async_record_poll(self, kind: str) -> None:
+        """Count a completed poll, used to learn the requests per poll."""
+        self._roll_over()
+        self.polls[kind] += 1
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def cost(self, kind: str, default: float, *overhead: str) -> float:
+        """Return the average requests per poll of a kind today, or the default.
+
+        Requests of the overhead kinds are made because of these polls, e.g.
+        detail prefetches for new baskets, and are added to their cost.
+        """
+        if not self.polls[kind]:
+            return default
+        return max(sum(self.used[k] for k in (kind, *overhead)) / self.polls[kind], 1.0)
+
+    @property
+    def used_today(self) -> int:
+        """Return the number of requests made today."""
+        self._roll_over()
+        return sum(self.used.values())
+
+    @property
+    def remaining(self) -> int | None:
+        """Return the requests left today, or None without a budget."""
+        if not self.daily_budget:
+            return None
+        return max(self.daily_budget - self.used_today, 0)
+
+    def note_matches(self, key: Hashable, matches: int, now: datetime) -> None:
+        """Add keyword matches seen for a consumer to its decaying score."""
+        self._match_scores[key] = (self.match_score(key, now) + matches, now)
+
+    def match_score(self, key: Hashable, now: datetime) -> float:
+        """Return the recent keyword matches of a consumer, halving every day."""
+        score, since = self._match_scores.get(key, (0.0, now))
+        return score * math.pow(0.5, (now - since) / MATCH_HALF_LIFE)
+
+    def plan(self, consumers: list[Consumer], now: datetime) -> dict[Hashable, float]:
+        """Return the minimum polling interval in minutes per consumer key."""
+        if not self.daily_budget or not consumers:
+            self.planned_intervals = {}
+            return self.planned_intervals
+
+        remaining = self.remaining or 0
+        minutes_left = max((dt_util.start_of_local_day() + timedelta(days=1) - now).total_seconds() / 60, 1.0)
+        if remaining <= 0:
+            # Budget spent, wait for tomorrow
+            self.planned_intervals = {c.key: minutes_left for c in consumers}
+            return self.planned_intervals
+
+        rate = remaining / minutes_left
+        total_weight = sum(c.weight for c in consumers)
+        self.planned_intervals = {c.key: c.cost * total_weight / (rate * c.weight) for c in consumers}
+        return self.planned_intervals
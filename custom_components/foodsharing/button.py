@@ -100,7 +100,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_update_entities()
 
     # Register listener
-    unsub = coordinator.async_add_listener(async_update_entities)
+    unsub = coordinator.async_add_listener(async_update_entities, entry.entry_id)
     entry.async_on_unload(unsub)
 
     # Ensure cleanup on unload from the global registry if this was the last entry
@@ -129,7 +129,7 @@ class FoodsharingRequestSlotButton(CoordinatorEntity[FoodsharingCoordinator], Bu
         slot_idx: int,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(entry.entry_id, loc_idx))
         self.entry = entry
         self._loc_idx = loc_idx
         self._lat = lat
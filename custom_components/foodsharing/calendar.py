@@ -1,13 +1,15 @@
 """Calendar platform for Foodsharing integration."""
 
 import logging
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, timedelta
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
@@ -29,7 +31,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 
 class FoodsharingCalendar(CoordinatorEntity[FoodsharingCoordinator], CalendarEntity):  # type: ignore[misc]
-    """A calendar entity for foodsharing pickups."""
+    """A calendar entity for foodsharing pickups, backed by the persistent pickup history."""
 
     def __init__(self, coordinator: FoodsharingCoordinator, email: str) -> None:
         """Initialize the calendar."""
@@ -38,7 +40,13 @@ class FoodsharingCalendar(CoordinatorEntity[FoodsharingCoordinator], CalendarEnt
 
         self.translation_key = "pickups"
         self._attr_unique_id = f"foodsharing_calendar_{email}"
+        # Events sorted by start, with a parallel list of start times for bisect
         self._events: list[CalendarEvent] = []
+        self._starts: list[datetime] = []
+        self._max_duration = timedelta(0)
+        self._history_revision: int | None = None
+        self._next_event: CalendarEvent | None = None
+        self._unsub_next_event: CALLBACK_TYPE | None = None
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, email)},
@@ -50,39 +58,69 @@ class FoodsharingCalendar(CoordinatorEntity[FoodsharingCoordinator], CalendarEnt
         self._process_events()
 
     def _process_events(self) -> None:
-        """Process the events from the coordinator data."""
-        self._events = []
-        if self.coordinator.data is None:
+        """Rebuild the event index if the pickup history changed since the last update."""
+        history = self.coordinator.pickup_history
+        if history.revision == self._history_revision:
             return
+        self._history_revision = history.revision
+
+        events: list[CalendarEvent] = []
+        for record in history.all():
+            start_ts = record["start"]
+            events.append(
+                CalendarEvent(
+                    start=dt_util.as_local(dt_util.utc_from_timestamp(start_ts)),
+                    end=dt_util.as_local(dt_util.utc_from_timestamp(start_ts + 3600.0)),
+                    summary=f"Pickup: {record.get('store_name') or 'Unknown'}",
+                    description=record.get("description", ""),
+                    location=record.get("location", ""),
+                )
+            )
 
-        account_data = self.coordinator.data.get("account", {})
-        pickups = account_data.get("pickups", [])
-        if not isinstance(pickups, list):
-            return
+        # History records are already sorted by start
+        self._events = events
+        self._starts = [e.start for e in events]
+        self._max_duration = max((e.end - e.start for e in events), default=timedelta(0))
+        self._refresh_next_event()
 
-        for pickup in pickups:
-            start_ts = pickup.get("time")
-            if start_ts is None:
-                start_ts = pickup.get("date")
-
-            if start_ts is None:
-                continue
-
-            try:
-                ts_val = float(start_ts)
-                start_dt = dt_util.as_local(dt_util.utc_from_timestamp(ts_val))
-                end_dt = dt_util.as_local(dt_util.utc_from_timestamp(ts_val + 3600.0))
-
-                event = CalendarEvent(
-                    start=start_dt,
-                    end=end_dt,
-                    summary=f"Pickup: {pickup.get('store_name', 'Unknown')}",
-                    description=pickup.get("description", ""),
-                    location=pickup.get("location", ""),
-                )
-                self._events.append(event)
-            except (ValueError, TypeError) as e:
-                _LOGGER.warning("Could not parse pickup time: %s", e)
+    def _refresh_next_event(self) -> None:
+        """Recompute the next upcoming event and schedule a refresh for when it ends."""
+        if self._unsub_next_event is not None:
+            self._unsub_next_event()
+            self._unsub_next_event = None
+
+        self._next_event = None
+        now = dt_util.now()
+        # Only events starting after (now - longest duration) can still be running
+        for idx in range(bisect_left(self._starts, now - self._max_duration), len(self._events)):
+            if self._events[idx].end > now:
+                self._next_event = self._events[idx]
+                break
+
+        # The next event can only change when it ends or when the pickups change
+        if self._next_event is not None and self.hass is not None:
+            self._unsub_next_event = async_track_point_in_time(
+                self.hass, self._async_next_event_ended, self._next_event.end
+            )
+
+    @callback
+    def _async_next_event_ended(self, _now: datetime) -> None:
+        """Advance to the following event once the current one has ended."""
+        self._unsub_next_event = None
+        self._refresh_next_event()
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Schedule the next-event refresh once the entity has a hass instance."""
+        await super().async_added_to_hass()
+        self._refresh_next_event()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending next-event refresh."""
+        if self._unsub_next_event is not None:
+            self._unsub_next_event()
+            self._unsub_next_event = None
+        await super().async_will_remove_from_hass()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -92,20 +130,14 @@ class FoodsharingCalendar(CoordinatorEntity[FoodsharingCoordinator], CalendarEnt
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        if not self._events:
-            return None
-
-        now = dt_util.now()
-
-        upcoming_events = [e for e in self._events if e.end > now]
-        if not upcoming_events:
-            return None
-
-        upcoming_events.sort(key=lambda x: x.start)
-        return upcoming_events[0]
+        if self._next_event is not None and self._next_event.end <= dt_util.now():
+            self._refresh_next_event()
+        return self._next_event
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
-        return [event for event in self._events if event.end > start_date and event.start < end_date]
+        lo = bisect_left(self._starts, start_date - self._max_duration)
+        hi = bisect_left(self._starts, end_date)
+        return [event for event in self._events[lo:hi] if event.end > start_date]
@@ -0,0 +1,66 @@
+"""Single-flight coalescing of identical Foodsharing GET requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any
+
+# Successful answers are reused this long after they arrived by default, in seconds
+MEMO_WINDOW = 2.0
+
+
+class Coalescer:
+    """Share one in-flight request between identical callers.
+
+    A caller asking for a key that is already being fetched awaits the same
+    result instead of sending a duplicate, and results stay memoized for a
+    moment after completion, or for the given TTL. The request runs in its own
+    task, so a cancelled caller does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        # Memoized results with the monotonic time they expire at
+        self._memo: dict[Hashable, tuple[float, Any]] = {}
+        self.coalesced = 0
+
+    async def run(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        memoize: Callable[[Any], bool] = lambda result: True,
+        ttl: float = MEMO_WINDOW,
+    ) -> Any:
+        """Return the result of func, shared with identical in-flight or recently finished calls."""
+        memo = self._memo.get(key)
+        if memo is not None:
+            if time.monotonic() < memo[0]:
+                self.coalesced += 1
+                return memo[1]
+            del self._memo[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._done, key, memoize, ttl))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, memoize: Callable[[Any], bool], ttl: float, task: asyncio.Task[Any]) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        now = time.monotonic()
+        self._memo = {k: memo for k, memo in self._memo.items() if now < memo[0]}
+        if memoize(task.result()):
+            self._memo[key] = (now + ttl, task.result())
+
+    def clear(self) -> None:
+        """Forget memoized results, e.g. after the session changed."""
+        self._memo.clear()
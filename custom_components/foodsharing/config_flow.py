@@ -10,18 +10,40 @@ from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
+    CONF_ACTIVE_ENTITIES,
+    CONF_ACTIVE_HOURS_END,
+    CONF_ACTIVE_HOURS_START,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BACKGROUND_SCAN_INTERVAL,
+    CONF_CREATORS_ALLOWED,
+    CONF_CREATORS_DENIED,
+    CONF_DAILY_REQUEST_BUDGET,
     CONF_DISTANCE,
     CONF_DOMAIN,
     CONF_EMAIL,
+    CONF_EXCLUDE_KEYWORDS,
+    CONF_FOLLOW_DWELL,
+    CONF_FOLLOW_ENTITY,
+    CONF_FOLLOW_THRESHOLD,
+    CONF_HEDGE_REQUESTS,
     CONF_KEYWORDS,
     CONF_LATITUDE_FS,
     CONF_LOCATION,
     CONF_LOCATIONS,
     CONF_LONGITUDE_FS,
+    CONF_MAX_BASKET_DISTANCE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_TIME_LEFT,
+    CONF_ONLY_KEYWORD_MATCHES,
     CONF_PASSWORD,
+    CONF_REQUIRE_PICTURE,
     CONF_SCAN_INTERVAL,
     CONF_TOTP,
     CONF_USE_BETA_API,
+    DEFAULT_BACKGROUND_SCAN_INTERVAL,
+    DEFAULT_FOLLOW_DWELL,
+    DEFAULT_FOLLOW_THRESHOLD,
+    DEFAULT_MAX_SCAN_INTERVAL,
     DOMAIN,
 )
 from .helpers import mask_email
@@ -543,6 +565,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):  # type: ignore[misc]
                     },
                 ): selector.LocationSelector(selector.LocationSelectorConfig(radius=True)),
                 vol.Optional(CONF_KEYWORDS, default=options.get(CONF_KEYWORDS, "")): str,
+                vol.Optional(CONF_ONLY_KEYWORD_MATCHES, default=options.get(CONF_ONLY_KEYWORD_MATCHES, False)): bool,
+                vol.Optional(CONF_EXCLUDE_KEYWORDS, default=options.get(CONF_EXCLUDE_KEYWORDS, "")): str,
+                vol.Optional(
+                    CONF_MAX_BASKET_DISTANCE, default=options.get(CONF_MAX_BASKET_DISTANCE, 0)
+                ): cv.positive_float,
+                vol.Optional(CONF_MIN_TIME_LEFT, default=options.get(CONF_MIN_TIME_LEFT, 0)): cv.positive_int,
+                vol.Optional(CONF_REQUIRE_PICTURE, default=options.get(CONF_REQUIRE_PICTURE, False)): bool,
+                vol.Optional(CONF_CREATORS_ALLOWED, default=options.get(CONF_CREATORS_ALLOWED, "")): str,
+                vol.Optional(CONF_CREATORS_DENIED, default=options.get(CONF_CREATORS_DENIED, "")): str,
                 vol.Required(CONF_SCAN_INTERVAL, default=options.get(CONF_SCAN_INTERVAL, 2)): cv.positive_int,
                 vol.Required(CONF_DOMAIN, default=options.get(CONF_DOMAIN, "foodsharing_de")): selector.SelectSelector(
                     selector.SelectSelectorConfig(
@@ -556,6 +587,46 @@ class OptionsFlowHandler(config_entries.OptionsFlow):  # type: ignore[misc]
                     )
                 ),
                 vol.Optional(CONF_USE_BETA_API, default=options.get(CONF_USE_BETA_API, False)): bool,
+                vol.Optional(CONF_ADAPTIVE_POLLING, default=options.get(CONF_ADAPTIVE_POLLING, False)): bool,
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_ACTIVE_HOURS_START,
+                    description={"suggested_value": options.get(CONF_ACTIVE_HOURS_START)},
+                ): selector.TimeSelector(),
+                vol.Optional(
+                    CONF_ACTIVE_HOURS_END,
+                    description={"suggested_value": options.get(CONF_ACTIVE_HOURS_END)},
+                ): selector.TimeSelector(),
+                vol.Optional(
+                    CONF_ACTIVE_ENTITIES,
+                    description={"suggested_value": options.get(CONF_ACTIVE_ENTITIES, [])},
+                ): selector.EntitySelector(
+                    selector.EntitySelectorConfig(domain=["person", "input_boolean"], multiple=True)
+                ),
+                vol.Optional(
+                    CONF_BACKGROUND_SCAN_INTERVAL,
+                    default=options.get(CONF_BACKGROUND_SCAN_INTERVAL, DEFAULT_BACKGROUND_SCAN_INTERVAL),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_DAILY_REQUEST_BUDGET,
+                    default=options.get(CONF_DAILY_REQUEST_BUDGET, 0),
+                ): cv.positive_int,
+                vol.Optional(CONF_HEDGE_REQUESTS, default=options.get(CONF_HEDGE_REQUESTS, False)): bool,
+                vol.Optional(
+                    CONF_FOLLOW_ENTITY,
+                    description={"suggested_value": options.get(CONF_FOLLOW_ENTITY)},
+                ): selector.EntitySelector(selector.EntitySelectorConfig(domain=["person", "device_tracker"])),
+                vol.Optional(
+                    CONF_FOLLOW_THRESHOLD,
+                    default=options.get(CONF_FOLLOW_THRESHOLD, DEFAULT_FOLLOW_THRESHOLD),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_FOLLOW_DWELL,
+                    default=options.get(CONF_FOLLOW_DWELL, DEFAULT_FOLLOW_DWELL),
+                ): cv.positive_int,
             }
         )
 
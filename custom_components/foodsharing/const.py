@@ -14,3 +14,26 @@ CONF_KEYWORDS = "keywords"
 CONF_USE_BETA_API = "use_beta_api"
 CONF_LOCATIONS = "locations"
 CONF_DOMAIN = "domain"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_ACTIVE_HOURS_START = "active_hours_start"
+CONF_ACTIVE_HOURS_END = "active_hours_end"
+CONF_ACTIVE_ENTITIES = "active_entities"
+CONF_BACKGROUND_SCAN_INTERVAL = "background_scan_interval"
+CONF_DAILY_REQUEST_BUDGET = "daily_request_budget"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+CONF_EXCLUDE_KEYWORDS = "exclude_keywords"
+CONF_ONLY_KEYWORD_MATCHES = "only_keyword_matches"
+CONF_MAX_BASKET_DISTANCE = "max_basket_distance"
+CONF_MIN_TIME_LEFT = "min_time_left"
+CONF_REQUIRE_PICTURE = "require_picture"
+CONF_CREATORS_ALLOWED = "creators_allowed"
+CONF_CREATORS_DENIED = "creators_denied"
+CONF_FOLLOW_ENTITY = "follow_entity"
+CONF_FOLLOW_THRESHOLD = "follow_threshold"
+CONF_FOLLOW_DWELL = "follow_dwell"
+
+DEFAULT_MAX_SCAN_INTERVAL = 30
+DEFAULT_BACKGROUND_SCAN_INTERVAL = 30
+DEFAULT_FOLLOW_THRESHOLD = 500
+DEFAULT_FOLLOW_DWELL = 2
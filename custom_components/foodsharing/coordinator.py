@@ -2,47 +2,169 @@ import asyncio
 import json
 import logging
 import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import Any
 
 import aiohttp
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_state_change_event,
+    async_track_time_change,
+)
 from homeassistant.helpers.issue_registry import (
     IssueSeverity,
     async_create_issue,
     async_delete_issue,
 )
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
+from homeassistant.util import dt as dt_util
+
+from .breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpen
+from .budget import (
+    ACCOUNT_COST,
+    ACCOUNT_WEIGHT,
+    DISABLED_FACTOR,
+    KIND_ACCOUNT,
+    KIND_DETAILS,
+    KIND_LOCATION,
+    KIND_LOGIN,
+    KIND_WALLS,
+    LOCATION_COST,
+    MATCH_WEIGHT,
+    TURNOVER_WEIGHT,
+    WALL_WEIGHT,
+    Consumer,
+    RequestBudget,
+)
+from .coalesce import Coalescer
 from .const import (
+    CONF_ACTIVE_ENTITIES,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BACKGROUND_SCAN_INTERVAL,
+    CONF_DAILY_REQUEST_BUDGET,
     CONF_DOMAIN,
-    CONF_KEYWORDS,
+    CONF_FOLLOW_DWELL,
+    CONF_FOLLOW_ENTITY,
+    CONF_FOLLOW_THRESHOLD,
+    CONF_HEDGE_REQUESTS,
+    CONF_MAX_SCAN_INTERVAL,
     CONF_SCAN_INTERVAL,
     CONF_USE_BETA_API,
+    DEFAULT_BACKGROUND_SCAN_INTERVAL,
+    DEFAULT_FOLLOW_DWELL,
+    DEFAULT_FOLLOW_THRESHOLD,
+    DEFAULT_MAX_SCAN_INTERVAL,
     DOMAIN,
 )
+from .details import PREFETCH_CONCURRENCY, BasketDetails, parse_details
+from .filters import BasketFilter
+from .follow import FollowLocation
+from .freshness import MAX_AGE, STATS_MAX_AGE, Freshness
 from .helpers import get_locations_from_entry, mask_email
+from .latency import LatencyTracker
+from .metadata import MetadataCache
+from .payload import BufferedResponse, read_body
+from .pickup_history import PickupHistory
+from .retry import (
+    MAX_ATTEMPTS,
+    MAX_INLINE_DELAY,
+    RETRY_STATUSES,
+    RateLimited,
+    RetryPolicy,
+    backoff_delay,
+    parse_retry_after,
+)
+from .scheduler import (
+    ActivityModel,
+    location_key,
+    next_due,
+    phase_offset,
+    profile_active,
+    profile_times,
+)
+from .search import SearchIndex, conversation_documents, slice_documents
+from .spatial import SpatialIndex
+from .taskgraph import TaskGraph
 
 _LOGGER = logging.getLogger(__name__)
 
+# Slices due within this window are fetched together in one tick
+DUE_TOLERANCE = timedelta(seconds=15)
+MIN_TICK = timedelta(seconds=30)
+# Results arriving later are published by an incremental update
+CYCLE_DEADLINE = timedelta(seconds=10)
+# How long answers that are the same for every account are shared between them
+STATISTICS_TTL = timedelta(hours=12)
+NEARBY_TTL = timedelta(minutes=1)
+# Consecutive cycles answered only with 503 before the API counts as offline
+OFFLINE_CYCLES = 3
+
+ACCOUNT_KEYS = ("messages", "bells", "pickups", "own_baskets")
+STATS_KEYS = ("global_stats", "user_stats", "profile", "bananas", "buddies", "region_stats")
+LOCATION_PARTS = ("baskets", "fairteiler")
+
+# Endpoints whose requests failed within the fetch running in the current task
+_failed_endpoints: ContextVar[set[str] | None] = ContextVar(f"{DOMAIN}_failed_endpoints", default=None)
+
+
+def _answered(status: int) -> bool:
+    """Return whether an HTTP status is a usable answer; 401/403/404 are handled by the fetches."""
+    return status < 400 or status in (401, 403, 404)
+
+
+def _note_failed(endpoint: str) -> None:
+    failed = _failed_endpoints.get()
+    if failed is not None:
+        failed.add(endpoint)
+
+
+def _clear_failed(endpoint: str) -> None:
+    """Forget earlier failures of an endpoint before retrying it, so only the retry counts."""
+    failed = _failed_endpoints.get()
+    if failed is not None:
+        failed.discard(endpoint)
+
 
 class AuthenticationFailed(UpdateFailed):
     """Exception to indicate authentication failure."""
 
 
+class FetchFailed(Exception):
+    """Raised when a fetch fell back to a default because its request failed."""
+
+
 class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignore[misc]
     """Class to manage fetching Foodsharing data for a single account."""
 
-    def __init__(self, hass: HomeAssistant, email: str, password: str) -> None:
-        """Initialize."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        email: str,
+        password: str,
+        shared: Coalescer | None = None,
+        metadata: MetadataCache | None = None,
+        spatial: SpatialIndex | None = None,
+        search: SearchIndex | None = None,
+        offline_accounts: set[str] | None = None,
+    ) -> None:
+        """Initialize; shared, metadata, the indexes and offline_accounts span all accounts of this instance."""
         self.email = email
         self.password = password
         self.hass = hass
         self.session = async_get_clientsession(hass)
         self.entries: dict[str, config_entries.ConfigEntry] = {}
+        self._filters: dict[str, BasketFilter] = {}
 
         self._seen_messages: set[int] = set()
         self._seen_bells: set[int] = set()
@@ -59,6 +181,49 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         self._last_stats_update: datetime | None = None
         self._cached_stats: dict[str, Any] = {}
         self._xsrf_token: str | None = None
+        self.pickup_history = PickupHistory(hass, email)
+        self.activity = ActivityModel(hass, email)
+        self.budget = RequestBudget(hass, email)
+        self.latency = LatencyTracker()
+        self.retry = RetryPolicy(hass, email)
+        self.breaker = CircuitBreaker()
+        self.coalescer = Coalescer()
+        self.shared = shared or Coalescer()
+        self.metadata = metadata or MetadataCache(hass)
+        self.spatial = spatial or SpatialIndex()
+        self.search = search or SearchIndex()
+        self.details = BasketDetails()
+        self._details_semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+        self._prefetch_tasks: set[asyncio.Task[None]] = set()
+        self._shut_down = False
+        self._hedging = False
+        # Accounts of this instance for which the API is offline, the repair issue stays while any is
+        self._offline_accounts = offline_accounts if offline_accounts is not None else set()
+        self._offline_cycles = 0
+        # Requests of the running cycle answered with 503 and with a usable answer
+        self._cycle_offline = 0
+        self._cycle_answered = 0
+        # Next due time per (entry_id, loc_idx) slice and for the account endpoints
+        self._due: dict[tuple[str, int], datetime] = {}
+        self._account_due: datetime | None = None
+        # Next Fairteiler wall refresh per slice, only used with a request budget
+        self._wall_due: dict[tuple[str, int], datetime] = {}
+        # Listener contexts to notify after the running update, None for all
+        self._updated_contexts: set[Any] | None = None
+        self._last_notified_success = True
+        # Update graphs with fetches still running after the cycle deadline
+        self._straggler_graphs: set[TaskGraph] = set()
+        # Listener contexts whose data was not refreshed by their last fetch
+        self.stale: set[Any] = set()
+        self.freshness = Freshness()
+        # Polling profile state and its state/time listeners per entry
+        self._profile_active: dict[str, bool] = {}
+        self._profile_unsubs: dict[str, list[CALLBACK_TYPE]] = {}
+        # Primary locations following a tracker, with their state listener and dwell timer
+        self.follows: dict[str, FollowLocation] = {}
+        self._follow_unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._follow_timers: dict[str, CALLBACK_TYPE] = {}
+        self._unsub_basket_expiry: CALLBACK_TYPE | None = None
         self.base_url = "https://foodsharing.de"
         self._update_base_url()
 
@@ -80,6 +245,232 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                 return str(cookie.value)
         return None
 
+    def _get(self, url: str, kind: str = KIND_ACCOUNT) -> Any:
+        """Issue an authenticated GET request and count it against the request budget."""
+        self.budget.async_record(kind)
+        return self.session.get(url, headers=self.authenticated_headers)
+
+    async def _read_get(self, url: str, headers: dict[str, str], timeout: float, kind: str) -> BufferedResponse:
+        """Send a plain GET request and read its body, so that several callers can use the response."""
+        self.budget.async_record(kind)
+        async with self.session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            return await self._buffer(response)
+
+    async def _buffer(self, response: aiohttp.ClientResponse) -> BufferedResponse:
+        """Read a response body, refusing bodies beyond the size cap."""
+        body = await read_body(response)
+        return BufferedResponse(self.hass, response.status, response.headers, body)
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        endpoint: str,
+        url: str,
+        default_timeout: float,
+        kind: str = KIND_ACCOUNT,
+        shared_ttl: timedelta | None = None,
+    ) -> AsyncIterator[Any]:
+        """GET an endpoint through its circuit breaker and note failures for the running fetch, see _fresh.
+
+        Circuits are kept per URL, so a location the API keeps rejecting does
+        not block the same endpoint for the other locations. Identical requests
+        that overlap share one response. Answers that don't depend on the
+        account are shared with all accounts for shared_ttl.
+        """
+        now = dt_util.utcnow()
+        if remaining := self.retry.cooldown_remaining(self.base_url, now):
+            _note_failed(endpoint)
+            raise RateLimited(f"API cooldown active for another {remaining:.0f}s")
+        circuit = url.removeprefix(self.base_url)
+        if not self.breaker.allow(circuit, now):
+            _note_failed(endpoint)
+            raise CircuitOpen(f"Circuit for {circuit} is open")
+
+        fetch = partial(self._buffered_get, endpoint, url, default_timeout, kind, circuit)
+        try:
+            if shared_ttl is not None:
+                response = await self._shared_get(url, fetch, shared_ttl)
+            else:
+                response = await self.coalescer.run(("GET", url), fetch, lambda response: response.status < 400)
+        except Exception:
+            _note_failed(endpoint)
+            raise
+        if not _answered(response.status):
+            _note_failed(endpoint)
+
+        try:
+            yield response
+        except AuthenticationFailed:
+            raise
+        except Exception:
+            # The answer was unusable, e.g. not valid JSON
+            _note_failed(endpoint)
+            self._record_circuit(circuit, False)
+            raise
+
+    async def _shared_get(
+        self, url: str, fetch: Callable[[], Awaitable[BufferedResponse]], ttl: timedelta
+    ) -> BufferedResponse:
+        """GET a public URL through the coalescer shared by all accounts.
+
+        Only successful answers are shared. Any other answer may depend on the
+        session of the account that asked, e.g. a 401 of an expired session, so
+        an account that joined someone else's request asks again itself.
+        """
+        own = False
+
+        async def fetch_own() -> BufferedResponse:
+            nonlocal own
+            own = True
+            return await fetch()
+
+        response: BufferedResponse = await self.shared.run(
+            ("GET", url), fetch_own, lambda response: 200 <= response.status < 300, ttl.total_seconds()
+        )
+        if own or 200 <= response.status < 300:
+            return response
+        return await self.coalescer.run(("GET", url), fetch, lambda response: response.status < 400)
+
+    async def _buffered_get(
+        self, endpoint: str, url: str, default_timeout: float, kind: str, circuit: str
+    ) -> BufferedResponse:
+        """Send a GET request and read its body, so that several callers can use the response."""
+        try:
+            async with self._retrying_get(endpoint, url, default_timeout, kind) as raw:
+                response = await self._buffer(raw)
+        except Exception:
+            self._record_circuit(circuit, False)
+            raise
+        self._record_circuit(circuit, _answered(response.status))
+        return response
+
+    def _record_circuit(self, circuit: str, success: bool) -> None:
+        """Record a request outcome with the circuit breaker and log when its circuit opens or closes."""
+        state = self.breaker.record(circuit, success, dt_util.utcnow())
+        if state == OPEN:
+            _LOGGER.warning("Requests to %s keep failing, pausing them for a while", circuit)
+        elif state == CLOSED:
+            _LOGGER.info("Requests to %s work again", circuit)
+
+    @asynccontextmanager
+    async def _retrying_get(self, endpoint: str, url: str, default_timeout: float, kind: str) -> AsyncIterator[Any]:
+        """GET an endpoint with retries and a timeout adapted to its measured latency.
+
+        Connection errors, timeouts and 429/5xx answers are retried with jittered
+        exponential backoff. A Retry-After beyond a few seconds becomes a cooldown
+        during which no requests are sent to the API at all.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            last_attempt = attempt == MAX_ATTEMPTS - 1
+            timeout = self.latency.timeout(endpoint, default_timeout)
+            start = time.monotonic()
+            delay: float | None = None
+            yielded = False
+            try:
+                async with asyncio.timeout(timeout), self._hedged_get(endpoint, url, kind) as response:
+                    if response.status in RETRY_STATUSES:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"), dt_util.utcnow())
+                        if retry_after is not None and (retry_after > MAX_INLINE_DELAY or last_attempt):
+                            self.retry.async_set_cooldown(self.base_url, retry_after, dt_util.utcnow())
+                        elif not last_attempt:
+                            delay = retry_after if retry_after is not None else backoff_delay(attempt)
+                    if delay is None:
+                        if response.status == 503:
+                            self._cycle_offline += 1
+                        elif _answered(response.status):
+                            self._cycle_answered += 1
+                        yielded = True
+                        yield response
+            except TimeoutError:
+                # Count the timeout itself so a slow but alive API gets more time
+                self.latency.record(endpoint, timeout)
+                if yielded or last_attempt:
+                    raise
+                delay = backoff_delay(attempt)
+            except aiohttp.ClientError:
+                if yielded or last_attempt:
+                    raise
+                delay = backoff_delay(attempt)
+
+            if delay is None:
+                self.latency.record(endpoint, time.monotonic() - start)
+                return
+            self.retry.retries += 1
+            _LOGGER.debug("Retrying %s in %.1fs (attempt %d)", endpoint, delay, attempt + 2)
+            await asyncio.sleep(delay)
+
+    @callback
+    def _async_note_cycle_availability(self) -> None:
+        """Count the cycles that only got 503 answers and mark the API offline after several in a row."""
+        if self._cycle_answered:
+            self._offline_cycles = 0
+        elif self._cycle_offline:
+            self._offline_cycles += 1
+        self._async_set_api_offline(self._offline_cycles >= OFFLINE_CYCLES)
+
+    @callback
+    def _async_set_api_offline(self, offline: bool) -> None:
+        """Raise or clear the repair issue for an API that answers 503, shared by all accounts."""
+        if offline == (self.email in self._offline_accounts):
+            return
+        if offline:
+            self._offline_accounts.add(self.email)
+            async_create_issue(
+                self.hass,
+                DOMAIN,
+                "api_offline",
+                is_fixable=False,
+                severity=IssueSeverity.WARNING,
+                translation_key="api_offline",
+            )
+        else:
+            self._offline_accounts.discard(self.email)
+            if not self._offline_accounts:
+                async_delete_issue(self.hass, DOMAIN, "api_offline")
+
+    @asynccontextmanager
+    async def _hedged_get(self, endpoint: str, url: str, kind: str) -> AsyncIterator[Any]:
+        """GET a URL, sending a duplicate request if the first is slower than the endpoint's p95."""
+        hedge_after = self.latency.percentile(endpoint) if self._hedging else None
+        if hedge_after is None:
+            async with self._get(url, kind) as response:
+                yield response
+            return
+
+        async def open_request() -> tuple[Any, Any]:
+            request = self._get(url, kind)
+            return request, await request.__aenter__()
+
+        tasks = [asyncio.create_task(open_request())]
+        winner: asyncio.Task[tuple[Any, Any]] | None = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                self.retry.hedged += 1
+                tasks.append(asyncio.create_task(open_request()))
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((t for t in done if not t.cancelled() and t.exception() is None), None)
+            if winner is None:
+                # Both failed, report the first request's error
+                tasks[0].result()
+        finally:
+            for task in tasks:
+                if task is winner:
+                    continue
+                if task.done():
+                    if not task.cancelled() and task.exception() is None:
+                        await task.result()[0].__aexit__(None, None, None)
+                else:
+                    task.cancel()
+
+        assert winner is not None
+        request, response = winner.result()
+        async with AsyncExitStack() as stack:
+            stack.push_async_exit(request)
+            yield response
+
     @property
     def authenticated_headers(self) -> dict[str, str]:
         """Return headers for authenticated requests mimicking a browser."""
@@ -172,6 +563,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         """Fetch the CSRF token from the login page."""
         try:
             # Hit /login to ensure we get the right cookies
+            self.budget.async_record(KIND_LOGIN)
             async with self.session.get(f"{self.base_url}/login", headers={"User-Agent": self._user_agent}) as response:
                 await response.text()
                 token = self._get_xsrf_token_from_jar()
@@ -186,15 +578,268 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
     def add_entry(self, entry: config_entries.ConfigEntry) -> None:
         """Add a config entry to this coordinator."""
         self.entries[entry.entry_id] = entry
+        self._filters.pop(entry.entry_id, None)
+        self._async_track_profile(entry)
+        self._async_track_follow(entry)
+        self._update_request_options()
         self._update_refresh_interval()
         self._update_base_url()
 
     def remove_entry(self, entry_id: str) -> None:
         """Remove a config entry from this coordinator."""
         self.entries.pop(entry_id, None)
+        self._filters.pop(entry_id, None)
+        self._due = {key: due for key, due in self._due.items() if key[0] != entry_id}
+        self._wall_due = {key: due for key, due in self._wall_due.items() if key[0] != entry_id}
+        self.stale = {context for context in self.stale if not (isinstance(context, tuple) and context[0] == entry_id)}
+        self.freshness.prune(entry_id)
+        self.breaker.prune(lambda key: isinstance(key, tuple) and key[0] == entry_id)
+        self.spatial.prune(lambda source: source[:2] == (self.email, entry_id))
+        self.search.prune(lambda source: source[:2] == (self.email, entry_id))
+        for unsub in self._profile_unsubs.pop(entry_id, []):
+            unsub()
+        self._profile_active.pop(entry_id, None)
+        self._async_untrack_follow(entry_id)
+        if not self.entries:
+            self.search.prune(lambda source: source[0] == self.email)
+            self._cancel_basket_expiry()
+        self._update_request_options()
         self._update_refresh_interval()
         self._update_base_url()
 
+    def _update_request_options(self) -> None:
+        """Apply the account-wide request options: the strictest budget and hedging if any entry enables it."""
+        self._hedging = any(entry.options.get(CONF_HEDGE_REQUESTS, False) for entry in self.entries.values())
+        budgets = [b for entry in self.entries.values() if (b := entry.options.get(CONF_DAILY_REQUEST_BUDGET))]
+        self.budget.daily_budget = min(budgets, default=0)
+        if not self.budget.daily_budget:
+            self.budget.planned_intervals = {}
+
+    @callback
+    def _async_track_profile(self, entry: config_entries.ConfigEntry) -> None:
+        """Listen for the time window and entities that switch the polling profile."""
+        for unsub in self._profile_unsubs.pop(entry.entry_id, []):
+            unsub()
+        self._profile_active[entry.entry_id] = profile_active(self.hass, entry.options, dt_util.utcnow())
+
+        unsubs: list[CALLBACK_TYPE] = []
+        changed = partial(self._async_profile_changed, entry.entry_id)
+        if entities := entry.options.get(CONF_ACTIVE_ENTITIES):
+            unsubs.append(async_track_state_change_event(self.hass, entities, changed))
+        if window := profile_times(entry.options):
+            for switch_time in window:
+                unsubs.append(
+                    async_track_time_change(
+                        self.hass,
+                        changed,
+                        hour=switch_time.hour,
+                        minute=switch_time.minute,
+                        second=switch_time.second,
+                    )
+                )
+        self._profile_unsubs[entry.entry_id] = unsubs
+
+    @callback
+    def _async_profile_changed(self, entry_id: str, *_: Any) -> None:
+        """Switch an entry's polling profile as soon as its conditions change."""
+        entry = self.entries.get(entry_id)
+        if entry is None:
+            return
+        active = profile_active(self.hass, entry.options, dt_util.utcnow())
+        if active == self._profile_active.get(entry_id):
+            return
+        self._profile_active[entry_id] = active
+        _LOGGER.debug("Polling profile of entry %s is now %s", entry_id, "active" if active else "background")
+
+        if active:
+            # Someone can act on baskets again, poll this entry's locations right away
+            self._due = {key: due for key, due in self._due.items() if key[0] != entry_id}
+            self.hass.async_create_task(self.async_request_refresh())
+        else:
+            self._update_refresh_interval()
+
+    @callback
+    def _async_track_follow(self, entry: config_entries.ConfigEntry) -> None:
+        """Let the primary location of an entry follow its tracker entity, if one is set."""
+        self._async_untrack_follow(entry.entry_id)
+        if not (entity_id := entry.options.get(CONF_FOLLOW_ENTITY)):
+            return
+        follow = self.follows[entry.entry_id] = FollowLocation(
+            float(entry.options.get(CONF_FOLLOW_THRESHOLD, DEFAULT_FOLLOW_THRESHOLD)),
+            timedelta(minutes=float(entry.options.get(CONF_FOLLOW_DWELL, DEFAULT_FOLLOW_DWELL))),
+        )
+        if (position := self._tracker_position(entity_id)) is not None:
+            follow.observe(*position, dt_util.utcnow())
+        self._follow_unsubs[entry.entry_id] = async_track_state_change_event(
+            self.hass, [entity_id], partial(self._async_follow_moved, entry.entry_id)
+        )
+
+    @callback
+    def _async_untrack_follow(self, entry_id: str) -> None:
+        self.follows.pop(entry_id, None)
+        for unsubs in (self._follow_unsubs, self._follow_timers):
+            if unsub := unsubs.pop(entry_id, None):
+                unsub()
+
+    def _tracker_position(self, entity_id: str) -> tuple[float, float] | None:
+        """Return the GPS position of a person or device tracker, None if it has none."""
+        state = self.hass.states.get(entity_id)
+        if state is None:
+            return None
+        try:
+            return float(state.attributes[ATTR_LATITUDE]), float(state.attributes[ATTR_LONGITUDE])
+        except KeyError, TypeError, ValueError:
+            return None
+
+    @callback
+    def _async_follow_moved(self, entry_id: str, *_: Any) -> None:
+        """Move the primary location of an entry once its tracker settled somewhere new.
+
+        A recently visited cell serves its cached results and keeps the
+        regular polling pace, anywhere else is polled right away.
+        """
+        entry = self.entries.get(entry_id)
+        follow = self.follows.get(entry_id)
+        if entry is None or follow is None:
+            return
+        if unsub := self._follow_timers.pop(entry_id, None):
+            unsub()
+        position = self._tracker_position(entry.options[CONF_FOLLOW_ENTITY])
+        if position is None:
+            return
+        now = dt_util.utcnow()
+        if not follow.observe(*position, now):
+            if follow.due is not None:
+                # The tracker may not report again while it stays, so check once the dwell time is over
+                self._follow_timers[entry_id] = async_track_point_in_time(
+                    self.hass, partial(self._async_follow_moved, entry_id), follow.due
+                )
+            return
+        _LOGGER.debug("Primary location of entry %s moved to a new cell", entry_id)
+
+        key = (entry_id, 0)
+        locs = (self.data or {}).get("locations", {}).get(entry_id, [])
+        if locs and (cached := follow.cached(now)) is not None:
+            baskets = [
+                b
+                for b in cached.get("baskets", [])
+                if (removal := self._removal_time(entry_id, b)) is None or removal > now
+            ]
+            locs[0] = {**cached, "baskets": baskets}
+            self.spatial.update((self.email, *key), locs[0])
+            self.search.update((self.email, *key), slice_documents(locs[0]))
+            self.async_update_location_listeners({key})
+            return
+        self._due.pop(key, None)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def _center(self, entry_id: str, idx: int, loc: dict[str, Any]) -> tuple[float, float]:
+        """Return the search center of a location, following the tracker for the primary one."""
+        follow = self.follows.get(entry_id)
+        if idx == 0 and follow is not None and follow.center is not None:
+            follow.requested = follow.center
+            return follow.center
+        return loc["latitude"], loc["longitude"]
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled refreshes, basket expiry, late fetches and entity listeners."""
+        self._shut_down = True
+        self._cancel_basket_expiry()
+        for graph in self._straggler_graphs:
+            graph.cancel()
+        for task in self._prefetch_tasks:
+            task.cancel()
+        for entry_id in list(self._profile_unsubs):
+            for unsub in self._profile_unsubs.pop(entry_id):
+                unsub()
+        for entry_id in list(self.follows):
+            self._async_untrack_follow(entry_id)
+        self._async_set_api_offline(False)
+        await super().async_shutdown()
+
+    @callback
+    def async_update_location_listeners(self, slices: set[tuple[str, int]]) -> None:
+        """Notify only the listeners of the given (entry_id, loc_idx) slices.
+
+        Location entities register with their slice as context, platform
+        reconcilers with their entry_id.
+        """
+        contexts: set[Any] = {entry_id for entry_id, _ in slices}
+        contexts.update(slices)
+        for update_callback, context in list(self._listeners.values()):
+            if context in contexts:
+                update_callback()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners of the slices refreshed by the last update.
+
+        Account-wide entities have no context and are notified when the account
+        endpoints were fetched. Everyone is notified when availability changes.
+        """
+        contexts, self._updated_contexts = self._updated_contexts, None
+        success_changed = self.last_update_success != self._last_notified_success
+        self._last_notified_success = self.last_update_success
+        if contexts is None or success_changed or not self.last_update_success:
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context in contexts:
+                update_callback()
+
+    def _cancel_basket_expiry(self) -> None:
+        if self._unsub_basket_expiry:
+            self._unsub_basket_expiry()
+            self._unsub_basket_expiry = None
+
+    @callback
+    def _removal_time(self, entry_id: str, basket: dict[str, Any]) -> datetime | None:
+        """Return when a basket leaves a slice: at its expiry, or earlier with a minimum time left."""
+        if entry_id not in self.entries:
+            return basket.get("expires_at")
+        return self._filter_for(entry_id).removal_time(basket)
+
+    def _schedule_basket_expiry(self, location_data: dict[str, list[dict[str, Any]]]) -> None:
+        """Schedule local removal of baskets at the earliest removal time."""
+        self._cancel_basket_expiry()
+        next_expiry = min(
+            (
+                removal
+                for entry_id, locs in location_data.items()
+                for loc in locs
+                for basket in loc.get("baskets", [])
+                if (removal := self._removal_time(entry_id, basket)) is not None
+            ),
+            default=None,
+        )
+        if next_expiry is not None:
+            self._unsub_basket_expiry = async_track_point_in_time(self.hass, self._async_expire_baskets, next_expiry)
+
+    @callback
+    def _async_expire_baskets(self, now: datetime) -> None:
+        """Drop expired baskets, or those without the minimum time left, from the current data without polling."""
+        self._unsub_basket_expiry = None
+        if not self.data:
+            return
+
+        location_data: dict[str, list[dict[str, Any]]] = self.data.get("locations", {})
+        expired: set[tuple[str, int]] = set()
+        for entry_id, locs in location_data.items():
+            for idx, loc in enumerate(locs):
+                baskets = loc.get("baskets", [])
+                kept = [b for b in baskets if (removal := self._removal_time(entry_id, b)) is None or removal > now]
+                if len(kept) != len(baskets):
+                    # Replace the slice instead of mutating it in place
+                    locs[idx] = {**loc, "baskets": kept}
+                    self.spatial.update((self.email, entry_id, idx), locs[idx])
+                    self.search.update((self.email, entry_id, idx), slice_documents(locs[idx]))
+                    expired.add((entry_id, idx))
+
+        if expired:
+            _LOGGER.debug("Removed expired baskets for %d location(s)", len(expired))
+            self.async_update_location_listeners(expired)
+        self._schedule_basket_expiry(location_data)
+
     def _update_base_url(self) -> None:
         """Update base URL based on entries."""
         use_beta = False
@@ -217,17 +862,89 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         self.base_url = f"https://beta.{base_domain}" if use_beta else f"https://{base_domain}"
         _LOGGER.debug("Foodsharing base URL set to %s", self.base_url)
 
+    def _slice_intervals(self, now: datetime) -> dict[tuple[str, int], float]:
+        """Return the polling interval in minutes of every (entry_id, loc_idx) slice."""
+        intervals: dict[tuple[str, int], float] = {}
+        for entry_id, entry in self.entries.items():
+            interval = entry.options.get(CONF_SCAN_INTERVAL, entry.data.get(CONF_SCAN_INTERVAL, 2))
+            adaptive = entry.options.get(CONF_ADAPTIVE_POLLING, False)
+            max_interval = entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+            if not profile_active(self.hass, entry.options, now):
+                background = entry.options.get(CONF_BACKGROUND_SCAN_INTERVAL, DEFAULT_BACKGROUND_SCAN_INTERVAL)
+                interval = max(interval, background)
+                max_interval = max(max_interval, background)
+            for idx, loc in enumerate(get_locations_from_entry(entry)):
+                intervals[(entry_id, idx)] = (
+                    self.activity.interval(location_key(loc), now, interval, max_interval) if adaptive else interval
+                )
+        if self.budget.daily_budget:
+            self._apply_budget(intervals, now)
+        return intervals
+
+    def _sensor_enabled(self, unique_id: str) -> bool:
+        """Return whether a sensor of this integration is enabled (or not registered yet)."""
+        registry = er.async_get(self.hass)
+        entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+        entity = registry.async_get(entity_id) if entity_id else None
+        return entity is None or entity.disabled_by is None
+
+    def _apply_budget(self, intervals: dict[tuple[str, int], float], now: datetime) -> None:
+        """Stretch the slice intervals so the daily request budget lasts until midnight.
+
+        Locations with recent keyword matches or a high basket turnover get a
+        larger share, slices whose sensors are disabled a much smaller one.
+        """
+        location_data: dict[str, list[dict[str, Any]]] = (self.data or {}).get("locations", {})
+        account_cost = self.budget.cost(KIND_ACCOUNT, ACCOUNT_COST, KIND_LOGIN)
+        location_cost = self.budget.cost(KIND_LOCATION, LOCATION_COST, KIND_DETAILS)
+        consumers = [Consumer(KIND_ACCOUNT, account_cost, ACCOUNT_WEIGHT)]
+        for entry_id, entry in self.entries.items():
+            slices = location_data.get(entry_id, [])
+            for idx, loc in enumerate(get_locations_from_entry(entry)):
+                if (entry_id, idx) not in intervals:
+                    continue
+                weight = (
+                    1.0
+                    + MATCH_WEIGHT * self.budget.match_score((entry_id, idx), now)
+                    + TURNOVER_WEIGHT * self.activity.turnover(location_key(loc))
+                )
+                if not self._sensor_enabled(f"Foodsharing-Baskets-{entry_id}-{idx}"):
+                    weight *= DISABLED_FACTOR
+                consumers.append(Consumer((entry_id, idx), location_cost, weight))
+
+                walls = sum(
+                    1 for fp in (slices[idx] if idx < len(slices) else {}).get("fairteiler", []) if fp.get("id")
+                )
+                if walls:
+                    wall_weight = WALL_WEIGHT
+                    if not self._sensor_enabled(f"Foodsharing-Fairteiler-{entry_id}-{idx}"):
+                        wall_weight *= DISABLED_FACTOR
+                    consumers.append(Consumer((KIND_WALLS, entry_id, idx), walls, wall_weight))
+
+        planned = self.budget.plan(consumers, now)
+        for key, interval in intervals.items():
+            intervals[key] = max(interval, planned.get(key, 0))
+
+    def _account_interval(self, intervals: dict[tuple[str, int], float]) -> float:
+        """Return the account polling interval, following the fastest slice within the budget."""
+        return max(min(intervals.values(), default=60), self.budget.planned_intervals.get(KIND_ACCOUNT, 0))
+
+    def _wall_interval(self, key: tuple[str, int], intervals: dict[tuple[str, int], float]) -> float:
+        """Return the Fairteiler wall interval of a slice within the budget."""
+        return max(intervals[key], self.budget.planned_intervals.get((KIND_WALLS, *key), 0))
+
     def _update_refresh_interval(self) -> None:
-        """Update the update interval based on entries."""
+        """Set the coordinator tick to the next due location or account refresh."""
         if not self.entries:
             return
 
-        min_interval = 60
-        for entry in self.entries.values():
-            interval = entry.options.get(CONF_SCAN_INTERVAL, entry.data.get(CONF_SCAN_INTERVAL, 2))
-            min_interval = min(min_interval, interval)
-
-        self.update_interval = timedelta(minutes=min_interval)
+        now = dt_util.utcnow()
+        intervals = self._slice_intervals(now)
+        # Account endpoints are shared by all entries and follow the fastest slice
+        account_interval = self._account_interval(intervals)
+        due_times = [self._due.get(key, now + timedelta(minutes=interval)) for key, interval in intervals.items()]
+        due_times.append(self._account_due or now + timedelta(minutes=account_interval))
+        self.update_interval = max(min(due_times) - now, MIN_TICK)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint."""
@@ -262,74 +979,316 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
             raise UpdateFailed(f"Unexpected error communicating with API: {err}") from err
 
     async def _fetch_all_data(self) -> dict[str, Any]:
-        """Fetch all data for all locations."""
-        now = datetime.now()
+        """Fetch the account data and the locations that are due.
+
+        Whatever has arrived by the cycle deadline is published. Slower fetches
+        keep running and are published by an incremental update once they
+        finish; until then their slices keep the previous data and are stale.
+        """
+        now = dt_util.utcnow()
+        horizon = now + DUE_TOLERANCE
+        intervals = self._slice_intervals(now)
+        previous = self.data or {}
+
+        in_flight = {key for graph in self._straggler_graphs for key in graph.pending}
+        fetch_account = (not previous or self._account_due is None or self._account_due <= horizon) and not any(
+            isinstance(key, str) for key in in_flight
+        )
+        due_slices = {
+            key for key in intervals if (key not in self._due or self._due[key] <= horizon) and key not in in_flight
+        }
+
+        self._cycle_offline = self._cycle_answered = 0
+        # Due times to restore if the cycle fails and is run again after a login
+        rollback = (self._account_due, dict(self._due), dict(self._wall_due))
+
+        # Location fetches don't depend on the account calls and run alongside them
+        graph = TaskGraph()
+        circuit_open: dict[tuple[str, int], CircuitOpen] = {}
+        fetch_stats = self._add_account_tasks(graph) if fetch_account else False
+        if fetch_account:
+            self._account_due = next_due(now, self._account_interval(intervals), phase_offset(self.email))
+
+        for entry_id, entry in self.entries.items():
+            for idx, loc in enumerate(get_locations_from_entry(entry)):
+                if (entry_id, idx) not in due_slices:
+                    continue
+                self._due[(entry_id, idx)] = next_due(
+                    now, intervals[(entry_id, idx)], phase_offset(self.email, entry_id, str(idx))
+                )
+                if not self.breaker.allow((entry_id, idx), now):
+                    # Costs nothing until the cooldown is over; the slice serves its last good data
+                    circuit_open[(entry_id, idx)] = CircuitOpen(f"Circuit for location {idx} of {entry_id} is open")
+                    continue
+                fetch_walls = True
+                if self.budget.daily_budget:
+                    wall_due = self._wall_due.get((entry_id, idx))
+                    fetch_walls = wall_due is None or wall_due <= horizon
+                    if fetch_walls:
+                        self._wall_due[(entry_id, idx)] = next_due(
+                            now,
+                            self._wall_interval((entry_id, idx), intervals),
+                            phase_offset(self.email, entry_id, str(idx), KIND_WALLS),
+                        )
+                lat, lon = self._center(entry_id, idx, loc)
+                graph.add(
+                    (entry_id, idx),
+                    partial(
+                        self.fetch_location_data,
+                        entry_id,
+                        lat,
+                        lon,
+                        loc.get("distance", 7),
+                        fetch_walls=fetch_walls,
+                    ),
+                )
+
+        results = await graph.run(timeout=CYCLE_DEADLINE.total_seconds())
+        for res in results.values():
+            if isinstance(res, AuthenticationFailed):
+                graph.cancel()
+                self._account_due, self._due, self._wall_due = rollback
+                raise res
+        results.update(circuit_open)
+        self._async_note_cycle_availability()
+
+        # Start from the current data, late results may have been published meanwhile
+        previous = self.data or {}
+        previous_locations: dict[str, list[dict[str, Any]]] = previous.get("locations", {})
+        location_data: dict[str, list[dict[str, Any]]] = {}
+        for entry_id, entry in self.entries.items():
+            previous_locs = previous_locations.get(entry_id, [])
+            location_data[entry_id] = [
+                previous_locs[idx] if idx < len(previous_locs) else {"baskets": [], "fairteiler": []}
+                for idx in range(len(get_locations_from_entry(entry)))
+            ]
+
+        updated = self._apply_location_results(results, location_data)
+        if fetch_account:
+            account = self._account_from_results(results, fetch_stats, previous.get("account", {}))
+            updated.add(None)
+        else:
+            account = previous.get("account", {})
+
+        if graph.pending:
+            _LOGGER.debug("Publishing partial update, still waiting for %s", list(graph.pending))
+            self.stale.update(self._context_of(key) for key in graph.pending)
+            self._straggler_graphs.add(graph)
+            self.hass.async_create_background_task(
+                self._async_finish_stragglers(graph, fetch_stats),
+                f"{DOMAIN}_{self.email}_stragglers",
+            )
+
+        if not self._straggler_graphs:
+            # Late fetches of the first update still parse what already exists, they must not fire events
+            self._is_first_update = False
+        self._schedule_basket_expiry(location_data)
+        self._update_refresh_interval()
+        self._updated_contexts = updated
+
+        return {"account": account, "locations": location_data}
+
+    @staticmethod
+    def _context_of(key: Any) -> Any:
+        """Return the listener context of a graph node: its slice, or None for account endpoints."""
+        return key if isinstance(key, tuple) else None
+
+    def _apply_location_results(
+        self, results: dict[Any, Any], location_data: dict[str, list[dict[str, Any]]]
+    ) -> set[Any]:
+        """Store finished location fetches in the location data. Return the contexts to notify.
+
+        Failed parts keep their last good value until it gets older than the
+        max age, then they are emptied.
+        """
+        updated: set[Any] = set()
+        observed_at = dt_util.utcnow()
+        for key, res in results.items():
+            if not isinstance(key, tuple):
+                continue
+            entry_id, idx = key
+            if entry_id not in self.entries or idx >= len(location_data.get(entry_id, [])):
+                # Entry removed or reconfigured while the fetch was running
+                continue
+            updated.update((key, entry_id))
+            previous = location_data[entry_id][idx]
+            fetched = res if isinstance(res, dict) else {}
+            slice_data: dict[str, Any] = {}
+            for part in LOCATION_PARTS:
+                if part in fetched:
+                    self.freshness.record((*key, part), observed_at)
+                    slice_data[part] = fetched[part]
+                else:
+                    self.freshness.record_failure((*key, part))
+                    servable = self.freshness.servable((*key, part), observed_at)
+                    slice_data[part] = previous.get(part, []) if servable else []
+            self._carry_over_walls(slice_data, previous)
+            location_data[entry_id][idx] = slice_data
+            self.spatial.update((self.email, entry_id, idx), slice_data)
+            self.search.update((self.email, entry_id, idx), slice_documents(slice_data))
+
+            success = len(fetched) == len(LOCATION_PARTS)
+            if success:
+                self.stale.discard(key)
+                follow = self.follows.get(entry_id)
+                if idx == 0 and follow is not None and follow.requested is not None:
+                    follow.store(follow.requested, slice_data, observed_at)
+            else:
+                self.stale.add(key)
+                _LOGGER.debug(
+                    "Error fetching location data for entry %s location %d: %s",
+                    entry_id,
+                    idx,
+                    res if isinstance(res, Exception) else ", ".join(p for p in LOCATION_PARTS if p not in fetched),
+                )
+            if not isinstance(res, CircuitOpen):
+                state = self.breaker.record(key, success, observed_at)
+                if state == OPEN:
+                    _LOGGER.warning(
+                        "Location %d of entry %s keeps failing, serving its last good data and pausing it for a while",
+                        idx,
+                        entry_id,
+                    )
+                elif state == CLOSED:
+                    _LOGGER.info("Location %d of entry %s works again", idx, entry_id)
+            if "baskets" in fetched:
+                loc = get_locations_from_entry(self.entries[entry_id])[idx]
+                baskets = fetched["baskets"]
+                self.activity.async_observe(location_key(loc), {b["id"] for b in baskets}, observed_at)
+                self.budget.async_record_poll(KIND_LOCATION)
+                self.budget.note_matches(key, sum(1 for b in baskets if b.get("keyword_match")), observed_at)
+        return updated
+
+    async def _async_finish_stragglers(self, graph: TaskGraph, fetch_stats: bool) -> None:
+        """Publish the fetches that missed the cycle deadline as an incremental update."""
+        try:
+            results = await graph.finish()
+        finally:
+            self._straggler_graphs.discard(graph)
+            if not self._straggler_graphs:
+                self._is_first_update = False
+        if not self.data:
+            return
+        if any(isinstance(res, AuthenticationFailed) for res in results.values()):
+            # The next regular update runs into the same error and logs in again
+            return
+
+        location_data = {entry_id: list(locs) for entry_id, locs in self.data.get("locations", {}).items()}
+        updated = self._apply_location_results(results, location_data)
+        account = self.data.get("account", {})
+        if any(isinstance(key, str) for key in results):
+            account = self._account_from_results(results, fetch_stats, account)
+            updated.add(None)
+
+        _LOGGER.debug("Publishing late results for %s", list(results))
+        self._schedule_basket_expiry(location_data)
+        self._updated_contexts = updated
+        self.async_set_updated_data({"account": account, "locations": location_data})
+
+    @staticmethod
+    def _carry_over_walls(result: dict[str, Any], previous: dict[str, Any]) -> None:
+        """Keep the latest wall posts of the previous poll for walls that were skipped or failed."""
+        latest_posts = {fp.get("id"): fp.get("latest_post") for fp in previous.get("fairteiler", []) if fp.get("id")}
+        for fp in result.get("fairteiler", []):
+            if "latest_post" not in fp:
+                fp["latest_post"] = latest_posts.get(fp.get("id"))
+
+    def _add_account_tasks(self, graph: TaskGraph) -> bool:
+        """Add the account-wide endpoints to the update graph. Return whether statistics are fetched.
+
+        Statistics are refreshed once a day; region statistics need the region id
+        from the profile and wait for it, everything else starts right away.
+        """
         fetch_stats = (
             self._last_stats_update is None
-            or (now - self._last_stats_update) > timedelta(days=1)
+            or (datetime.now() - self._last_stats_update) > timedelta(days=1)
             or self._is_first_update
         )
 
-        task_keys = [
-            "messages",
-            "bells",
-            "pickups",
-            "own_baskets",
-        ]
-        account_tasks = [
-            self.fetch_unread_messages(),
-            self.fetch_bells(),
-            self.fetch_pickups(),
-            self.fetch_own_baskets(),
-        ]
+        graph.add("messages", partial(self._fresh, "unread_count", self.fetch_unread_messages))
+        graph.add("bells", partial(self._fresh, "bells", self.fetch_bells))
+        graph.add("pickups", partial(self._fresh, "pickups", self.fetch_pickups))
+        graph.add("own_baskets", partial(self._fresh, "own_baskets", self.fetch_own_baskets))
 
         if fetch_stats:
-            stats_keys = ["global_stats", "user_stats", "profile", "bananas", "buddies"]
-            task_keys.extend(stats_keys)
-            account_tasks.extend(
-                [
-                    self.fetch_global_statistics(),
-                    self.fetch_user_statistics(),
-                    self.fetch_user_profile(),
-                    self.fetch_bananas(),
-                    self.fetch_buddies(),
-                ]
+            graph.add("global_stats", partial(self._fresh, "statistics", self.fetch_global_statistics))
+            graph.add("user_stats", partial(self._fresh, "user_stats", self.fetch_user_statistics))
+            graph.add("profile", partial(self._fresh, "profile", self.fetch_user_profile))
+            graph.add("bananas", partial(self._fresh, "bananas", self.fetch_bananas))
+            graph.add("buddies", partial(self._fresh, "buddies", self.fetch_buddies))
+            graph.add(
+                "region_stats",
+                partial(self._fresh, "region_stats", self._fetch_region_statistics_for_profile),
+                "profile",
             )
+        return fetch_stats
 
-        account_results = await asyncio.gather(
-            *account_tasks,
-            return_exceptions=True,
-        )
+    async def _fresh(self, endpoint: str, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run a fetch and raise FetchFailed if a request to its endpoint failed.
+
+        The fetch methods fall back to defaults on errors. Raising instead lets
+        the update serve the last good value rather than a bogus zero.
+        """
+        failed: set[str] = set()
+        token = _failed_endpoints.set(failed)
+        try:
+            result = await func(*args)
+        finally:
+            _failed_endpoints.reset(token)
+        if endpoint in failed:
+            raise FetchFailed(f"Request to {endpoint} failed")
+        return result
+
+    async def _fetch_region_statistics_for_profile(self, profile: Any) -> dict[str, Any]:
+        """Fetch the statistics of the region from the user's profile."""
+        if isinstance(profile, dict):
+            self.region_id = profile.get("regionId")
+        if not self.region_id:
+            return {}
+        return await self.fetch_region_statistics(self.region_id)
+
+    def _account_from_results(
+        self, results: dict[Any, Any], fetch_stats: bool, previous: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build the account data from the graph results and the cached statistics.
+
+        Endpoints without a result yet keep their previous value, which makes
+        the account stale until they arrive. Failed endpoints keep serving their
+        last good value until it gets older than its max age.
+        """
+        now = dt_util.utcnow()
+        for key, res in results.items():
+            if not isinstance(key, str):
+                continue
+            if isinstance(res, Exception):
+                self.freshness.record_failure(key)
+            else:
+                self.freshness.record(key, now)
+        if "messages" in results:
+            # Every account poll fetches the messages exactly once, in its cycle or late
+            self.budget.async_record_poll(KIND_ACCOUNT)
 
-        keyed_results = dict(zip(task_keys, account_results, strict=True))
+        keyed_results = {key: results[key] for key in ACCOUNT_KEYS if key in results}
 
         # Update cache or use cached stats
         if fetch_stats:
-            self._last_stats_update = now
-            for key in ["global_stats", "user_stats", "profile", "bananas", "buddies"]:
-                self._cached_stats[key] = keyed_results.get(key, {})
-        else:
-            for key, val in self._cached_stats.items():
-                keyed_results[key] = val
+            self._last_stats_update = datetime.now()
+            for key in STATS_KEYS:
+                if key in results:
+                    self._cached_stats[key] = results[key]
+        keyed_results.update(self._cached_stats)
+
+        for key, res in list(keyed_results.items()):
+            max_age = STATS_MAX_AGE if key in STATS_KEYS else MAX_AGE
+            if isinstance(res, Exception) and key in previous and self.freshness.servable(key, now, max_age):
+                keyed_results[key] = previous[key]
 
         profile = keyed_results.get("profile", {})
         if isinstance(profile, dict):
             self.region_id = profile.get("regionId")
-
-        if self.region_id:
-            if fetch_stats:
-                r_stats = await self.fetch_region_statistics(self.region_id)
-                self._cached_stats["region_stats"] = r_stats
-                keyed_results["region_stats"] = r_stats
-            else:
-                keyed_results["region_stats"] = self._cached_stats.get("region_stats", {})
-        else:
+        if not self.region_id:
             keyed_results["region_stats"] = {}
 
-        for res in account_results:
-            if isinstance(res, AuthenticationFailed):
-                raise res
-
         (
             messages,
             bells,
@@ -342,62 +1301,42 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
             buddies,
             r_stats,
         ) = self._normalize_account_results(keyed_results)
+        if "pickups" in results and not isinstance(results["pickups"], Exception):
+            self.pickup_history.async_merge(pickups)
+
+        account = {
+            "messages": messages,
+            "bells": bells,
+            "pickups": pickups,
+            "own_baskets": own_baskets,
+            "global_stats": g_stats,
+            "user_stats": u_stats,
+            "profile": prof,
+            "bananas": bananas,
+            "buddies": buddies,
+            "region_stats": r_stats,
+        }
+        for key in account:
+            if key not in keyed_results and key in previous:
+                account[key] = previous[key]
 
-        location_data: dict[str, list[dict[str, Any]]] = {}
-        task_meta: list[tuple[str, int]] = []
-        location_tasks: list[Any] = []
-
-        for entry_id, entry in self.entries.items():
-            locs = get_locations_from_entry(entry)
-            location_data[entry_id] = [{"baskets": [], "fairteiler": []} for _ in locs]
-            for idx, loc in enumerate(locs):
-                task_meta.append((entry_id, idx))
-                location_tasks.append(
-                    self.fetch_location_data(
-                        entry_id,
-                        loc["latitude"],
-                        loc["longitude"],
-                        loc.get("distance", 7),
-                    )
-                )
-
-        location_results = await asyncio.gather(*location_tasks, return_exceptions=True)
-        for (entry_id, idx), res in zip(task_meta, location_results, strict=True):
-            if isinstance(res, AuthenticationFailed):
-                raise res
-            if isinstance(res, dict):
-                location_data[entry_id][idx] = res
-            elif isinstance(res, Exception):
-                _LOGGER.error(
-                    "Error fetching location data for entry %s location %d: %s",
-                    entry_id,
-                    idx,
-                    res,
-                )
-
-        self._is_first_update = False
+        if self.freshness.failed.intersection(account):
+            self.stale.add(None)
+        else:
+            self.stale.discard(None)
+        return account
 
-        return {
-            "account": {
-                "messages": messages,
-                "bells": bells,
-                "pickups": pickups,
-                "own_baskets": own_baskets,
-                "global_stats": g_stats,
-                "user_stats": u_stats,
-                "profile": prof,
-                "bananas": bananas,
-                "buddies": buddies,
-                "region_stats": r_stats,
-            },
-            "locations": location_data,
-        }
+    async def fetch_location_data(
+        self, entry_id: str, lat: float, lon: float, dist: float, fetch_walls: bool = True
+    ) -> dict[str, Any]:
+        """Fetch baskets and fairteiler for a specific location.
 
-    async def fetch_location_data(self, entry_id: str, lat: float, lon: float, dist: float) -> dict[str, Any]:
-        """Fetch baskets and fairteiler for a specific location."""
+        Parts whose fetch failed are left out, so the last good value can be
+        served in their place.
+        """
         results = await asyncio.gather(
-            self.fetch_baskets_for_location(entry_id, lat, lon, dist),
-            self.fetch_food_share_points_for_location(lat, lon, dist),
+            self._fresh("baskets", self.fetch_baskets_for_location, entry_id, lat, lon, dist),
+            self._fresh("fairteiler", self.fetch_food_share_points_for_location, lat, lon, dist, fetch_walls),
             return_exceptions=True,
         )
 
@@ -405,8 +1344,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
             if isinstance(res, AuthenticationFailed):
                 raise res
 
-        baskets, fairteiler = [(r if not isinstance(r, Exception) else []) for r in results]
-        return {"baskets": baskets, "fairteiler": fairteiler}
+        return {part: res for part, res in zip(LOCATION_PARTS, results, strict=True) if not isinstance(res, Exception)}
 
     async def login(self, totp: str | None = None) -> bool | str:
         """Login to Foodsharing API. Returns True on success, '2fa_required' if TOTP needed, False otherwise."""
@@ -424,33 +1362,40 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                             current_url,
                             "Yes" if "XSRF-TOKEN" in auth_headers else "No",
                         )
-                        async with self.session.get(
-                            current_url,
-                            headers=auth_headers,
-                            timeout=aiohttp.ClientTimeout(total=10),
-                        ) as current_resp:
-                            _LOGGER.debug("Session check status: %s", current_resp.status)
-                            if current_resp.status == 200:
-                                current_data = await current_resp.json()
-                                if current_data and "id" in current_data:
-                                    _LOGGER.debug(
-                                        "Session is VALID for user %s. Login successful.",
-                                        current_data["id"],
-                                    )
-                                    self.user_id = str(current_data["id"])
-                                    await self.async_save_session()
-                                    return True
-                            else:
-                                if attempt < 2:
-                                    wait_time = (attempt + 1) * 3
-                                    _LOGGER.debug(
-                                        "Session check failed (status %s), jar has %d cookies. Retrying in %ds...",
-                                        current_resp.status,
-                                        len(list(self.session.cookie_jar)),
-                                        wait_time,
-                                    )
-                                    await asyncio.sleep(wait_time)
-                                    continue
+                        # Shared with a profile fetch or another check that is already running
+                        current_resp = await self.coalescer.run(
+                            ("GET", current_url),
+                            partial(
+                                self._read_get,
+                                current_url,
+                                auth_headers,
+                                self.latency.timeout("profile", 10),
+                                KIND_LOGIN,
+                            ),
+                            lambda response: response.status == 200,
+                        )
+                        _LOGGER.debug("Session check status: %s", current_resp.status)
+                        if current_resp.status == 200:
+                            current_data = await current_resp.json()
+                            if current_data and "id" in current_data:
+                                _LOGGER.debug(
+                                    "Session is VALID for user %s. Login successful.",
+                                    current_data["id"],
+                                )
+                                self.user_id = str(current_data["id"])
+                                await self.async_save_session()
+                                return True
+                        else:
+                            if attempt < 2:
+                                wait_time = (attempt + 1) * 3
+                                _LOGGER.debug(
+                                    "Session check failed (status %s), jar has %d cookies. Retrying in %ds...",
+                                    current_resp.status,
+                                    len(list(self.session.cookie_jar)),
+                                    wait_time,
+                                )
+                                await asyncio.sleep(wait_time)
+                                continue
                     except Exception as err:
                         _LOGGER.debug("Session check exception (attempt %d): %s", attempt + 1, err)
                         if attempt < 2:
@@ -503,6 +1448,9 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                     mask_email(self.email),
                     "Yes" if totp else "No",
                 )
+                # Answers memoized for the old session must not be reused
+                self.coalescer.clear()
+                self.budget.async_record(KIND_LOGIN)
                 async with self.session.post(
                     login_url, json=login_payload, headers=self.authenticated_headers
                 ) as response:
@@ -535,6 +1483,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                         if not user_id:
                             # Fallback: get ID from current user endpoint
                             try:
+                                self.budget.async_record(KIND_LOGIN)
                                 async with self.session.get(
                                     f"{self.base_url}/api/users/current",
                                     headers=self.authenticated_headers,
@@ -572,10 +1521,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         url_conv = f"{self.base_url}/api/conversations"
         unread = 0
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url_count, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("unread_count", url_count, 10) as response:
                 if response.status == 200:
                     data = await response.json()
                     unread = data.get("unread", 0) if isinstance(data, dict) else 0
@@ -583,13 +1529,14 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                     raise AuthenticationFailed("Unauthorized access while fetching message count.")
 
             if unread > 0:
-                async with (
-                    asyncio.timeout(10),
-                    self.session.get(url_conv, headers=self.authenticated_headers) as response,
-                ):
+                async with self._request("conversations", url_conv, 10) as response:
                     if response.status == 200:
                         data = await response.json()
                         if isinstance(data, list):
+                            conversations = [conv for conv in data if isinstance(conv, dict)]
+                            self.search.update(
+                                (self.email, "conversations"), conversation_documents(conversations, self.email)
+                            )
                             for conv in data:
                                 if isinstance(conv, dict) and conv.get("unread", 0) > 0:
                                     msg_id = conv.get("last_message", {}).get("id")
@@ -613,10 +1560,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         """Fetch unread bell notifications count and trigger events."""
         url = f"{self.base_url}/api/bells"
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("bells", url, 10) as response:
                 if response.status == 200:
                     data = await response.json()
                     if isinstance(data, list):
@@ -641,10 +1585,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         """Fetch overall Foodsharing statistics."""
         url = f"{self.base_url}/api/statistics"
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("statistics", url, 10, shared_ttl=STATISTICS_TTL) as response:
                 if response.status == 200:
                     data = await response.json()
                     if isinstance(data, dict):
@@ -668,6 +1609,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                 dist,
                 dist * 1000,
             )
+            _clear_failed("baskets")
             baskets = await self._fetch_baskets_raw(entry_id, lat, lon, dist * 1000)
         return baskets
 
@@ -680,16 +1622,13 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         url = f"{self.base_url}/api/baskets/nearby?lat={f_lat}&lon={f_lon}&distance={i_dist}"
 
         try:
-            async with (
-                asyncio.timeout(15),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("baskets", url, 15, KIND_LOCATION, NEARBY_TTL) as response:
                 _LOGGER.debug("Baskets API %s returned status: %s", url, response.status)
                 if response.status == 200:
                     json_data = await response.json()
                     if not json_data:
                         _LOGGER.debug("Baskets API returned an empty 200 OK response")
-                    return self._process_baskets_for_location(entry_id, json_data)
+                    return self._process_baskets_for_location(entry_id, json_data, (float(lat), float(lon)))
 
                 if response.status == 401:
                     raise AuthenticationFailed("Unauthorized access, token might be expired.")
@@ -703,14 +1642,26 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
             _LOGGER.debug("Error in _fetch_baskets_raw: %s", e)
             return []
 
-    def _process_baskets_for_location(self, entry_id: str, json_data: Any) -> list[dict[str, Any]]:
-        """Process basket data for a specific location context."""
-        entry = self.entries.get(entry_id)
-        if not entry:
-            return []
+    def _filter_for(self, entry_id: str) -> BasketFilter:
+        """Return the basket filter of an entry, compiled on first use."""
+        basket_filter = self._filters.get(entry_id)
+        if basket_filter is None:
+            entry = self.entries[entry_id]
+            basket_filter = self._filters[entry_id] = BasketFilter({**entry.data, **entry.options})
+        return basket_filter
 
-        keywords_raw = entry.options.get(CONF_KEYWORDS, entry.data.get(CONF_KEYWORDS, "")) or ""
-        keywords = [k.strip().lower() for k in str(keywords_raw).split(",") if k.strip()]
+    def _process_baskets_for_location(
+        self, entry_id: str, json_data: Any, center: tuple[float, float] | None = None
+    ) -> list[dict[str, Any]]:
+        """Process basket data for a specific location context.
+
+        Baskets failing the entry's filter are dropped before they can reach
+        entities or fire events. center is the queried location.
+        """
+        if entry_id not in self.entries:
+            return []
+        basket_filter = self._filter_for(entry_id)
+        now = dt_util.utcnow()
 
         baskets: list[dict[str, Any]] = []
 
@@ -736,6 +1687,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         # Ensure all elements are dicts and have an ID
         baskets_data = [b for b in baskets_data if isinstance(b, dict) and b.get("id")]
         baskets_data = sorted(baskets_data, key=lambda x: str(x.get("id", "")), reverse=True)
+        new_matches: list[dict[str, Any]] = []
 
         for basket in baskets_data:
             basket_id = basket.get("id")
@@ -743,14 +1695,16 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                 continue
 
             until_str = "Unknown"
+            expires_at: datetime | None = None
             until_raw = basket.get("until")
             if until_raw:
                 try:
                     if isinstance(until_raw, (int, float)):
-                        until_str = datetime.fromtimestamp(until_raw, tz=UTC).strftime("%c")
+                        dt = datetime.fromtimestamp(until_raw, tz=UTC)
                     else:
                         dt = datetime.fromisoformat(str(until_raw).replace("Z", "+00:00"))
-                        until_str = dt.strftime("%c")
+                    until_str = dt.strftime("%c")
+                    expires_at = dt_util.as_utc(dt)
                 except Exception:
                     until_str = str(until_raw)
 
@@ -776,14 +1730,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
             )
 
             desc = basket.get("description") or ""
-            match_keywords = False
-
-            if keywords:
-                desc_lower = str(desc).lower()
-                for keyword in keywords:
-                    if keyword in desc_lower:
-                        match_keywords = True
-                        break
+            match_keywords = basket_filter.keyword_match(str(desc))
 
             user_name = basket.get("user_name")
             creator = basket.get("creator")
@@ -794,36 +1741,98 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                 "id": basket_id,
                 "description": desc,
                 "available_until": until_str,
+                "expires_at": expires_at,
                 "picture": picture,
                 "latitude": lat,
                 "longitude": lon,
                 "maps": maps_link,
                 "keyword_match": match_keywords,
                 "user_name": user_name,
+                "details": self.details.get(basket_id),
             }
 
+            if not basket_filter(parsed_basket, center, now):
+                continue
+
             if match_keywords and basket_id not in self._seen_baskets:
                 self._seen_baskets.add(basket_id)
                 if not self._is_first_update:
-                    self.hass.bus.async_fire(f"{DOMAIN}_keyword_match", parsed_basket)
+                    new_matches.append(parsed_basket)
 
             baskets.append(parsed_basket)
 
+        for parsed_basket in new_matches:
+            self.hass.bus.async_fire(f"{DOMAIN}_keyword_match", parsed_basket)
+        self._prefetch_details(baskets)
         return baskets
 
-    async def fetch_food_share_points_for_location(self, lat: float, lon: float, dist: float) -> list[dict[str, Any]]:
+    @callback
+    def _prefetch_details(self, baskets: list[dict[str, Any]]) -> None:
+        """Load the details of keyword matches and the newest baskets in the background.
+
+        This is best effort: the baskets get their details with the next poll
+        after they arrived, and nothing else waits for them.
+        """
+        if self._shut_down:
+            return
+        wanted = self.details.wanted(baskets)
+        if not wanted:
+            return
+        coro = self._async_fetch_details(wanted)
+        try:
+            task = self.hass.async_create_background_task(coro, f"{DOMAIN}_{self.email}_basket_details")
+        except Exception:
+            coro.close()
+            for basket_id in wanted:
+                self.details.release(basket_id)
+            raise
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _async_fetch_details(self, basket_ids: list[int]) -> None:
+        await asyncio.gather(*(self.fetch_basket_details(basket_id) for basket_id in basket_ids))
+
+    async def fetch_basket_details(self, basket_id: int) -> dict[str, Any] | None:
+        """Fetch the details of a basket unless they are cached."""
+        async with self._details_semaphore:
+            if (details := self.details.get(basket_id)) is not None:
+                return details
+            url = f"{self.base_url}/api/baskets/{basket_id}"
+            try:
+                async with self._request("basket_details", url, 10, KIND_DETAILS) as response:
+                    if response.status == 200:
+                        details = parse_details(await response.json(), self.base_url)
+                        if details is not None:
+                            self.details.put(basket_id, details)
+                            self.details.fetched += 1
+                    else:
+                        _LOGGER.debug("Basket %s details returned %s", basket_id, response.status)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _LOGGER.debug("Error fetching details of basket %s: %s", basket_id, e)
+            finally:
+                self.details.release(basket_id)
+        return details
+
+    async def fetch_food_share_points_for_location(
+        self, lat: float, lon: float, dist: float, fetch_walls: bool = True
+    ) -> list[dict[str, Any]]:
         """Fetch nearby Fairteiler for a specific location."""
-        points = await self._fetch_fairteiler_raw(lat, lon, dist)
+        points = await self._fetch_fairteiler_raw(lat, lon, dist, fetch_walls)
         if not points and dist < 100:
             _LOGGER.debug(
                 "0 fairteiler found with dist %s (km), retrying with %s (m)",
                 dist,
                 dist * 1000,
             )
-            points = await self._fetch_fairteiler_raw(lat, lon, dist * 1000)
+            _clear_failed("fairteiler")
+            points = await self._fetch_fairteiler_raw(lat, lon, dist * 1000, fetch_walls)
         return points
 
-    async def _fetch_fairteiler_raw(self, lat: float, lon: float, dist: float) -> list[dict[str, Any]]:
+    async def _fetch_fairteiler_raw(
+        self, lat: float, lon: float, dist: float, fetch_walls: bool = True
+    ) -> list[dict[str, Any]]:
         """Fetch nearby Fairteiler for a specific location using raw parameters."""
         url = f"{self.base_url}/api/foodSharePoints/nearby?lat={lat}&lon={lon}&distance={dist}"
         points: list[dict[str, Any]] = []
@@ -836,12 +1845,11 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                 async with semaphore:
                     wall_url = f"{self.base_url}/api/fairteiler/{fp_id}/wall"
                     try:
-                        async with (
-                            asyncio.timeout(5),
-                            self.session.get(wall_url, headers=self.authenticated_headers) as wall_res,
-                        ):
+                        async with self._request("fairteiler_wall", wall_url, 5, KIND_WALLS, NEARBY_TTL) as wall_res:
                             if wall_res.status == 200:
                                 wall_data = await wall_res.json()
+                                # Without a successful answer the key stays unset and the last post is kept
+                                fp_entry["latest_post"] = None
                                 if isinstance(wall_data, list) and len(wall_data) > 0:
                                     latest_post = wall_data[0]
                                     fp_entry["latest_post"] = latest_post
@@ -869,10 +1877,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                             e,
                         )
 
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("fairteiler", url, 10, KIND_LOCATION, NEARBY_TTL) as response:
                 if response.status == 200:
                     json_data = await response.json()
                     fairteiler_data = []
@@ -887,34 +1892,23 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
                     if not fairteiler_data and json_data:
                         _LOGGER.debug("Fairteiler API returned data but no list found or empty.")
 
+                    now = dt_util.utcnow()
                     for fp in fairteiler_data:
                         if not isinstance(fp, dict):
                             continue
                         fp_id = fp.get("id")
-                        fp_name = fp.get("name", "Unknown Fairteiler")
-
-                        picture = fp.get("picture")
-                        if picture and not picture.startswith("http"):
-                            picture = f"{self.base_url}{picture}"
-
-                        desc = fp.get("desc")
-                        if not desc or desc == "Unknown":
-                            desc = fp.get("description", desc)
-
-                        fp_entry = {
-                            "id": fp_id,
-                            "name": fp_name,
-                            "latitude": fp.get("lat"),
-                            "longitude": fp.get("lon"),
-                            "description": desc,
-                            "address": fp.get("address"),
-                            "picture": picture,
-                            "latest_post": None,
-                        }
+                        metadata = self.metadata.get(fp_id, now) if isinstance(fp_id, int) else None
+                        if metadata is None:
+                            metadata = self._parse_fairteiler(fp)
+                            if isinstance(fp_id, int):
+                                self.metadata.async_put(fp_id, metadata, now)
+
+                        # Only the wall is added per poll; the metadata values are shared with the cache
+                        fp_entry = dict(metadata)
                         points.append(fp_entry)
 
-                        if fp_id:
-                            wall_tasks.append(fetch_wall(fp_id, fp_name, fp_entry))
+                        if fp_id and fetch_walls:
+                            wall_tasks.append(fetch_wall(fp_id, fp_entry["name"], fp_entry))
                 elif response.status == 401:
                     raise AuthenticationFailed("Unauthorized access while fetching fairteiler.")
                 else:
@@ -927,21 +1921,38 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         except AuthenticationFailed, asyncio.CancelledError:
             raise
         except Exception as e:
-            _LOGGER.error("Error fetching fairteiler for location: %s", e)
+            _LOGGER.debug("Error fetching fairteiler for location: %s", e)
             return []
 
         return points
 
+    def _parse_fairteiler(self, fp: dict[str, Any]) -> dict[str, Any]:
+        """Return the metadata of a Fairteiler from the nearby answer."""
+        picture = fp.get("picture")
+        if picture and not picture.startswith("http"):
+            picture = f"{self.base_url}{picture}"
+
+        desc = fp.get("desc")
+        if not desc or desc == "Unknown":
+            desc = fp.get("description", desc)
+
+        return {
+            "id": fp.get("id"),
+            "name": fp.get("name", "Unknown Fairteiler"),
+            "latitude": fp.get("lat"),
+            "longitude": fp.get("lon"),
+            "description": desc,
+            "address": fp.get("address"),
+            "picture": picture,
+        }
+
     async def fetch_pickups(self) -> list[dict[str, Any]]:
         """Fetch upcoming pickups for the user."""
         user_id = self.user_id or "current"
         url = f"{self.base_url}/api/users/{user_id}/pickups/registered"
 
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("pickups", url, 10) as response:
                 if response.status == 200:
                     data = await response.json()
                     if isinstance(data, list):
@@ -963,17 +1974,14 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         except AuthenticationFailed, UpdateFailed:
             raise
         except Exception as e:
-            _LOGGER.error("Error fetching pickups: %s", e)
+            _LOGGER.debug("Error fetching pickups: %s", e)
         return []
 
     async def fetch_own_baskets(self) -> list[dict[str, Any]]:
         """Fetch active baskets created by the user."""
         url = f"{self.base_url}/api/baskets/own"
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("own_baskets", url, 10) as response:
                 if response.status == 200:
                     data = await response.json()
                     if isinstance(data, list):
@@ -999,10 +2007,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         user_id = self.user_id or "current"
         url = f"{self.base_url}/api/users/{user_id}/stats"
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("user_stats", url, 10) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data if isinstance(data, dict) else {}
@@ -1018,10 +2023,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         """Fetch current user profile."""
         url = f"{self.base_url}/api/users/current"
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("profile", url, 10) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data if isinstance(data, dict) else {}
@@ -1034,10 +2036,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         user_id = self.user_id or "current"
         url = f"{self.base_url}/api/users/{user_id}/bananas/meta"
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("bananas", url, 10) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data if isinstance(data, dict) else {}
@@ -1049,10 +2048,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         """Fetch user buddylist."""
         url = f"{self.base_url}/api/users/current/buddies"
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("buddies", url, 10) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data if isinstance(data, list) else []
@@ -1064,10 +2060,7 @@ class FoodsharingCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ig
         """Fetch statistics for a specific region."""
         url = f"{self.base_url}/api/regions/{region_id}/statistics"
         try:
-            async with (
-                asyncio.timeout(10),
-                self.session.get(url, headers=self.authenticated_headers) as response,
-            ):
+            async with self._request("region_stats", url, 10, shared_ttl=STATISTICS_TTL) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data if isinstance(data, dict) else {}
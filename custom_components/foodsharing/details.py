@@ -0,0 +1,88 @@
+"""Basket details prefetched for the baskets most likely to be wanted."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+# Newest baskets of a location that get their details besides keyword matches
+PREFETCH_TOP = 3
+# Detail requests running at the same time
+PREFETCH_CONCURRENCY = 2
+# Details of baskets seen longest ago are dropped beyond this
+MAX_CACHED = 500
+
+
+def parse_details(data: Any, base_url: str) -> dict[str, Any] | None:
+    """Return the details of a basket from the /api/baskets/{id} answer."""
+    if not isinstance(data, dict):
+        return None
+    basket = data.get("basket", data)
+    if not isinstance(basket, dict):
+        return None
+
+    pictures = basket.get("pictures")
+    if not isinstance(pictures, list):
+        pictures = [basket["picture"]] if basket.get("picture") else []
+    creator = basket.get("creator")
+
+    return {
+        "description": basket.get("description"),
+        "pictures": [p if p.startswith("http") else f"{base_url}{p}" for p in pictures if isinstance(p, str)],
+        "created_at": basket.get("createdAt"),
+        "until": basket.get("until"),
+        "contact_types": basket.get("contactTypes") or [],
+        "request_count": basket.get("requestCount"),
+        "creator": creator.get("name") if isinstance(creator, dict) else None,
+    }
+
+
+class BasketDetails:
+    """Details of baskets by id.
+
+    A basket's details don't change once it is published, so entries never
+    expire; only the cache size is bounded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._details: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._pending: set[int] = set()
+        self.fetched = 0
+
+    def get(self, basket_id: int) -> dict[str, Any] | None:
+        """Return the cached details of a basket."""
+        details = self._details.get(basket_id)
+        if details is not None:
+            self._details.move_to_end(basket_id)
+        return details
+
+    def put(self, basket_id: int, details: dict[str, Any]) -> None:
+        """Cache the details of a basket."""
+        self._details[basket_id] = details
+        self._details.move_to_end(basket_id)
+        while len(self._details) > MAX_CACHED:
+            self._details.popitem(last=False)
+
+    def wanted(self, baskets: list[dict[str, Any]]) -> list[int]:
+        """Return the ids to prefetch: keyword matches and the newest baskets without details.
+
+        The returned ids count as pending until they are released.
+        """
+        ids = [b["id"] for b in baskets if b.get("keyword_match")]
+        ids += [b["id"] for b in baskets[:PREFETCH_TOP]]
+        wanted = [
+            basket_id
+            for basket_id in dict.fromkeys(ids)
+            if basket_id not in self._details and basket_id not in self._pending
+        ]
+        self._pending.update(wanted)
+        return wanted
+
+    def release(self, basket_id: int) -> None:
+        """Note that a prefetch finished, successful or not."""
+        self._pending.discard(basket_id)
+
+    def __len__(self) -> int:
+        """Return the number of cached details."""
+        return len(self._details)
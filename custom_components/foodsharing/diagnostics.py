@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 from .const import CONF_EMAIL, CONF_PASSWORD, DOMAIN
 
@@ -34,5 +35,28 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
         diagnostics_data["data"] = (
             async_redact_data(coordinator.data, TO_REDACT) if coordinator.data is not None else None
         )
+        diagnostics_data["latency"] = coordinator.latency.as_dict()
+        diagnostics_data["retry"] = coordinator.retry.as_dict()
+        diagnostics_data["circuits"] = coordinator.breaker.as_dict(dt_util.utcnow())
+        diagnostics_data["coalesced_requests"] = coordinator.coalescer.coalesced
+        diagnostics_data["shared_requests"] = coordinator.shared.coalesced
+        diagnostics_data["basket_details"] = {
+            "cached": len(coordinator.details),
+            "fetched": coordinator.details.fetched,
+        }
+        diagnostics_data["fairteiler_metadata"] = {
+            "cached": len(coordinator.metadata),
+            "hits": coordinator.metadata.hits,
+        }
+        if (follow := coordinator.follows.get(entry.entry_id)) is not None:
+            # The followed position itself is left out
+            diagnostics_data["follow"] = {
+                "moves": follow.moves,
+                "cached_cells": len(follow),
+                "cell_hits": follow.cell_hits,
+            }
+        diagnostics_data["stale"] = sorted(
+            "account" if context is None else "_".join(map(str, context)) for context in coordinator.stale
+        )
 
     return diagnostics_data
@@ -0,0 +1,97 @@
+"""Per-entry basket filters compiled from the entry options."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import (
+    CONF_CREATORS_ALLOWED,
+    CONF_CREATORS_DENIED,
+    CONF_EXCLUDE_KEYWORDS,
+    CONF_KEYWORDS,
+    CONF_MAX_BASKET_DISTANCE,
+    CONF_MIN_TIME_LEFT,
+    CONF_ONLY_KEYWORD_MATCHES,
+    CONF_REQUIRE_PICTURE,
+)
+from .spatial import haversine
+
+Check = Callable[[dict[str, Any], tuple[float, float] | None, datetime], bool]
+
+
+def _terms(value: Any) -> list[str]:
+    """Return the lowercased entries of a comma-separated option."""
+    return [term.strip().lower() for term in str(value or "").split(",") if term.strip()]
+
+
+def _any_of(terms: list[str]) -> Callable[[str], bool] | None:
+    """Return a test whether a lowercased text contains any of the terms, None without terms."""
+    if not terms:
+        return None
+    pattern = re.compile("|".join(map(re.escape, terms)))
+    return lambda text: pattern.search(text) is not None
+
+
+class BasketFilter:
+    """The baskets an entry is interested in, compiled once from its options.
+
+    Only the conditions that are configured become checks, so an entry
+    without filter options accepts every basket at no cost. Keywords keep
+    marking matches; they only filter with the keyword-matches-only option.
+    """
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        """Compile the filter options of an entry."""
+        self._keywords = _any_of(_terms(options.get(CONF_KEYWORDS)))
+        self._min_time_left = timedelta(minutes=float(options.get(CONF_MIN_TIME_LEFT) or 0))
+        checks: list[Check] = []
+
+        if options.get(CONF_ONLY_KEYWORD_MATCHES) and self._keywords is not None:
+            checks.append(lambda basket, center, now: basket["keyword_match"])
+
+        if (exclude := _any_of(_terms(options.get(CONF_EXCLUDE_KEYWORDS)))) is not None:
+            checks.append(lambda basket, center, now: not exclude(str(basket["description"]).lower()))
+
+        if max_distance := options.get(CONF_MAX_BASKET_DISTANCE):
+            meters = float(max_distance) * 1000
+
+            def within(basket: dict[str, Any], center: tuple[float, float] | None, now: datetime) -> bool:
+                if center is None or basket["latitude"] is None or basket["longitude"] is None:
+                    return True
+                return haversine(*center, float(basket["latitude"]), float(basket["longitude"])) <= meters
+
+            checks.append(within)
+
+        if self._min_time_left:
+            left = self._min_time_left
+            checks.append(
+                lambda basket, center, now: basket["expires_at"] is None or basket["expires_at"] - now >= left
+            )
+
+        if options.get(CONF_REQUIRE_PICTURE):
+            checks.append(lambda basket, center, now: bool(basket["picture"]))
+
+        if allowed := set(_terms(options.get(CONF_CREATORS_ALLOWED))):
+            checks.append(lambda basket, center, now: str(basket["user_name"] or "").lower() in allowed)
+
+        if denied := set(_terms(options.get(CONF_CREATORS_DENIED))):
+            checks.append(lambda basket, center, now: str(basket["user_name"] or "").lower() not in denied)
+
+        self._checks = tuple(checks)
+
+    def keyword_match(self, description: str) -> bool:
+        """Return whether a basket description contains one of the keywords."""
+        return self._keywords is not None and self._keywords(description.lower())
+
+    def removal_time(self, basket: dict[str, Any]) -> datetime | None:
+        """Return when a basket stops passing the filter by running out of time, None if never."""
+        if basket.get("expires_at") is None:
+            return None
+        return basket["expires_at"] - self._min_time_left
+
+    def __call__(self, basket: dict[str, Any], center: tuple[float, float] | None, now: datetime) -> bool:
+        """Return whether a parsed basket passes all configured conditions."""
+        return all(check(basket, center, now) for check in self._checks)
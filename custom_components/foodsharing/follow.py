@@ -0,0 +1,100 @@
+"""Search location following a person or device tracker."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any
+
+from .spatial import CELL_SIZE, haversine
+
+# Recently visited cells whose last results are kept
+MAX_CELLS = 8
+# Cached results older than this are fetched again instead
+CELL_MAX_AGE = timedelta(minutes=30)
+
+
+def snap(lat: float, lon: float) -> tuple[float, float]:
+    """Return the center of the grid cell containing a position."""
+    return (
+        round((math.floor(lat / CELL_SIZE) + 0.5) * CELL_SIZE, 6),
+        round((math.floor(lon / CELL_SIZE) + 0.5) * CELL_SIZE, 6),
+    )
+
+
+class FollowLocation:
+    """Search center of a location tied to a tracker.
+
+    The center is snapped to a grid cell, so revisiting a place queries the
+    same center and finds its cached results. It only moves once the tracker
+    is more than threshold meters from where it settled last and has stayed
+    within threshold of its new position for the dwell time, so passing through
+    does not cost requests. Distances are measured between tracker positions,
+    not from the cell center, which can be farther away than the threshold.
+    """
+
+    def __init__(self, threshold: float, dwell: timedelta) -> None:
+        """Initialize the location with a threshold in meters and a dwell time."""
+        self.threshold = threshold
+        self.dwell = dwell
+        self.center: tuple[float, float] | None = None
+        # Tracker position the center was last taken from
+        self._anchor: tuple[float, float] | None = None
+        # Center of the running fetch, whose results are cached for it
+        self.requested: tuple[float, float] | None = None
+        self._candidate: tuple[float, float] | None = None
+        self._since: datetime | None = None
+        self._cells: OrderedDict[tuple[float, float], tuple[datetime, dict[str, Any]]] = OrderedDict()
+        self.moves = 0
+        self.cell_hits = 0
+
+    @property
+    def due(self) -> datetime | None:
+        """Return when the dwell time at the tracker's new position is over."""
+        if self._since is None:
+            return None
+        return self._since + self.dwell
+
+    def observe(self, lat: float, lon: float, now: datetime) -> bool:
+        """Note a tracker position. Return whether the center moved."""
+        if self.center is None or self._anchor is None:
+            self._anchor = (lat, lon)
+            self.center = snap(lat, lon)
+            return True
+        if haversine(*self._anchor, lat, lon) <= self.threshold:
+            self._candidate = self._since = None
+            return False
+        if self._candidate is None or haversine(*self._candidate, lat, lon) > self.threshold:
+            # Left the center or still on the way, wait until it settles
+            self._candidate, self._since = (lat, lon), now
+        if now - self._since < self.dwell:
+            return False
+        self._anchor = (lat, lon)
+        self._candidate = self._since = None
+        if snap(lat, lon) == self.center:
+            return False
+        self.center = snap(lat, lon)
+        self.moves += 1
+        return True
+
+    def store(self, center: tuple[float, float], data: dict[str, Any], now: datetime) -> None:
+        """Cache the results fetched for a center."""
+        self._cells[center] = (now, data)
+        self._cells.move_to_end(center)
+        while len(self._cells) > MAX_CELLS:
+            self._cells.popitem(last=False)
+
+    def cached(self, now: datetime) -> dict[str, Any] | None:
+        """Return the recent results for the current center, if any."""
+        if self.center is None or (cell := self._cells.get(self.center)) is None:
+            return None
+        fetched_at, data = cell
+        if now - fetched_at > CELL_MAX_AGE:
+            return None
+        self.cell_hits += 1
+        return data
+
+    def __len__(self) -> int:
+        """Return the number of cached cells."""
+        return len(self._cells)
@@ -0,0 +1,58 @@
+"""Freshness of the data the Foodsharing coordinator serves."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from datetime import datetime, timedelta
+from typing import Any
+
+# How long the last good value is served while fetching it fails
+MAX_AGE = timedelta(hours=6)
+# Statistics are only refreshed once a day and may get older
+STATS_MAX_AGE = timedelta(days=2)
+
+
+class Freshness:
+    """When each piece of data was last fetched successfully, and which are stale.
+
+    Keys are the account result names and ``(entry_id, loc_idx, part)`` for
+    the baskets and Fairteiler of a location.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.fetched_at: dict[Hashable, datetime] = {}
+        self.failed: set[Hashable] = set()
+
+    def record(self, key: Hashable, now: datetime) -> None:
+        """Note a successful fetch."""
+        self.fetched_at[key] = now
+        self.failed.discard(key)
+
+    def record_failure(self, key: Hashable) -> None:
+        """Note a failed fetch; the last good value becomes stale."""
+        self.failed.add(key)
+
+    def servable(self, key: Hashable, now: datetime, max_age: timedelta = MAX_AGE) -> bool:
+        """Return whether the last good value is young enough to be served instead of a default."""
+        fetched_at = self.fetched_at.get(key)
+        return fetched_at is not None and now - fetched_at <= max_age
+
+    def prune(self, entry_id: str) -> None:
+        """Forget the location data of a removed entry."""
+        self.fetched_at = {
+            key: at for key, at in self.fetched_at.items() if not (isinstance(key, tuple) and key[0] == entry_id)
+        }
+        self.failed = {key for key in self.failed if not (isinstance(key, tuple) and key[0] == entry_id)}
+
+    def attributes(self, keys: list[Hashable], now: datetime) -> dict[str, Any]:
+        """Return whether any of the given data is stale and, if so, the minutes since its oldest good fetch.
+
+        Fresh data has no age, so entities don't write a new state on every poll.
+        """
+        stale = any(key in self.failed for key in keys)
+        fetched = [self.fetched_at[key] for key in keys if key in self.fetched_at]
+        return {
+            "data_age": round((now - min(fetched)).total_seconds() / 60) if stale and fetched else None,
+            "stale": stale,
+        }
@@ -119,7 +119,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                         registry.async_remove(entity_id)
 
     # Register listener
-    unsub = coordinator.async_add_listener(async_update_entities)
+    unsub = coordinator.async_add_listener(async_update_entities, entry.entry_id)
     entry.async_on_unload(unsub)
 
     # Initial load
@@ -140,7 +140,7 @@ class FoodsharingBasketGeoLocation(CoordinatorEntity[FoodsharingCoordinator], Ge
         email: str,
     ) -> None:
         """Initialize entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(entry.entry_id, loc_idx))
         self.entry = entry
         self._basket_id = str(basket["id"])
         self._loc_idx = loc_idx
@@ -237,7 +237,7 @@ class FoodsharingFairteilerGeoLocation(CoordinatorEntity[FoodsharingCoordinator]
         email: str,
     ) -> None:
         """Initialize entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(entry.entry_id, loc_idx))
         self.entry = entry
         self._fp_id = unique_id
         self._loc_idx = loc_idx
@@ -0,0 +1,64 @@
+"""Latency tracking and adaptive timeouts for the Foodsharing API."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any
+
+# Recent request durations kept per endpoint
+SAMPLES = 50
+# Samples needed before the static timeout is replaced
+MIN_SAMPLES = 5
+PERCENTILE = 0.95
+# Timeout as a multiple of the recent p95 latency
+HEADROOM = 3.0
+# Bounds for adapted timeouts: an absolute floor, and a multiple of the static timeout
+FLOOR = 2.0
+CEILING_FACTOR = 2.0
+
+
+class LatencyTracker:
+    """Measure request latency per endpoint and derive timeouts from it.
+
+    Once an endpoint has a few samples, its timeout is a multiple of the recent
+    p95 latency: hung requests on a fast API fail quickly, while a slow but
+    responsive API gets up to twice the static timeout.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._samples: dict[str, deque[float]] = {}
+        self._defaults: dict[str, float] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the duration of a request."""
+        self._samples.setdefault(endpoint, deque(maxlen=SAMPLES)).append(seconds)
+
+    def percentile(self, endpoint: str, q: float = PERCENTILE) -> float | None:
+        """Return a latency percentile of an endpoint, or None without enough samples."""
+        samples = self._samples.get(endpoint)
+        if not samples or len(samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(math.ceil(q * len(ordered)) - 1, len(ordered) - 1)]
+
+    def timeout(self, endpoint: str, default: float) -> float:
+        """Return the timeout in seconds for the next request to an endpoint."""
+        self._defaults[endpoint] = default
+        p95 = self.percentile(endpoint)
+        if p95 is None:
+            return default
+        return min(max(p95 * HEADROOM, FLOOR), default * CEILING_FACTOR)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return latency percentiles and current timeouts for diagnostics."""
+        return {
+            endpoint: {
+                "samples": len(samples),
+                "p50": self.percentile(endpoint, 0.5),
+                "p95": self.percentile(endpoint),
+                "timeout": self.timeout(endpoint, self._defaults[endpoint]) if endpoint in self._defaults else None,
+            }
+            for endpoint, samples in self._samples.items()
+        }
@@ -0,0 +1,83 @@
+"""Persistent cache of Fairteiler metadata shared by all accounts."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 300
+
+# Names, addresses and pictures of Fairteiler hardly ever change
+METADATA_TTL = timedelta(days=3)
+
+
+class MetadataCache:
+    """Parsed Fairteiler metadata by id, kept across restarts.
+
+    A cached entry is reused instead of parsing the same Fairteiler again on
+    every poll, and all locations and accounts share the same objects. Entries
+    are refreshed from the next answer that contains them once they expire.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}_fairteiler")
+        self._entries: dict[int, tuple[datetime, dict[str, Any]]] = {}
+        self.hits = 0
+
+    async def async_load(self) -> None:
+        """Load the entries that have not expired yet."""
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Could not load Fairteiler metadata: %s", e)
+            return
+        if not isinstance(data, dict):
+            return
+
+        now = dt_util.utcnow()
+        for fp_id, entry in data.get("fairteiler", {}).items():
+            if not isinstance(entry, dict) or not isinstance(entry.get("metadata"), dict):
+                continue
+            fetched_at = dt_util.parse_datetime(entry.get("fetched_at") or "")
+            if fetched_at is not None and now - fetched_at < METADATA_TTL:
+                self._entries.setdefault(int(fp_id), (fetched_at, entry["metadata"]))
+        _LOGGER.debug("Loaded metadata of %d Fairteiler", len(self._entries))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        now = dt_util.utcnow()
+        return {
+            "fairteiler": {
+                str(fp_id): {"fetched_at": fetched_at.isoformat(), "metadata": metadata}
+                for fp_id, (fetched_at, metadata) in self._entries.items()
+                if now - fetched_at < METADATA_TTL
+            }
+        }
+
+    def get(self, fp_id: int, now: datetime) -> dict[str, Any] | None:
+        """Return the cached metadata of a Fairteiler, None if unknown or expired."""
+        entry = self._entries.get(fp_id)
+        if entry is None or now - entry[0] >= METADATA_TTL:
+            return None
+        self.hits += 1
+        return entry[1]
+
+    @callback
+    def async_put(self, fp_id: int, metadata: dict[str, Any], now: datetime) -> None:
+        """Cache freshly parsed metadata."""
+        self._entries[fp_id] = (now, metadata)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def __len__(self) -> int:
+        """Return the number of cached Fairteiler."""
+        return len(self._entries)
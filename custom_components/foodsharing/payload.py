@@ -0,0 +1,77 @@
+"""Buffered Foodsharing API responses and their JSON decoding."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+# Bodies beyond this are refused to guard memory
+MAX_BODY_SIZE = 8 * 1024 * 1024
+# Larger bodies are decoded in the executor so they don't block the event loop
+EXECUTOR_THRESHOLD = 256 * 1024
+
+_UNDECODED = object()
+
+
+class PayloadTooLarge(Exception):
+    """Raised for a response body beyond MAX_BODY_SIZE."""
+
+
+def check_size(size: int | None) -> None:
+    """Raise PayloadTooLarge if a body of the given size, if known, may not be read."""
+    if isinstance(size, int) and size > MAX_BODY_SIZE:
+        raise PayloadTooLarge(f"Response body of {size} bytes exceeds {MAX_BODY_SIZE}")
+
+
+async def read_body(response: aiohttp.ClientResponse) -> bytes:
+    """Read a response body, refusing it as soon as it exceeds MAX_BODY_SIZE.
+
+    Chunked responses announce no length, so the body is read in pieces and
+    at most one byte beyond the cap is ever held.
+    """
+    check_size(response.content_length)
+    body = bytearray()
+    while chunk := await response.content.read(MAX_BODY_SIZE + 1 - len(body)):
+        body += chunk
+        check_size(len(body))
+    return bytes(body)
+
+
+class BufferedResponse:
+    """Status, headers and body of an answered GET request.
+
+    Several callers may share one response. Its body is decoded at most once,
+    with the orjson-based decoder of Home Assistant, and the callers share the
+    result, so they must not modify it.
+    """
+
+    def __init__(self, hass: HomeAssistant, status: int, headers: Mapping[str, str], body: bytes) -> None:
+        """Initialize the response."""
+        self._hass = hass
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self._decoded: Any = _UNDECODED
+
+    async def read(self) -> bytes:
+        """Return the raw body."""
+        return self.body
+
+    async def text(self) -> str:
+        """Return the body as text."""
+        return self.body.decode("utf-8", errors="replace")
+
+    async def json(self) -> Any:
+        """Return the decoded body, None if it is empty."""
+        if self._decoded is _UNDECODED:
+            if not self.body.strip():
+                self._decoded = None
+            elif len(self.body) > EXECUTOR_THRESHOLD:
+                self._decoded = await self._hass.async_add_executor_job(json_loads, self.body)
+            else:
+                self._decoded = json_loads(self.body)
+        return self._decoded
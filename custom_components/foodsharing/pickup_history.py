@@ -0,0 +1,149 @@
+"""Persistent pickup history for the Foodsharing calendar."""
+
+from __future__ import annotations
+
+import logging
+import time
+from bisect import bisect_left, insort
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 300
+
+# A pickup that disappeared from the API counts as done if it was still
+# registered this close to its start time; otherwise the user signed out.
+DONE_MARGIN = 86400.0
+
+DISPLAY_FIELDS = ("store_name", "description", "location")
+
+
+def _pickup_start(pickup: dict[str, Any]) -> float | None:
+    """Return the pickup start as a UTC timestamp."""
+    start = pickup.get("time")
+    if start is None:
+        start = pickup.get("date")
+    if start is None:
+        return None
+    try:
+        return float(start)
+    except ValueError, TypeError:
+        _LOGGER.warning("Could not parse pickup time: %s", start)
+        return None
+
+
+class PickupHistory:
+    """Append-only, time-indexed store of every pickup seen for an account.
+
+    The API only lists currently registered pickups. Records are never removed,
+    so past pickups stay available for calendar range queries without API calls.
+    """
+
+    def __init__(self, hass: HomeAssistant, email: str) -> None:
+        """Initialize the history."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}_pickup_history_{email.replace('@', '_').replace('.', '_')}",
+        )
+        self._records: dict[str, dict[str, Any]] = {}
+        # Sorted (start, key) pairs for range queries
+        self._index: list[tuple[float, str]] = []
+        self._live: set[str] = set()
+        self.revision = 0
+
+    async def async_load(self) -> None:
+        """Load the history from storage."""
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Could not load pickup history: %s", e)
+            return
+        if not isinstance(data, dict):
+            return
+
+        for record in data.get("pickups", []):
+            if isinstance(record, dict) and "key" in record and "start" in record:
+                self._records[record["key"]] = record
+        self._index = sorted((r["start"], k) for k, r in self._records.items())
+        self._live = {k for k in data.get("live", []) if k in self._records}
+        self.revision += 1
+        _LOGGER.debug("Loaded %d pickups from history", len(self._records))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"pickups": list(self._records.values()), "live": sorted(self._live)}
+
+    @callback
+    def async_merge(self, pickups: list[dict[str, Any]]) -> bool:
+        """Merge the currently registered pickups. Return True if the history changed."""
+        now = time.time()
+        changed = False
+        # last_seen only matters to storage once it proves a pickup was done
+        seen_in_margin = False
+        live: set[str] = set()
+
+        for pickup in pickups:
+            if not isinstance(pickup, dict):
+                continue
+            start = _pickup_start(pickup)
+            if start is None:
+                continue
+
+            pickup_id = pickup.get("id")
+            key = str(pickup_id) if pickup_id is not None else f"{start:.0f}_{pickup.get('store_name', '')}"
+            live.add(key)
+
+            record = self._records.get(key)
+            display = {field: pickup.get(field, "") for field in DISPLAY_FIELDS}
+            if record is None or record["start"] != start:
+                if record is not None:
+                    self._index.remove((record["start"], key))
+                self._records[key] = {"key": key, "start": start, **display, "last_seen": now}
+                insort(self._index, (start, key))
+                changed = True
+            elif any(record.get(field) != value for field, value in display.items()):
+                # Replace rather than mutate so cached consumers can compare by identity
+                self._records[key] = {**record, **display, "last_seen": now}
+                changed = True
+            else:
+                seen_in_margin |= record.get("last_seen", 0) < start - DONE_MARGIN <= now
+                record["last_seen"] = now
+
+        if live != self._live:
+            self._live = live
+            changed = True
+
+        if changed:
+            self.revision += 1
+        if changed or seen_in_margin:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return changed
+
+    def _counts(self, record: dict[str, Any], now: float) -> bool:
+        """Return whether a record is a pickup that is or was actually registered."""
+        if record["key"] in self._live:
+            return True
+        if record["start"] > now:
+            return False
+        return bool(record.get("last_seen", 0) >= record["start"] - DONE_MARGIN)
+
+    def between(self, start: float, end: float, max_duration: float = 0.0) -> list[dict[str, Any]]:
+        """Return pickups starting in ``[start - max_duration, end)``, sorted by start."""
+        now = time.time()
+        lo = bisect_left(self._index, (start - max_duration, ""))
+        hi = bisect_left(self._index, (end, ""))
+        return [record for _, key in self._index[lo:hi] if self._counts(record := self._records[key], now)]
+
+    def all(self) -> list[dict[str, Any]]:
+        """Return all pickups that count, sorted by start."""
+        return self.between(float("-inf"), float("inf"))
+
+    def __len__(self) -> int:
+        """Return the number of stored records."""
+        return len(self._records)
@@ -0,0 +1,115 @@
+"""Retry policy and API cooldowns for the Foodsharing coordinator."""
+
+from __future__ import annotations
+
+import logging
+import random
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# Responses worth another attempt; everything else is final
+RETRY_STATUSES = {429, 502, 503, 504}
+MAX_ATTEMPTS = 3
+BASE_DELAY = 1.0
+# Longer waits are not slept through inline but turn into a cooldown
+MAX_INLINE_DELAY = 10.0
+MAX_COOLDOWN = timedelta(hours=1)
+
+
+class RateLimited(Exception):
+    """Raised instead of sending a request while the API asked us to back off."""
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return a full-jitter exponential backoff delay in seconds for a failed attempt."""
+    return random.uniform(0, min(MAX_INLINE_DELAY, BASE_DELAY * 2**attempt))
+
+
+def parse_retry_after(value: str | None, now: datetime) -> float | None:
+    """Return the seconds to wait from a Retry-After header (delta seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if when.tzinfo is None:
+        return None
+    return max((when - now).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """Cooldowns requested by the API, per base URL, kept across restarts."""
+
+    def __init__(self, hass: HomeAssistant, email: str) -> None:
+        """Initialize the policy."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}_cooldowns_{email.replace('@', '_').replace('.', '_')}",
+        )
+        self._cooldowns: dict[str, datetime] = {}
+        self.retries = 0
+        self.hedged = 0
+
+    async def async_load(self) -> None:
+        """Load cooldowns that are still running."""
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Could not load API cooldowns: %s", e)
+            return
+        if not isinstance(data, dict):
+            return
+
+        now = dt_util.utcnow()
+        for key, until in data.get("cooldowns", {}).items():
+            parsed = dt_util.parse_datetime(until) if isinstance(until, str) else None
+            if parsed is not None and parsed > now:
+                self._cooldowns[key] = parsed
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"cooldowns": {key: until.isoformat() for key, until in self._cooldowns.items()}}
+
+    def cooldown_remaining(self, key: str, now: datetime) -> float:
+        """Return the seconds left of a cooldown, 0 if there is none."""
+        until = self._cooldowns.get(key)
+        if until is None:
+            return 0.0
+        if until <= now:
+            del self._cooldowns[key]
+            return 0.0
+        return (until - now).total_seconds()
+
+    @callback
+    def async_set_cooldown(self, key: str, seconds: float, now: datetime) -> None:
+        """Stop sending requests for a while, as asked by the API."""
+        until = now + min(timedelta(seconds=seconds), MAX_COOLDOWN)
+        if until <= self._cooldowns.get(key, now):
+            return
+        _LOGGER.warning("Foodsharing API asked to back off, pausing requests to %s until %s", key, until)
+        self._cooldowns[key] = until
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cooldowns and counters for diagnostics."""
+        return {
+            "cooldowns": {key: until.isoformat() for key, until in self._cooldowns.items()},
+            "retries": self.retries,
+            "hedged": self.hedged,
+        }
@@ -0,0 +1,220 @@
+"""Adaptive polling for the Foodsharing coordinator."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import random
+from collections.abc import Mapping
+from datetime import datetime, time, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_ACTIVE_ENTITIES,
+    CONF_ACTIVE_HOURS_END,
+    CONF_ACTIVE_HOURS_START,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 600
+
+# One bucket per hour of the week, Monday 0:00 first
+BUCKETS = 7 * 24
+
+# Observed minutes kept per bucket (8 weeks); older observations are scaled
+# down so the model follows changing habits.
+WINDOW_MINUTES = 8 * 60.0
+
+# A single observation never counts for more than this, e.g. after a restart
+MAX_OBSERVATION_MINUTES = 60.0
+
+# Pseudo-observation minutes at the location's overall rate, smoothing sparse buckets
+PRIOR_MINUTES = 120.0
+
+# Observed minutes required before the model is trusted at all
+MIN_TOTAL_MINUTES = 24 * 60.0
+
+# Expected number of new baskets between two polls
+TARGET_ARRIVALS_PER_POLL = 0.25
+
+# Random spread around each slot, as a fraction of the interval
+JITTER_FRACTION = 0.05
+
+# Entity states that enable the fast polling profile (person home, switch on)
+ACTIVE_STATES = {"home", "on"}
+
+
+def location_key(loc: dict[str, Any]) -> str:
+    """Return the key identifying a search location in the activity model."""
+    return f"{loc['latitude']}_{loc['longitude']}_{loc.get('distance', 7)}"
+
+
+def phase_offset(*parts: str) -> float:
+    """Return a stable fraction in [0, 1) for the given identifiers."""
+    digest = hashlib.sha256("|".join(parts).encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+def next_due(now: datetime, interval_minutes: float, phase: float) -> datetime:
+    """Return the next poll time on a grid shifted by ``phase`` of the interval.
+
+    Every account and location has its own phase, so polls spread evenly over
+    the interval instead of all firing at setup time plus N intervals. The slot
+    is at least half an interval away; jitter keeps installs from synchronizing.
+    """
+    period = interval_minutes * 60
+    offset = phase * period
+    slot = math.ceil((now.timestamp() + period / 2 - offset) / period)
+    jitter = random.uniform(-JITTER_FRACTION, JITTER_FRACTION) * period
+    return dt_util.utc_from_timestamp(offset + slot * period + jitter)
+
+
+def _in_window(now: time, start: time, end: time) -> bool:
+    if start <= end:
+        return start <= now < end
+    # Window spans midnight
+    return now >= start or now < end
+
+
+def profile_times(options: Mapping[str, Any]) -> tuple[time, time] | None:
+    """Return the configured fast polling window, if any."""
+    start = options.get(CONF_ACTIVE_HOURS_START)
+    end = options.get(CONF_ACTIVE_HOURS_END)
+    if not start or not end:
+        return None
+    start_time = dt_util.parse_time(start)
+    end_time = dt_util.parse_time(end)
+    if start_time is None or end_time is None:
+        return None
+    return start_time, end_time
+
+
+def profile_active(hass: HomeAssistant, options: Mapping[str, Any], now: datetime) -> bool:
+    """Return whether an entry polls at its normal rate rather than the background rate.
+
+    Without any configured condition the entry is always active. Otherwise any
+    of the time window or the listed entities (person home, input_boolean on)
+    activates it.
+    """
+    window = profile_times(options)
+    entities: list[str] = options.get(CONF_ACTIVE_ENTITIES) or []
+    if window is None and not entities:
+        return True
+    if window is not None and _in_window(dt_util.as_local(now).time(), *window):
+        return True
+    return any(
+        (state := hass.states.get(entity_id)) is not None and state.state in ACTIVE_STATES for entity_id in entities
+    )
+
+
+def bucket_of(when: datetime) -> int:
+    """Return the hour-of-week bucket for a point in time, in local time."""
+    local = dt_util.as_local(when)
+    return local.weekday() * 24 + local.hour
+
+
+class ActivityModel:
+    """Learned basket posting rates per location and hour of the week.
+
+    Each bucket holds ``[new baskets, observed minutes]``. Polling intervals are
+    chosen so that roughly the same number of baskets appear between two polls
+    at any time of the week: fast when baskets are usually posted, slow at night.
+    """
+
+    def __init__(self, hass: HomeAssistant, email: str) -> None:
+        """Initialize the model."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}_activity_{email.replace('@', '_').replace('.', '_')}",
+        )
+        self._buckets: dict[str, list[list[float]]] = {}
+        self._known_ids: dict[str, set[Any]] = {}
+        self._last_observed: dict[str, datetime] = {}
+
+    async def async_load(self) -> None:
+        """Load the learned rates from storage."""
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Could not load basket activity: %s", e)
+            return
+        if not isinstance(data, dict):
+            return
+
+        for key, buckets in data.get("locations", {}).items():
+            if isinstance(buckets, list) and len(buckets) == BUCKETS:
+                self._buckets[key] = [[float(a), float(m)] for a, m in buckets]
+        _LOGGER.debug("Loaded basket activity for %d locations", len(self._buckets))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"locations": self._buckets}
+
+    @callback
+    def async_observe(self, key: str, basket_ids: set[Any], now: datetime) -> int:
+        """Record the baskets currently listed for a location. Return the number of new ones."""
+        known = self._known_ids.get(key)
+        last = self._last_observed.get(key)
+        self._known_ids[key] = basket_ids
+        self._last_observed[key] = now
+        if known is None or last is None:
+            return 0
+
+        minutes = min((now - last).total_seconds() / 60, MAX_OBSERVATION_MINUTES)
+        if minutes <= 0:
+            return 0
+
+        arrivals = len(basket_ids - known)
+        buckets = self._buckets.setdefault(key, [[0.0, 0.0] for _ in range(BUCKETS)])
+        bucket = buckets[bucket_of(now)]
+        bucket[0] += arrivals
+        bucket[1] += minutes
+        if bucket[1] > WINDOW_MINUTES:
+            bucket[0] *= WINDOW_MINUTES / bucket[1]
+            bucket[1] = WINDOW_MINUTES
+
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return arrivals
+
+    def rate(self, key: str, when: datetime) -> float | None:
+        """Return the expected new baskets per minute, or None while still learning."""
+        buckets = self._buckets.get(key)
+        if not buckets:
+            return None
+        total_minutes = sum(m for _, m in buckets)
+        if total_minutes < MIN_TOTAL_MINUTES:
+            return None
+
+        overall = sum(a for a, _ in buckets) / total_minutes
+        arrivals, minutes = buckets[bucket_of(when)]
+        return (arrivals + PRIOR_MINUTES * overall) / (minutes + PRIOR_MINUTES)
+
+    def turnover(self, key: str) -> float:
+        """Return the average new baskets per hour of a location, 0 while still learning."""
+        buckets = self._buckets.get(key)
+        if not buckets:
+            return 0.0
+        total_minutes = sum(m for _, m in buckets)
+        if total_minutes < MIN_TOTAL_MINUTES:
+            return 0.0
+        return sum(a for a, _ in buckets) / total_minutes * 60
+
+    def interval(self, key: str, when: datetime, min_minutes: float, max_minutes: float) -> float:
+        """Return the polling interval in minutes for a location, within the given bounds."""
+        rates = [r for r in (self.rate(key, when), self.rate(key, when + timedelta(hours=1))) if r is not None]
+        if not rates:
+            return min_minutes
+
+        # Look one hour ahead so polling speeds up before the busy hours start
+        rate = max(rates)
+        if rate <= 0:
+            return max(min_minutes, max_minutes)
+        return min(max(TARGET_ARRIVALS_PER_POLL / rate, min_minutes), max(min_minutes, max_minutes))
@@ -0,0 +1,245 @@
+"""Local full-text search over baskets, Fairteiler wall posts and conversations."""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .spatial import BASKET, coordinates, haversine
+
+WALL_POST = "wall_post"
+MESSAGE = "message"
+
+# BM25 ranking parameters
+K1 = 1.2
+B = 0.75
+# Weight of an index term that merely contains a query term, as in compound words
+PARTIAL_WEIGHT = 0.5
+# Shorter query terms only match whole index terms
+MIN_PARTIAL_LENGTH = 3
+
+_FOLDS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_WORD = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """Lowercase text, spell out umlauts and drop other accents."""
+    text = text.lower().translate(_FOLDS)
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def stem(word: str) -> str:
+    """Strip German inflection suffixes, in the spirit of the CISTEM stemmer."""
+    while len(word) > 3:
+        if len(word) > 5 and word[-2:] in ("em", "er", "nd"):
+            word = word[:-2]
+        elif word[-1] in "esn":
+            word = word[:-1]
+        else:
+            break
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Return the search terms of a text."""
+    return [stem(word) for word in _WORD.findall(fold(text))]
+
+
+@dataclass(slots=True)
+class Document:
+    """A searchable item with the data returned for it."""
+
+    kind: str
+    id: Any
+    text: str
+    data: dict[str, Any]
+    latitude: float | None = None
+    longitude: float | None = None
+
+    @property
+    def key(self) -> tuple[str, Any]:
+        """Return the key of the document in the index."""
+        return self.kind, self.id
+
+
+def slice_documents(slice_data: dict[str, Any]) -> list[Document]:
+    """Return the baskets and latest Fairteiler wall posts of a location slice as documents."""
+    docs = []
+    for basket in slice_data.get("baskets", []):
+        details = basket.get("details") or {}
+        text = " ".join(filter(None, (basket.get("description"), details.get("description"))))
+        docs.append(Document(BASKET, basket["id"], text, basket, *(coordinates(basket) or (None, None))))
+    for fp in slice_data.get("fairteiler", []):
+        post = fp.get("latest_post")
+        if not isinstance(post, dict) or post.get("id") is None:
+            continue
+        docs.append(
+            Document(
+                WALL_POST,
+                post["id"],
+                str(post.get("body") or post.get("text") or ""),
+                {"fairteiler_id": fp.get("id"), "fairteiler_name": fp.get("name"), "post": post},
+                *(coordinates(fp) or (None, None)),
+            )
+        )
+    return docs
+
+
+def conversation_documents(conversations: Iterable[dict[str, Any]], email: str) -> list[Document]:
+    """Return the last messages of conversations as documents."""
+    docs = []
+    for conv in conversations:
+        message = conv.get("last_message")
+        if not isinstance(message, dict) or message.get("id") is None:
+            continue
+        text = " ".join(filter(None, (conv.get("title"), message.get("body"))))
+        docs.append(
+            Document(
+                MESSAGE, message["id"], text, {"conversation_id": conv.get("id"), "message": message, "email": email}
+            )
+        )
+    return docs
+
+
+class SearchIndex:
+    """Inverted index with BM25 ranking, fed incrementally by the coordinators.
+
+    Like the spatial index, documents come from sources, and a document stays
+    while any source still has it. Re-indexing a source only touches the
+    documents whose text changed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._docs: dict[tuple[str, Any], Document] = {}
+        self._lengths: dict[tuple[str, Any], int] = {}
+        self._postings: dict[str, dict[tuple[str, Any], int]] = {}
+        self._sources: dict[Hashable, set[tuple[str, Any]]] = {}
+        self._holders: Counter[tuple[str, Any]] = Counter()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self._docs)
+
+    def update(self, source: Hashable, docs: list[Document]) -> None:
+        """Index the current documents of a source."""
+        keys = set()
+        for doc in docs:
+            keys.add(doc.key)
+            current = self._docs.get(doc.key)
+            if current is None or current.text != doc.text:
+                if current is not None:
+                    self._unindex(doc.key)
+                self._index(doc)
+            else:
+                self._docs[doc.key] = doc
+
+        old = self._sources.pop(source, set())
+        if keys:
+            self._sources[source] = keys
+        for key in keys - old:
+            self._holders[key] += 1
+        for key in old - keys:
+            self._release(key)
+
+    def prune(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop the sources matching the predicate."""
+        for source in [source for source in self._sources if predicate(source)]:
+            for key in self._sources.pop(source):
+                self._release(key)
+
+    def _index(self, doc: Document) -> None:
+        terms = Counter(tokenize(doc.text))
+        for term, count in terms.items():
+            self._postings.setdefault(term, {})[doc.key] = count
+        self._docs[doc.key] = doc
+        self._lengths[doc.key] = sum(terms.values())
+        self._total_length += self._lengths[doc.key]
+
+    def _unindex(self, key: tuple[str, Any]) -> None:
+        for term in set(tokenize(self._docs.pop(key).text)):
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(key)
+
+    def _release(self, key: tuple[str, Any]) -> None:
+        self._holders[key] -= 1
+        if self._holders[key] <= 0:
+            del self._holders[key]
+            self._unindex(key)
+
+    def _term_scores(self, term: str) -> dict[tuple[str, Any], float]:
+        """Return the BM25 score of each document for one query term."""
+        matches = [(term, 1.0)] if term in self._postings else []
+        if len(term) >= MIN_PARTIAL_LENGTH:
+            matches += [(other, PARTIAL_WEIGHT) for other in self._postings if term in other and other != term]
+
+        avg_length = max(self._total_length / len(self._lengths), 1.0)
+        scores: dict[tuple[str, Any], float] = {}
+        for other, weight in matches:
+            postings = self._postings[other]
+            idf = math.log(1 + (len(self._docs) - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, tf in postings.items():
+                norm = tf + K1 * (1 - B + B * self._lengths[key] / avg_length)
+                score = weight * idf * tf * (K1 + 1) / norm
+                scores[key] = max(scores.get(key, 0.0), score)
+        return scores
+
+    def search(
+        self,
+        query: str,
+        kinds: set[str] | None = None,
+        near: tuple[float, float, float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the documents matching a query, best first.
+
+        Terms must all match unless separated by OR. near is a latitude,
+        longitude and radius in meters that results must lie within.
+        """
+        if not self._docs:
+            return []
+        scores: dict[tuple[str, Any], float] = {}
+        for alternative in re.split(r"\s+OR\s+|\s*\|\s*", query):
+            terms = tokenize(alternative)
+            if not terms:
+                continue
+            per_term = [self._term_scores(term) for term in terms]
+            for key in set.intersection(*(set(s) for s in per_term)):
+                scores[key] = max(scores.get(key, 0.0), sum(s[key] for s in per_term))
+
+        center = radius = None
+        if near is not None:
+            center, radius = (float(near[0]), float(near[1])), float(near[2])
+
+        results = []
+        for key, score in scores.items():
+            doc = self._docs[key]
+            if kinds is not None and doc.kind not in kinds:
+                continue
+            distance = None
+            if center is not None:
+                if doc.latitude is None or doc.longitude is None:
+                    continue
+                distance = haversine(*center, doc.latitude, doc.longitude)
+                if distance > radius:
+                    continue
+            results.append((score, key, distance))
+        results.sort(key=lambda result: result[0], reverse=True)
+        return [
+            {
+                "type": key[0],
+                "id": key[1],
+                **self._docs[key].data,
+                "score": round(score, 3),
+                **({"distance": round(distance)} if distance is not None else {}),
+            }
+            for score, key, distance in results
+        ]
@@ -5,13 +5,14 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.const import ATTR_ATTRIBUTION, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTRIBUTION,
@@ -104,6 +105,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         entities.append(FoodsharingBuddiesSensor(coordinator, email))
         entities.append(FoodsharingBananasSensor(coordinator, email))
         entities.append(FoodsharingRegionStatsSensor(coordinator, email))
+        entities.append(FoodsharingRequestBudgetSensor(coordinator, email))
 
     async_add_entities(entities)
 
@@ -120,7 +122,7 @@ class FoodsharingSensor(CoordinatorEntity[FoodsharingCoordinator], SensorEntity)
         lon: float,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(entry.entry_id, loc_idx))
         self.entry = entry
         self.entry_id = entry.entry_id
         self.loc_idx = loc_idx
@@ -169,6 +171,10 @@ class FoodsharingSensor(CoordinatorEntity[FoodsharingCoordinator], SensorEntity)
             "baskets": baskets,
             "fairteiler_count": len(fairteiler),
             "fairteiler": fairteiler,
+            **self.coordinator.freshness.attributes(
+                [(self.entry_id, self.loc_idx, "baskets"), (self.entry_id, self.loc_idx, "fairteiler")],
+                dt_util.utcnow(),
+            ),
         }
 
 
@@ -184,7 +190,7 @@ class FoodsharingFairteilerSensor(CoordinatorEntity[FoodsharingCoordinator], Sen
         lon: float,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(entry.entry_id, loc_idx))
         self.entry = entry
         self.entry_id = entry.entry_id
         self.loc_idx = loc_idx
@@ -230,6 +236,7 @@ class FoodsharingFairteilerSensor(CoordinatorEntity[FoodsharingCoordinator], Sen
             ATTR_ATTRIBUTION: ATTRIBUTION,
             "fairteiler_count": len(fairteiler),
             "fairteiler": fairteiler,
+            **self.coordinator.freshness.attributes([(self.entry_id, self.loc_idx, "fairteiler")], dt_util.utcnow()),
         }
 
 
@@ -261,6 +268,11 @@ class FoodsharingMessagesSensor(CoordinatorEntity[FoodsharingCoordinator], Senso
             return int(val)
         return 0
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether the count is stale."""
+        return self.coordinator.freshness.attributes(["messages"], dt_util.utcnow())
+
 
 class FoodsharingBellsSensor(CoordinatorEntity[FoodsharingCoordinator], SensorEntity):  # type: ignore[misc]
     """Represents unread bell notifications on Foodsharing."""
@@ -290,6 +302,11 @@ class FoodsharingBellsSensor(CoordinatorEntity[FoodsharingCoordinator], SensorEn
             return int(val)
         return 0
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether the count is stale."""
+        return self.coordinator.freshness.attributes(["bells"], dt_util.utcnow())
+
 
 class FoodsharingPickupsSensor(CoordinatorEntity[FoodsharingCoordinator], SensorEntity):  # type: ignore[misc]
     """Represents upcoming pickups on Foodsharing."""
@@ -324,7 +341,7 @@ class FoodsharingPickupsSensor(CoordinatorEntity[FoodsharingCoordinator], Sensor
         """Return extra state attributes for pickups."""
         if self.coordinator.data:
             pickups = self.coordinator.data.get("account", {}).get("pickups", [])
-            return {"pickups": pickups}
+            return {"pickups": pickups, **self.coordinator.freshness.attributes(["pickups"], dt_util.utcnow())}
         return {}
 
 
@@ -369,6 +386,7 @@ class FoodsharingGlobalStatsSensor(CoordinatorEntity[FoodsharingCoordinator], Se
             "active_fairteiler": stats.get("countActiveFoodSharePoints"),
             "total_baskets": stats.get("totalBaskets"),
             ATTR_ATTRIBUTION: ATTRIBUTION,
+            **self.coordinator.freshness.attributes(["global_stats"], dt_util.utcnow()),
         }
 
 
@@ -409,6 +427,7 @@ class FoodsharingUserStatsSensor(CoordinatorEntity[FoodsharingCoordinator], Sens
             "rating": stats.get("rating"),
             "member_since": stats.get("member_since"),
             ATTR_ATTRIBUTION: ATTRIBUTION,
+            **self.coordinator.freshness.attributes(["user_stats"], dt_util.utcnow()),
         }
 
 
@@ -447,6 +466,7 @@ class FoodsharingBuddiesSensor(CoordinatorEntity[FoodsharingCoordinator], Sensor
         return {
             "buddies": buddies,
             ATTR_ATTRIBUTION: ATTRIBUTION,
+            **self.coordinator.freshness.attributes(["buddies"], dt_util.utcnow()),
         }
 
 
@@ -485,6 +505,7 @@ class FoodsharingBananasSensor(CoordinatorEntity[FoodsharingCoordinator], Sensor
         return {
             "given": data.get("givenCount", 0),
             ATTR_ATTRIBUTION: ATTRIBUTION,
+            **self.coordinator.freshness.attributes(["bananas"], dt_util.utcnow()),
         }
 
 
@@ -533,4 +554,46 @@ class FoodsharingRegionStatsSensor(CoordinatorEntity[FoodsharingCoordinator], Se
             "baskets_last_month": data.get("foodBasketsLastMonth"),
             "last_updated": data.get("lastUpdated"),
             ATTR_ATTRIBUTION: ATTRIBUTION,
+            **self.coordinator.freshness.attributes(["region_stats", "profile"], dt_util.utcnow()),
+        }
+
+
+class FoodsharingRequestBudgetSensor(CoordinatorEntity[FoodsharingCoordinator], SensorEntity):  # type: ignore[misc]
+    """Displays the API requests made today against the daily request budget."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: FoodsharingCoordinator, email: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.email = email
+        self._attr_has_entity_name = True
+        self.translation_key = "request_budget"
+        self._attr_unique_id = f"Foodsharing-Request-Budget-{email}"
+        self._attr_icon = "mdi:gauge"
+        self._attr_native_unit_of_measurement = "requests"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, email)},
+            name=f"Foodsharing Account ({email})",
+            manufacturer="foodsharing.de",
+            model="Account",
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of requests made today."""
+        return self.coordinator.budget.used_today
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the budget, its remainder and the planned intervals."""
+        budget = self.coordinator.budget
+        return {
+            "daily_budget": budget.daily_budget or None,
+            "remaining": budget.remaining,
+            "used_by_kind": dict(budget.used),
+            "planned_intervals": {
+                "_".join(map(str, key)) if isinstance(key, tuple) else str(key): round(minutes, 1)
+                for key, minutes in budget.planned_intervals.items()
+            },
         }
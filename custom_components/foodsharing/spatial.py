@@ -0,0 +1,183 @@
+"""In-memory spatial index over the baskets and Fairteiler the coordinators know."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any
+
+# Grid cell edge in degrees, about 1.1 km north-south
+CELL_SIZE = 0.01
+EARTH_RADIUS = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS / 180
+
+BASKET = "basket"
+FAIRTEILER = "fairteiler"
+# Item type and the location data part holding it
+PARTS = ((BASKET, "baskets"), (FAIRTEILER, "fairteiler"))
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance between two points in meters."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _cell(lat: float, lon: float) -> tuple[int, int]:
+    return math.floor(lat / CELL_SIZE), math.floor(lon / CELL_SIZE)
+
+
+def coordinates(item: dict[str, Any]) -> tuple[float, float] | None:
+    """Return the valid position of an item, None if it has none."""
+    try:
+        lat, lon = float(item["latitude"]), float(item["longitude"])
+    except KeyError, TypeError, ValueError:
+        return None
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
+
+
+class SpatialIndex:
+    """Uniform grid over baskets and Fairteiler by position.
+
+    Sources are the location slices that reported items. They are indexed
+    incrementally: re-indexing a slice only touches the items that appeared,
+    moved or disappeared, and an item stays while any slice still has it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._items: dict[tuple[str, Any], tuple[float, float, dict[str, Any]]] = {}
+        self._cells: dict[tuple[int, int], set[tuple[str, Any]]] = {}
+        self._sources: dict[Hashable, set[tuple[str, Any]]] = {}
+        self._holders: dict[tuple[str, Any], int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed items."""
+        return len(self._items)
+
+    def update(self, source: Hashable, slice_data: dict[str, Any]) -> None:
+        """Index the current baskets and Fairteiler of a location slice."""
+        keys: set[tuple[str, Any]] = set()
+        for kind, part in PARTS:
+            for item in slice_data.get(part, []):
+                coords = coordinates(item)
+                if coords is None or item.get("id") is None:
+                    continue
+                key = (kind, item["id"])
+                keys.add(key)
+                self._put(key, *coords, item)
+
+        old = self._sources.pop(source, set())
+        if keys:
+            self._sources[source] = keys
+        for key in keys - old:
+            self._holders[key] = self._holders.get(key, 0) + 1
+        for key in old - keys:
+            self._release(key)
+
+    def prune(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop the sources matching the predicate."""
+        for source in [source for source in self._sources if predicate(source)]:
+            for key in self._sources.pop(source):
+                self._release(key)
+
+    def _put(self, key: tuple[str, Any], lat: float, lon: float, item: dict[str, Any]) -> None:
+        current = self._items.get(key)
+        if current is not None and _cell(current[0], current[1]) != _cell(lat, lon):
+            self._cells[_cell(current[0], current[1])].discard(key)
+        self._cells.setdefault(_cell(lat, lon), set()).add(key)
+        self._items[key] = (lat, lon, item)
+
+    def _release(self, key: tuple[str, Any]) -> None:
+        self._holders[key] -= 1
+        if self._holders[key] > 0:
+            return
+        del self._holders[key]
+        lat, lon, _ = self._items.pop(key)
+        cell = _cell(lat, lon)
+        self._cells[cell].discard(key)
+        if not self._cells[cell]:
+            del self._cells[cell]
+
+    def _in_cells(self, rows: range, cols: range, kinds: set[str] | None) -> Iterator[tuple[str, Any]]:
+        if len(rows) * len(cols) > len(self._cells):
+            # Fewer cells are occupied than asked for, so look at those instead
+            cells = [keys for (row, col), keys in self._cells.items() if row in rows and col in cols]
+        else:
+            cells = [self._cells[(row, col)] for row in rows for col in cols if (row, col) in self._cells]
+        for keys in cells:
+            for key in keys:
+                if kinds is None or key[0] in kinds:
+                    yield key
+
+    def _result(self, key: tuple[str, Any], distance: float | None) -> dict[str, Any]:
+        return {**self._items[key][2], "type": key[0], "distance": None if distance is None else round(distance)}
+
+    def within(self, lat: float, lon: float, radius: float, kinds: set[str] | None = None) -> list[dict[str, Any]]:
+        """Return the items within radius meters, nearest first."""
+        dlat = radius / METERS_PER_DEGREE
+        dlon = dlat / max(math.cos(math.radians(min(abs(lat) + dlat, 89.9))), 1e-6)
+        (row0, col0), (row1, col1) = _cell(lat - dlat, lon - dlon), _cell(lat + dlat, lon + dlon)
+        found = []
+        for key in self._in_cells(range(row0, row1 + 1), range(col0, col1 + 1), kinds):
+            distance = haversine(lat, lon, *self._items[key][:2])
+            if distance <= radius:
+                found.append((distance, key))
+        found.sort()
+        return [self._result(key, distance) for distance, key in found]
+
+    def nearest(self, lat: float, lon: float, k: int, kinds: set[str] | None = None) -> list[dict[str, Any]]:
+        """Return the k nearest items, searching rings of cells outwards."""
+        row, col = _cell(lat, lon)
+        candidates: list[tuple[float, tuple[str, Any]]] = []
+        ring = 0
+        while True:
+            if (2 * ring + 1) ** 2 >= len(self._cells):
+                # The rings would span more cells than are occupied, so rank all items
+                keys = [key for key in self._items if kinds is None or key[0] in kinds]
+                candidates = [(haversine(lat, lon, *self._items[key][:2]), key) for key in keys]
+                break
+            if ring == 0:
+                keys = list(self._in_cells(range(row, row + 1), range(col, col + 1), kinds))
+            else:
+                cols = range(col - ring, col + ring + 1)
+                keys = [
+                    *self._in_cells(range(row - ring, row + ring + 1, 2 * ring), cols, kinds),
+                    *self._in_cells(range(row - ring + 1, row + ring), cols[:: 2 * ring], kinds),
+                ]
+            candidates.extend((haversine(lat, lon, *self._items[key][:2]), key) for key in keys)
+            # Everything outside the searched rings is at least this far away
+            widest = math.cos(math.radians(min(abs(lat) + (ring + 1) * CELL_SIZE, 89.9)))
+            covered = ring * CELL_SIZE * METERS_PER_DEGREE * widest
+            if len(candidates) >= k and heapq.nsmallest(k, candidates)[-1][0] <= covered:
+                break
+            ring += 1
+        return [self._result(key, distance) for distance, key in heapq.nsmallest(k, candidates)]
+
+    def in_box(
+        self,
+        south: float,
+        west: float,
+        north: float,
+        east: float,
+        kinds: set[str] | None = None,
+        center: tuple[float, float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the items inside a bounding box, nearest to center first if given."""
+        (row0, col0), (row1, col1) = _cell(south, west), _cell(north, east)
+        keys = [
+            key
+            for key in self._in_cells(range(row0, row1 + 1), range(col0, col1 + 1), kinds)
+            if south <= self._items[key][0] <= north and west <= self._items[key][1] <= east
+        ]
+        if center is None:
+            return [self._result(key, None) for key in keys]
+        found = sorted((haversine(*center, *self._items[key][:2]), key) for key in keys)
+        return [self._result(key, distance) for distance, key in found]
@@ -0,0 +1,85 @@
+"""Dependency-ordered concurrent execution of the Foodsharing update cycle."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+def _outcome(task: asyncio.Task[Any]) -> Any:
+    """Return the result of a finished task, or its exception."""
+    if task.cancelled():
+        return asyncio.CancelledError()
+    return task.exception() or task.result()
+
+
+class TaskGraph:
+    """Run named coroutines as soon as the nodes they depend on have finished.
+
+    All nodes start at once and each only waits for its own dependencies, so
+    independent branches overlap. Results are collected like
+    ``asyncio.gather(..., return_exceptions=True)``; a node receives the results
+    of its dependencies as positional arguments, exceptions included.
+
+    With a timeout, ``run`` returns what has finished by then and the remaining
+    nodes keep running; ``finish`` collects them later.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._nodes: dict[Hashable, tuple[Callable[..., Awaitable[Any]], tuple[Hashable, ...]]] = {}
+        self.pending: dict[Hashable, asyncio.Task[Any]] = {}
+
+    def add(self, name: Hashable, func: Callable[..., Awaitable[Any]], *deps: Hashable) -> None:
+        """Add a node. Dependencies must have been added before, which keeps the graph acyclic."""
+        if name in self._nodes:
+            raise ValueError(f"Duplicate task {name!r}")
+        for dep in deps:
+            if dep not in self._nodes:
+                raise ValueError(f"Unknown dependency {dep!r} of task {name!r}")
+        self._nodes[name] = (func, deps)
+
+    def __contains__(self, name: Hashable) -> bool:
+        """Return whether a node exists."""
+        return name in self._nodes
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self._nodes)
+
+    async def run(self, timeout: float | None = None) -> dict[Hashable, Any]:
+        """Run all nodes and return the results or exceptions of those finished within the timeout."""
+        tasks: dict[Hashable, asyncio.Task[Any]] = {}
+
+        async def run_node(func: Callable[..., Awaitable[Any]], deps: tuple[Hashable, ...]) -> Any:
+            if deps:
+                await asyncio.wait([tasks[dep] for dep in deps])
+            return await func(*(_outcome(tasks[dep]) for dep in deps))
+
+        for name, (func, deps) in self._nodes.items():
+            tasks[name] = asyncio.create_task(run_node(func, deps))
+
+        if not tasks:
+            return {}
+        try:
+            await asyncio.wait(tasks.values(), timeout=timeout)
+        except asyncio.CancelledError:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        self.pending = {name: task for name, task in tasks.items() if not task.done()}
+        return {name: _outcome(task) for name, task in tasks.items() if task.done()}
+
+    async def finish(self) -> dict[Hashable, Any]:
+        """Wait for the nodes still running after ``run`` and return their results."""
+        results = await asyncio.gather(*self.pending.values(), return_exceptions=True)
+        finished = dict(zip(self.pending, results, strict=True))
+        self.pending = {}
+        return finished
+
+    def cancel(self) -> None:
+        """Cancel the nodes still running after ``run``."""
+        for task in self.pending.values():
+            task.cancel()
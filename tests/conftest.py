@@ -4,6 +4,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from .responses import set_body
+
 
 @pytest.fixture(autouse=True)
 def auto_mock_ha():
@@ -28,6 +30,7 @@ def auto_mock_ha():
 
 @pytest.fixture()
 def mock_session():
-    """Mock an aiohttp ClientSession."""
+    """Mock an aiohttp ClientSession whose responses have an empty body unless a test sets one."""
     mock = MagicMock()
+    set_body(mock.get.return_value.__aenter__.return_value, b"")
     return mock
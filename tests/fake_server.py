@@ -0,0 +1,442 @@
+"""Local fake of the foodsharing.de API for soak and load tests.
+
+The server serves the endpoints used by ``FoodsharingCoordinator`` and generates
+deterministic data from a seed. Latency, error injection and payload sizes are
+configurable so multi-account / multi-location setups can be exercised without
+touching the real API.
+
+Run standalone for manual soak testing::
+
+    python -m tests.fake_server --port 8080 --seed 42 --latency lognormal:0.05:0.6 --fault 500=0.05 --fault 429=0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+SESSION_COOKIE = "PHPSESSID"
+XSRF_COOKIE = "XSRF-TOKEN"
+
+WORDS = (
+    "Brot",
+    "Brötchen",
+    "Äpfel",
+    "Bananen",
+    "Joghurt",
+    "Käse",
+    "Gemüse",
+    "Salat",
+    "Kuchen",
+    "Milch",
+    "bread",
+    "apples",
+    "vegetables",
+    "rice",
+    "pasta",
+)
+
+
+@dataclass
+class LatencyModel:
+    """Latency distribution in seconds.
+
+    ``kind`` is one of ``fixed``, ``uniform``, ``exponential`` or ``lognormal``.
+    For ``lognormal`` ``a`` is the median and ``b`` the sigma of the underlying normal.
+    """
+
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyModel:
+        """Parse ``kind:a:b`` (e.g. ``uniform:0.01:0.2``)."""
+        parts = spec.split(":")
+        values = [float(p) for p in parts[1:]] + [0.0, 0.0]
+        return cls(parts[0], values[0], values[1])
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a latency value."""
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "exponential":
+            return rng.expovariate(1.0 / self.a) if self.a > 0 else 0.0
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(self.a), self.b) if self.a > 0 else 0.0
+        return self.a
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour of the fake server."""
+
+    seed: int = 0
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    endpoint_latency: dict[str, LatencyModel] = field(default_factory=dict)
+    # Probability per status code, e.g. {500: 0.05, 429: 0.01}
+    faults: dict[int, float] = field(default_factory=dict)
+    endpoint_faults: dict[str, dict[int, float]] = field(default_factory=dict)
+    retry_after: int = 30
+    baskets_per_query: int = 10
+    fairteiler_per_query: int = 5
+    wall_posts: int = 3
+    description_length: int = 12
+    pickups: int = 4
+    bells: int = 3
+    conversations: int = 2
+    # Baskets rotate every N seconds so that polling sees turnover
+    rotation_seconds: float = 900.0
+    require_auth: bool = True
+    accounts: dict[str, str] = field(default_factory=dict)
+
+
+class FakeFoodsharingServer:
+    """aiohttp application faking the foodsharing.de API."""
+
+    def __init__(self, config: FakeServerConfig | None = None) -> None:
+        """Initialize the server."""
+        self.config = config or FakeServerConfig()
+        self._rng = random.Random(self.config.seed)
+        self._sessions: dict[str, int] = {}
+        self._user_ids: dict[str, int] = {}
+        self.requests: Counter[str] = Counter()
+        self.responses: Counter[tuple[str, int]] = Counter()
+        self.app = web.Application(middlewares=[self._middleware])
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+        routes = [
+            web.get("/login", self._login_page, name="login_page"),
+            web.post("/api/login", self._login, name="login"),
+            web.get("/api/users/current", self._current_user, name="current_user"),
+            web.get("/api/users/current/buddies", self._buddies, name="buddies"),
+            web.get("/api/users/{user_id}/pickups/registered", self._pickups, name="pickups"),
+            web.get("/api/users/{user_id}/stats", self._user_stats, name="user_stats"),
+            web.get("/api/users/{user_id}/bananas/meta", self._bananas, name="bananas"),
+            web.get("/api/baskets/nearby", self._baskets_nearby, name="baskets_nearby"),
+            web.get("/api/baskets/own", self._own_baskets, name="own_baskets"),
+            web.get("/api/baskets/{basket_id}", self._basket_detail, name="basket_detail"),
+            web.post("/api/baskets/{basket_id}/request", self._basket_action, name="basket_request"),
+            web.post("/api/baskets/{basket_id}/close", self._basket_action, name="basket_close"),
+            web.get("/api/foodSharePoints/nearby", self._fairteiler_nearby, name="fairteiler_nearby"),
+            web.get("/api/fairteiler/{fp_id}/wall", self._wall, name="fairteiler_wall"),
+            web.get("/api/bells", self._bells, name="bells"),
+            web.get("/api/mailbox/unread-count", self._unread_count, name="unread_count"),
+            web.get("/api/conversations", self._conversations, name="conversations"),
+            web.get("/api/statistics", self._statistics, name="statistics"),
+            web.get("/api/regions/{region_id}/statistics", self._region_statistics, name="region_statistics"),
+        ]
+        self.app.add_routes(routes)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Apply latency, fault injection and auth to every request."""
+        name = request.match_info.route.name or "unknown"
+        self.requests[name] += 1
+
+        latency = self.config.endpoint_latency.get(name, self.config.latency).sample(self._rng)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        status = self._pick_fault(name)
+        if status is not None:
+            headers = {"Retry-After": str(self.config.retry_after)} if status in (429, 503) else {}
+            self.responses[(name, status)] += 1
+            return web.json_response({"message": "injected fault"}, status=status, headers=headers)
+
+        if (
+            self.config.require_auth
+            and name.startswith(("current_user", "buddies", "pickups", "user_stats", "bananas", "own_", "bells"))
+            and self._session_user(request) is None
+        ):
+            self.responses[(name, 401)] += 1
+            return web.json_response({"message": "Unauthorized"}, status=401)
+
+        response = await handler(request)
+        self.responses[(name, response.status)] += 1
+        return response
+
+    def _pick_fault(self, name: str) -> int | None:
+        """Return an injected status code for this request, if any."""
+        faults = self.config.endpoint_faults.get(name, self.config.faults)
+        roll = self._rng.random()
+        cumulative = 0.0
+        for status, probability in sorted(faults.items()):
+            cumulative += probability
+            if roll < cumulative:
+                return status
+        return None
+
+    def _session_user(self, request: web.Request) -> int | None:
+        """Return the user id of the request's session cookie."""
+        session = request.cookies.get(SESSION_COOKIE)
+        return self._sessions.get(session) if session else None
+
+    def _cell_rng(self, *parts: Any) -> random.Random:
+        """Return a RNG seeded from the server seed and the given parts."""
+        return random.Random(repr((self.config.seed, *parts)))
+
+    def _description(self, rng: random.Random) -> str:
+        """Generate a basket or post description."""
+        return " ".join(rng.choice(WORDS) for _ in range(self.config.description_length))
+
+    async def _login_page(self, request: web.Request) -> web.Response:
+        response = web.Response(text="<html>login</html>", content_type="text/html")
+        response.set_cookie(XSRF_COOKIE, f"xsrf-{self._rng.getrandbits(32):08x}")
+        return response
+
+    async def _login(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        email = str(payload.get("email", ""))
+        password = payload.get("password")
+        expected = self.config.accounts.get(email)
+        if self.config.accounts and expected != password:
+            return web.json_response({"message": "Invalid credentials"}, status=401)
+
+        user_id = self._user_ids.setdefault(email, 1000 + len(self._user_ids))
+        session = f"sess-{self._rng.getrandbits(64):016x}"
+        self._sessions[session] = user_id
+        response = web.json_response({"id": user_id, "name": email.split("@")[0]})
+        response.set_cookie(SESSION_COOKIE, session)
+        return response
+
+    async def _current_user(self, request: web.Request) -> web.Response:
+        user_id = self._session_user(request) or 1000
+        return web.json_response(
+            {
+                "id": user_id,
+                "firstname": "Fake",
+                "regionId": 100 + user_id % 7,
+                "regionName": f"Region {user_id % 7}",
+                "isSleeping": False,
+            }
+        )
+
+    async def _buddies(self, request: web.Request) -> web.Response:
+        rng = self._cell_rng("buddies", self._session_user(request))
+        return web.json_response([{"id": rng.randint(1, 99999), "name": f"Buddy {i}"} for i in range(3)])
+
+    async def _pickups(self, request: web.Request) -> web.Response:
+        user_id = request.match_info["user_id"]
+        rng = self._cell_rng("pickups", user_id)
+        now = int(time.time())
+        pickups = [
+            {
+                "id": rng.randint(1, 10**6),
+                "time": now + rng.randint(3600, 14 * 86400),
+                "store_name": f"Store {rng.randint(1, 500)}",
+                "description": self._description(rng),
+                "location": f"Street {rng.randint(1, 99)}",
+            }
+            for _ in range(self.config.pickups)
+        ]
+        return web.json_response(pickups)
+
+    async def _user_stats(self, request: web.Request) -> web.Response:
+        rng = self._cell_rng("user_stats", request.match_info["user_id"])
+        return web.json_response({"fetchCount": rng.randint(0, 500), "fetchWeight": rng.randint(0, 5000)})
+
+    async def _bananas(self, request: web.Request) -> web.Response:
+        rng = self._cell_rng("bananas", request.match_info["user_id"])
+        return web.json_response({"receivedCount": rng.randint(0, 50), "givenCount": rng.randint(0, 50)})
+
+    def _baskets_for(self, lat: float, lon: float, distance: float) -> list[dict[str, Any]]:
+        """Generate the baskets around a point for the current rotation window."""
+        window = int(time.time() // self.config.rotation_seconds) if self.config.rotation_seconds else 0
+        cell = (round(lat, 2), round(lon, 2))
+        rng = self._cell_rng("baskets", cell, window)
+        radius_deg = min(distance if distance < 100 else distance / 1000, 50) / 111.0
+        now = int(time.time())
+        baskets = []
+        for _ in range(self.config.baskets_per_query):
+            basket_id = rng.randint(1, 10**7)
+            baskets.append(
+                {
+                    "id": basket_id,
+                    "description": self._description(rng),
+                    "picture": f"/images/basket/{basket_id}.jpg" if rng.random() < 0.5 else None,
+                    "lat": lat + rng.uniform(-radius_deg, radius_deg),
+                    "lon": lon + rng.uniform(-radius_deg, radius_deg),
+                    "until": now + rng.randint(600, 3 * 86400),
+                    "creator": {"id": rng.randint(1, 10**5), "name": f"User {rng.randint(1, 999)}"},
+                }
+            )
+        return baskets
+
+    async def _baskets_nearby(self, request: web.Request) -> web.Response:
+        lat = float(request.query.get("lat", 0))
+        lon = float(request.query.get("lon", 0))
+        distance = float(request.query.get("distance", 7))
+        return web.json_response({"baskets": self._baskets_for(lat, lon, distance)})
+
+    async def _own_baskets(self, request: web.Request) -> web.Response:
+        rng = self._cell_rng("own", self._session_user(request))
+        return web.json_response(
+            [{"id": rng.randint(1, 10**7), "description": self._description(rng)} for _ in range(rng.randint(0, 2))]
+        )
+
+    async def _basket_detail(self, request: web.Request) -> web.Response:
+        basket_id = int(request.match_info["basket_id"])
+        rng = self._cell_rng("detail", basket_id)
+        return web.json_response(
+            {
+                "basket": {
+                    "id": basket_id,
+                    "description": self._description(rng) * 3,
+                    "pictures": [f"/images/basket/{basket_id}-{i}.jpg" for i in range(rng.randint(0, 3))],
+                    "contactTypes": [1, 2],
+                    "until": int(time.time()) + rng.randint(600, 86400),
+                }
+            }
+        )
+
+    async def _basket_action(self, request: web.Request) -> web.Response:
+        return web.json_response({})
+
+    async def _fairteiler_nearby(self, request: web.Request) -> web.Response:
+        lat = float(request.query.get("lat", 0))
+        lon = float(request.query.get("lon", 0))
+        rng = self._cell_rng("fairteiler", round(lat, 2), round(lon, 2))
+        points = []
+        for _ in range(self.config.fairteiler_per_query):
+            fp_id = rng.randint(1, 10**5)
+            points.append(
+                {
+                    "id": fp_id,
+                    "name": f"Fairteiler {fp_id}",
+                    "lat": lat + rng.uniform(-0.05, 0.05),
+                    "lon": lon + rng.uniform(-0.05, 0.05),
+                    "desc": self._description(rng),
+                    "address": f"Street {rng.randint(1, 99)}",
+                    "picture": f"/images/fp/{fp_id}.jpg",
+                }
+            )
+        return web.json_response(points)
+
+    async def _wall(self, request: web.Request) -> web.Response:
+        fp_id = int(request.match_info["fp_id"])
+        window = int(time.time() // self.config.rotation_seconds) if self.config.rotation_seconds else 0
+        rng = self._cell_rng("wall", fp_id, window)
+        now = int(time.time())
+        posts = [
+            {
+                "id": rng.randint(1, 10**8),
+                "body": self._description(rng),
+                "time": now - rng.randint(0, 86400),
+                "user_name": f"User {rng.randint(1, 999)}",
+            }
+            for _ in range(self.config.wall_posts)
+        ]
+        return web.json_response(posts)
+
+    async def _bells(self, request: web.Request) -> web.Response:
+        rng = self._cell_rng("bells", self._session_user(request), int(time.time() // 300))
+        return web.json_response(
+            [
+                {"id": rng.randint(1, 10**8), "title": self._description(rng), "is_read": rng.randint(0, 1)}
+                for _ in range(self.config.bells)
+            ]
+        )
+
+    async def _unread_count(self, request: web.Request) -> web.Response:
+        return web.json_response({"unread": self.config.conversations})
+
+    async def _conversations(self, request: web.Request) -> web.Response:
+        rng = self._cell_rng("conversations", self._session_user(request))
+        return web.json_response(
+            [
+                {
+                    "id": rng.randint(1, 10**6),
+                    "unread": 1,
+                    "last_message": {"id": rng.randint(1, 10**8), "body": self._description(rng)},
+                }
+                for _ in range(self.config.conversations)
+            ]
+        )
+
+    async def _statistics(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "generalStatistic": {
+                    "fetchWeight": 12345678,
+                    "fetchCount": 987654,
+                    "countAllFoodsaver": 500000,
+                    "cooperationsCount": 10000,
+                    "countActiveFoodSharePoints": 1200,
+                    "totalBaskets": 2000000,
+                }
+            }
+        )
+
+    async def _region_statistics(self, request: web.Request) -> web.Response:
+        rng = self._cell_rng("region", request.match_info["region_id"])
+        return web.json_response(
+            {
+                "savedFoodKgLastMonth": rng.randint(0, 10000),
+                "activeHomeRegionFoodsavers": rng.randint(0, 2000),
+                "pickupsLastMonth": rng.randint(0, 5000),
+            }
+        )
+
+
+def _parse_fault(spec: str) -> tuple[int, float]:
+    status, probability = spec.split("=")
+    return int(status), float(probability)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    config = FakeServerConfig(
+        seed=args.seed,
+        latency=LatencyModel.parse(args.latency),
+        faults=dict(_parse_fault(f) for f in args.fault),
+        baskets_per_query=args.baskets,
+        fairteiler_per_query=args.fairteiler,
+        require_auth=not args.no_auth,
+    )
+    server = FakeFoodsharingServer(config)
+    url = await server.start(args.host, args.port)
+    print(f"Fake foodsharing API listening on {url}")
+    try:
+        while True:
+            await asyncio.sleep(60)
+            print(dict(server.requests))
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", default="fixed:0", help="kind:a:b, e.g. lognormal:0.05:0.6")
+    parser.add_argument("--fault", action="append", default=[], help="status=probability, e.g. 500=0.05")
+    parser.add_argument("--baskets", type=int, default=10)
+    parser.add_argument("--fairteiler", type=int, default=5)
+    parser.add_argument("--no-auth", action="store_true")
+    asyncio.run(_serve(parser.parse_args()))
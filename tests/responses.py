@@ -0,0 +1,12 @@
+"""Helpers for mocked aiohttp responses."""
+
+from __future__ import annotations
+
+import itertools
+from unittest.mock import AsyncMock, MagicMock
+
+
+def set_body(response: MagicMock, body: bytes) -> None:
+    """Let a mocked response serve body from its content stream on every request."""
+    chunks = itertools.cycle((body, b""))
+    response.content.read = AsyncMock(side_effect=lambda n: next(chunks))
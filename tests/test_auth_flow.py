@@ -6,6 +6,8 @@ import pytest
 from custom_components.foodsharing.config_flow import validate_credentials
 from custom_components.foodsharing.coordinator import FoodsharingCoordinator
 
+from .responses import set_body
+
 
 @pytest.mark.asyncio
 async def test_full_authentication_flow():
@@ -48,6 +50,7 @@ async def test_full_authentication_flow():
         mock_resp_current = AsyncMock()
         mock_resp_current.status = 200
         mock_resp_current.json.return_value = {"id": 123}
+        set_body(mock_resp_current, b'{"id": 123}')
         mock_session.get.return_value.__aenter__.return_value = mock_resp_current
 
         res_totp = await validate_credentials(hass, email, password, totp=totp)
@@ -90,10 +93,11 @@ async def test_coordinator_reauth_recovery():
 
         mock_resp_fail = AsyncMock()
         mock_resp_fail.status = 401
+        set_body(mock_resp_fail, b"")
 
         mock_resp_ok = AsyncMock()
         mock_resp_ok.status = 200
-        mock_resp_ok.json.return_value = []
+        set_body(mock_resp_ok, b"[]")
 
         # Simulate 401 on first call (for all parallel tasks), success on second after login
         # asyncio.gather will call session.get multiple times.
@@ -0,0 +1,135 @@
+"""Tests for the Foodsharing circuit breaker."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.foodsharing.breaker import (
+    BASE_COOLDOWN,
+    CLOSED,
+    FAILURE_THRESHOLD,
+    HALF_OPEN,
+    OPEN,
+    TRIAL_TIMEOUT,
+    CircuitBreaker,
+)
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+
+
+def test_circuit_opens_after_consecutive_failures():
+    """A success in between resets the count; enough failures in a row open the circuit."""
+    breaker = CircuitBreaker()
+    now = dt_util.utcnow()
+    for _ in range(FAILURE_THRESHOLD - 1):
+        assert breaker.record("bells", False, now) is None
+    assert breaker.record("bells", True, now) is None
+    assert breaker.allow("bells", now)
+
+    for _ in range(FAILURE_THRESHOLD - 1):
+        breaker.record("bells", False, now)
+    assert breaker.record("bells", False, now) == OPEN
+    assert not breaker.allow("bells", now)
+    assert breaker.as_dict(now)["bells"]["state"] == OPEN
+
+
+def test_half_open_trial_doubles_cooldown_or_closes():
+    """After the cooldown one trial decides: failure reopens for twice as long, success closes."""
+    breaker = CircuitBreaker()
+    now = dt_util.utcnow()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.record(("entry", 0), False, now)
+
+    now += BASE_COOLDOWN
+    assert breaker.allow(("entry", 0), now)
+    assert breaker.as_dict(now)["entry_0"]["state"] == HALF_OPEN
+    assert breaker.record(("entry", 0), False, now) == OPEN
+    assert not breaker.allow(("entry", 0), now + BASE_COOLDOWN)
+
+    now += 2 * BASE_COOLDOWN
+    assert breaker.allow(("entry", 0), now)
+    assert breaker.record(("entry", 0), True, now) == CLOSED
+    assert breaker.as_dict(now) == {}
+
+
+def test_half_open_admits_a_single_trial():
+    """While a trial is running other calls are refused, unless its outcome never comes."""
+    breaker = CircuitBreaker()
+    now = dt_util.utcnow()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.record("bells", False, now)
+
+    now += BASE_COOLDOWN
+    assert breaker.allow("bells", now)
+    assert not breaker.allow("bells", now)
+    assert breaker.allow("bells", now + TRIAL_TIMEOUT)
+
+    assert breaker.record("bells", False, now + TRIAL_TIMEOUT) == OPEN
+    now += TRIAL_TIMEOUT + 2 * BASE_COOLDOWN
+    assert breaker.allow("bells", now)
+    assert not breaker.allow("bells", now)
+    assert breaker.record("bells", True, now) == CLOSED
+    assert breaker.allow("bells", now)
+    assert breaker.allow("bells", now)
+
+
+@pytest.mark.asyncio
+async def test_broken_location_is_not_fetched_while_open(mock_session):
+    """A location that keeps failing stops being fetched until its cooldown is over."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    for store in (coordinator.pickup_history, coordinator.activity, coordinator.budget):
+        store._store = MagicMock()
+    entry = MagicMock()
+    entry.entry_id = "entry1"
+    entry.data = {
+        "locations": [
+            {"latitude": 50.0, "longitude": 10.0, "distance": 5},
+            {"latitude": 0.0, "longitude": 0.0, "distance": 5},
+        ]
+    }
+    entry.options = {}
+    coordinator.add_entry(entry)
+    coordinator._add_account_tasks = MagicMock(return_value=False)
+    coordinator._account_from_results = MagicMock(return_value={})
+
+    async def location(entry_id, lat, lon, dist, fetch_walls=True):
+        # The API rejects the second location, both parts fail
+        return {} if lat == 0.0 else {"baskets": [], "fairteiler": []}
+
+    coordinator.fetch_location_data = AsyncMock(side_effect=location)
+
+    with patch("custom_components.foodsharing.coordinator.async_track_point_in_time"):
+        for _ in range(FAILURE_THRESHOLD + 2):
+            coordinator._due.clear()
+            coordinator.data = await coordinator._fetch_all_data()
+
+    fetched = [call.args[1] for call in coordinator.fetch_location_data.await_args_list]
+    assert fetched.count(50.0) == FAILURE_THRESHOLD + 2
+    assert fetched.count(0.0) == FAILURE_THRESHOLD
+    assert coordinator.stale == {("entry1", 1)}
+    assert not coordinator.breaker.allow(("entry1", 1), dt_util.utcnow())
+    assert coordinator.breaker.allow(("entry1", 1), dt_util.utcnow() + BASE_COOLDOWN + timedelta(seconds=1))
+
+
+@pytest.mark.asyncio
+async def test_failing_endpoint_stops_sending_requests(mock_session):
+    """Requests to a URL whose circuit is open fail at once without touching the network."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    mock_session.get.return_value.__aenter__.return_value = MagicMock(
+        status=500, headers={}, read=AsyncMock(return_value=b"")
+    )
+
+    for _ in range(FAILURE_THRESHOLD + 2):
+        assert await coordinator.fetch_bananas() == {}
+
+    assert mock_session.get.call_count == FAILURE_THRESHOLD
+    assert coordinator.breaker.as_dict(dt_util.utcnow())["/api/users/current/bananas/meta"]["state"] == OPEN
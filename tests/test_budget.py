@@ -0,0 +1,152 @@
+"""Tests for the Foodsharing daily request budget."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.foodsharing.budget import (
+    KIND_ACCOUNT,
+    KIND_DETAILS,
+    KIND_LOCATION,
+    KIND_WALLS,
+    Consumer,
+    RequestBudget,
+)
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+
+
+def _budget(daily_budget=0):
+    budget = RequestBudget(MagicMock(), "test@example.com")
+    budget._store = MagicMock()
+    budget.daily_budget = daily_budget
+    return budget
+
+
+def test_plan_without_budget_is_empty():
+    """Without a budget nothing is throttled."""
+    budget = _budget()
+    assert budget.plan([Consumer(KIND_ACCOUNT, 4, 1.0)], dt_util.utcnow()) == {}
+
+
+def test_plan_divides_remaining_requests_by_weight():
+    """Consumers get request rates proportional to their weight."""
+    budget = _budget(1000)
+    budget.async_record(KIND_ACCOUNT, 200)
+    now = dt_util.utcnow()
+    consumers = [Consumer("busy", 2, 2.0), Consumer("quiet", 2, 1.0), Consumer(KIND_WALLS, 6, 1.0)]
+
+    planned = budget.plan(consumers, now)
+
+    assert planned["quiet"] == pytest.approx(2 * planned["busy"])
+    assert planned[KIND_WALLS] == pytest.approx(3 * planned["quiet"])
+    # Spending at the planned rates uses exactly the remaining requests until midnight
+    minutes_left = (dt_util.start_of_local_day() + timedelta(days=1) - now).total_seconds() / 60
+    spent = sum(c.cost / planned[c.key] for c in consumers) * minutes_left
+    assert spent == pytest.approx(800)
+
+
+def test_plan_waits_for_tomorrow_when_spent():
+    """A spent budget pushes every consumer to the next day."""
+    budget = _budget(10)
+    budget.async_record(KIND_LOCATION, 10)
+    now = dt_util.utcnow()
+
+    planned = budget.plan([Consumer(KIND_ACCOUNT, 4, 1.0)], now)
+
+    assert budget.remaining == 0
+    midnight = dt_util.start_of_local_day() + timedelta(days=1)
+    assert now + timedelta(minutes=planned[KIND_ACCOUNT]) >= midnight - timedelta(seconds=1)
+
+
+def test_cost_is_learned_per_poll():
+    """The requests per poll follow what was actually spent."""
+    budget = _budget(100)
+    assert budget.cost(KIND_LOCATION, 2) == 2
+    budget.async_record(KIND_LOCATION, 3)
+    budget.async_record_poll(KIND_LOCATION)
+    budget.async_record(KIND_LOCATION, 5)
+    budget.async_record_poll(KIND_LOCATION)
+    assert budget.cost(KIND_LOCATION, 2) == 4
+    assert budget.used_today == 8
+    # Detail prefetches are spent because of the location polls
+    budget.async_record(KIND_DETAILS, 6)
+    assert budget.cost(KIND_LOCATION, 2, KIND_DETAILS) == 7
+
+
+@pytest.mark.asyncio
+async def test_coordinator_learns_account_poll_cost(mock_session):
+    """Account polls are counted, also when their messages arrive late, so their cost is learned."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@example.com", "pass")
+    coordinator.budget._store = MagicMock()
+    coordinator.budget.async_record(KIND_ACCOUNT, 9)
+
+    coordinator._account_from_results({"messages": 0, "bells": 0}, False, {})
+    coordinator._account_from_results({"pickups": []}, False, {})
+
+    assert coordinator.budget.polls[KIND_ACCOUNT] == 1
+    assert coordinator.budget.cost(KIND_ACCOUNT, 4) == 9
+
+
+def test_match_score_decays():
+    """Keyword matches count half as much after a day."""
+    budget = _budget(100)
+    now = dt_util.utcnow()
+    budget.note_matches("slice", 4, now)
+    assert budget.match_score("slice", now + timedelta(days=1)) == pytest.approx(2)
+    assert budget.match_score("other", now) == 0
+
+
+def test_coordinator_budget_stretches_intervals(mock_session):
+    """The budget slows down polling, most of all for disabled locations."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@example.com", "pass")
+    coordinator._sensor_enabled = lambda unique_id: not unique_id.endswith("-1")
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {
+        "scan_interval": 1,
+        "locations": [
+            {"latitude": 50.0, "longitude": 10.0, "distance": 5},
+            {"latitude": 51.0, "longitude": 11.0, "distance": 5},
+        ],
+    }
+    entry.options = {"daily_request_budget": 200}
+    coordinator.add_entry(entry)
+    now = dt_util.utcnow()
+
+    intervals = coordinator._slice_intervals(now)
+
+    assert coordinator.budget.daily_budget == 200
+    assert intervals[("entry", 0)] > 1
+    assert intervals[("entry", 1)] == pytest.approx(10 * intervals[("entry", 0)])
+    assert coordinator._account_interval(intervals) > intervals[("entry", 0)]
+
+    entry.options = {}
+    coordinator.add_entry(entry)
+    assert coordinator._slice_intervals(now) == {("entry", 0): 1, ("entry", 1): 1}
+    assert coordinator._account_interval(intervals) == min(intervals.values())
+
+
+def test_carry_over_walls_keeps_latest_posts():
+    """Fairteiler fetched without their walls keep the previous latest post."""
+    post = {"id": 7, "body": "Brot"}
+    result = {"fairteiler": [{"id": 1}, {"id": 2}, {"id": 3, "latest_post": None}]}
+    previous = {"fairteiler": [{"id": 1, "latest_post": post}, {"id": 3, "latest_post": post}]}
+
+    FoodsharingCoordinator._carry_over_walls(result, previous)
+
+    # A wall that was fetched and has no posts any more is not overridden
+    assert result["fairteiler"] == [
+        {"id": 1, "latest_post": post},
+        {"id": 2, "latest_post": None},
+        {"id": 3, "latest_post": None},
+    ]
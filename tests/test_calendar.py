@@ -0,0 +1,127 @@
+"""Tests for the Foodsharing calendar."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.foodsharing.calendar import FoodsharingCalendar
+from custom_components.foodsharing.pickup_history import PickupHistory
+
+
+def _history(pickups=()):
+    history = PickupHistory(MagicMock(), "test@example.com")
+    history._store = MagicMock()
+    history.async_merge(list(pickups))
+    return history
+
+
+def _calendar(pickups):
+    coordinator = MagicMock()
+    coordinator.data = {"account": {"pickups": pickups}, "locations": {}}
+    coordinator.pickup_history = _history(pickups)
+    return FoodsharingCalendar(coordinator, "test@example.com"), coordinator
+
+
+def _ts(delta: timedelta) -> float:
+    return (dt_util.utcnow() + delta).timestamp()
+
+
+def test_next_event_is_earliest_unfinished():
+    """The next event ignores finished pickups and is independent of input order."""
+    calendar, _ = _calendar(
+        [
+            {"time": _ts(timedelta(days=2)), "store_name": "Later"},
+            {"time": _ts(timedelta(days=-1)), "store_name": "Past"},
+            {"time": _ts(timedelta(minutes=-30)), "store_name": "Running"},
+            {"time": _ts(timedelta(days=1)), "store_name": "Tomorrow"},
+        ]
+    )
+    assert calendar.event is not None
+    assert calendar.event.summary == "Pickup: Running"
+
+
+@pytest.mark.asyncio
+async def test_get_events_range_query():
+    """Range queries return overlapping events in start order."""
+    calendar, _ = _calendar([{"time": _ts(timedelta(days=d)), "store_name": f"Day {d}"} for d in range(10, -10, -1)])
+    now = dt_util.now()
+
+    events = await calendar.async_get_events(
+        MagicMock(), now + timedelta(days=2, hours=-1), now + timedelta(days=5, hours=-1)
+    )
+    assert [e.summary for e in events] == ["Pickup: Day 2", "Pickup: Day 3", "Pickup: Day 4"]
+
+    # An event that started before the window but is still running overlaps it
+    events = await calendar.async_get_events(MagicMock(), now + timedelta(minutes=30), now + timedelta(hours=2))
+    assert [e.summary for e in events] == ["Pickup: Day 0"]
+
+    assert await calendar.async_get_events(MagicMock(), now + timedelta(days=20), now + timedelta(days=30)) == []
+
+
+def test_events_rebuilt_only_when_pickups_change():
+    """Unchanged pickups keep the existing CalendarEvent objects."""
+    pickups = [{"time": _ts(timedelta(days=1)), "store_name": "Store"}]
+    calendar, coordinator = _calendar(pickups)
+    events_before = calendar._events
+
+    coordinator.pickup_history.async_merge([dict(p) for p in pickups])
+    with patch.object(calendar, "async_write_ha_state"):
+        calendar._handle_coordinator_update()
+    assert calendar._events is events_before
+
+    coordinator.pickup_history.async_merge(pickups + [{"time": _ts(timedelta(days=3))}])
+    with patch.object(calendar, "async_write_ha_state"):
+        calendar._handle_coordinator_update()
+    assert len(calendar._events) == 2
+
+
+def test_history_keeps_completed_pickups():
+    """Pickups that drop out of the API after their start stay in the history."""
+    history = _history(
+        [
+            {"id": 1, "time": _ts(timedelta(hours=-2)), "store_name": "Done"},
+            {"id": 2, "time": _ts(timedelta(days=3)), "store_name": "Signed out"},
+        ]
+    )
+    assert len(history.all()) == 2
+
+    # The next poll no longer lists either pickup
+    assert history.async_merge([]) is True
+    assert [r["store_name"] for r in history.all()] == ["Done"]
+    assert len(history) == 2
+
+
+def test_history_saved_only_when_it_changed():
+    """Polls that only see the same pickups again don't reschedule the save."""
+    soon = {"id": 1, "time": _ts(timedelta(hours=2)), "store_name": "Store"}
+    history = _history([soon])
+    assert history._store.async_delay_save.call_count == 1
+
+    history.async_merge([soon])
+    assert history._store.async_delay_save.call_count == 1
+
+    # Seeing it within a day of its start marks it done, which must survive a restart
+    history._records["1"]["last_seen"] = _ts(timedelta(days=-2))
+    history.async_merge([soon])
+    assert history._store.async_delay_save.call_count == 2
+    history.async_merge([soon])
+    assert history._store.async_delay_save.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_history_round_trip():
+    """Stored records are restored into the time index."""
+    source = _history([{"id": d, "time": _ts(timedelta(days=d)), "store_name": f"Day {d}"} for d in (3, -5, 1)])
+
+    history = PickupHistory(MagicMock(), "test@example.com")
+    history._store = MagicMock()
+    history._store.async_load = AsyncMock(return_value=source._data_to_save())
+    await history.async_load()
+
+    assert history.revision == 1
+    assert [r["store_name"] for r in history.between(_ts(timedelta(days=-6)), _ts(timedelta(days=2)))] == [
+        "Day -5",
+        "Day 1",
+    ]
@@ -0,0 +1,174 @@
+"""Tests for the Foodsharing request coalescer."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.foodsharing.coalesce import Coalescer
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+
+from .responses import set_body
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    """Identical calls overlapping in time run once and all get the result."""
+    coalescer = Coalescer()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"id": 1}
+
+    callers = [asyncio.create_task(coalescer.run(("GET", "/api/users/current"), fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*callers) == [{"id": 1}] * 3
+    assert calls == 1
+    assert coalescer.coalesced == 2
+
+    # Within the memoization window the result is reused
+    assert await coalescer.run(("GET", "/api/users/current"), fetch) == {"id": 1}
+    assert calls == 1
+    coalescer.clear()
+    await coalescer.run(("GET", "/api/users/current"), fetch)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_and_rejected_results_are_not_memoized():
+    """Errors reach every waiting caller but the next call tries again."""
+    coalescer = Coalescer()
+    fetch = AsyncMock(side_effect=[RuntimeError("down"), 401, 200])
+
+    with pytest.raises(RuntimeError):
+        await coalescer.run("key", fetch)
+    assert await coalescer.run("key", fetch, lambda status: status < 400) == 401
+    assert await coalescer.run("key", fetch, lambda status: status < 400) == 200
+    assert fetch.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_others():
+    """The shared call keeps running when the caller that started it goes away."""
+    coalescer = Coalescer()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "ok"
+
+    first = asyncio.create_task(coalescer.run("key", fetch))
+    second = asyncio.create_task(coalescer.run("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "ok"
+
+
+@pytest.mark.asyncio
+async def test_coordinator_coalesces_identical_requests(mock_session):
+    """A profile fetch and a session check running together send one request."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator.async_save_session = AsyncMock()
+    release = asyncio.Event()
+    response = AsyncMock(status=200)
+    set_body(response, json.dumps({"id": 7, "regionId": 3}).encode())
+
+    async def answer(*args):
+        await release.wait()
+        return response
+
+    mock_session.get.return_value.__aenter__.side_effect = answer
+
+    profile = asyncio.create_task(coordinator.fetch_user_profile())
+    login = asyncio.create_task(coordinator.login())
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await profile == {"id": 7, "regionId": 3}
+    assert await login is True
+    assert mock_session.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_accounts_share_public_data(mock_session):
+    """Statistics are fetched once for all accounts; account data is not shared."""
+    shared = Coalescer()
+    coordinators = []
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        for email in ("a@test.com", "b@test.com"):
+            coordinators.append(FoodsharingCoordinator(MagicMock(), email, "pass", shared))
+    response = AsyncMock(status=200)
+    set_body(response, json.dumps({"fetchWeight": 12}).encode())
+    mock_session.get.return_value.__aenter__.return_value = response
+
+    for coordinator in coordinators:
+        assert (await coordinator.fetch_global_statistics())["fetchWeight"] == 12
+    assert mock_session.get.call_count == 1
+    assert shared.coalesced == 1
+
+    set_body(response, json.dumps({"id": 7}).encode())
+    for coordinator in coordinators:
+        await coordinator.fetch_user_profile()
+    assert mock_session.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_results_expire_after_their_ttl():
+    """A result memoized with a TTL is reused until it runs out."""
+    coalescer = Coalescer()
+    fetch = AsyncMock(return_value="stats")
+
+    with patch("custom_components.foodsharing.coalesce.time.monotonic", return_value=100.0):
+        await coalescer.run("key", fetch, ttl=60)
+    with patch("custom_components.foodsharing.coalesce.time.monotonic", return_value=150.0):
+        await coalescer.run("key", fetch, ttl=60)
+    assert fetch.await_count == 1
+    with patch("custom_components.foodsharing.coalesce.time.monotonic", return_value=161.0):
+        await coalescer.run("key", fetch, ttl=60)
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_accounts_do_not_share_failed_answers(mock_session):
+    """An account that joined another account's request asks again itself when the answer was not a success."""
+    shared = Coalescer()
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        first, second = (FoodsharingCoordinator(MagicMock(), email, "pass", shared) for email in ("a@x.de", "b@x.de"))
+    release = asyncio.Event()
+    expired = AsyncMock(status=401)
+    set_body(expired, b"")
+    ok = AsyncMock(status=200)
+    set_body(ok, json.dumps({"fetchWeight": 12}).encode())
+    answers = iter((expired, ok))
+
+    async def answer(*args):
+        await release.wait()
+        return next(answers)
+
+    mock_session.get.return_value.__aenter__.side_effect = answer
+
+    tasks = [asyncio.create_task(c.fetch_global_statistics()) for c in (first, second)]
+    await asyncio.sleep(0.01)
+    release.set()
+    assert await tasks[0] == {}
+    assert (await tasks[1])["fetchWeight"] == 12
+    assert mock_session.get.call_count == 2
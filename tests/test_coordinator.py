@@ -1,13 +1,18 @@
+import asyncio
+import json
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.util import dt as dt_util
 
 from custom_components.foodsharing.coordinator import (
     AuthenticationFailed,
     FoodsharingCoordinator,
 )
 
+from .responses import set_body
+
 
 def _make_entry(data_overrides=None):
     """Create a mock ConfigEntry with all required keys."""
@@ -39,7 +44,7 @@ async def test_coordinator_fetch_pickups(mock_session):
         # 1. Test successful array return from correct endpoint
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json.return_value = [{"id": 1, "store_name": "Test Store"}]
+        set_body(mock_response, json.dumps([{"id": 1, "store_name": "Test Store"}]).encode())
 
         mock_session.get.return_value.__aenter__.return_value = mock_response
 
@@ -54,13 +59,15 @@ async def test_coordinator_fetch_pickups(mock_session):
         )
 
         # 2. Test successful dictionary return ("pickups" key)
-        mock_response.json.return_value = {"pickups": [{"id": 2, "store_name": "Store 2"}]}
+        set_body(mock_response, json.dumps({"pickups": [{"id": 2, "store_name": "Store 2"}]}).encode())
+        coordinator.coalescer.clear()
         pickups = await coordinator.fetch_pickups()
         assert len(pickups) == 1
         assert pickups[0]["id"] == 2
 
         # 3. Test successful dictionary return ("data" key)
-        mock_response.json.return_value = {"data": [{"id": 3, "store_name": "Store 3"}]}
+        set_body(mock_response, json.dumps({"data": [{"id": 3, "store_name": "Store 3"}]}).encode())
+        coordinator.coalescer.clear()
         pickups = await coordinator.fetch_pickups()
         assert len(pickups) == 1
         assert pickups[0]["id"] == 3
@@ -78,11 +85,11 @@ async def test_coordinator_fetch_conversations(mock_session):
         # Test conversation list json
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json.return_value = [{"unread": 1, "last_message": {"id": 10}}]
+        set_body(mock_response, json.dumps([{"unread": 1, "last_message": {"id": 10}}]).encode())
 
         mock_count = AsyncMock()
         mock_count.status = 200
-        mock_count.json.return_value = {"unread": 1}
+        set_body(mock_count, json.dumps({"unread": 1}).encode())
 
         # Need to handle consecutive get calls
         mock_session.get.return_value.__aenter__.side_effect = [
@@ -105,7 +112,7 @@ async def test_coordinator_fetch_bells(mock_session):
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json.return_value = [{"is_read": 0, "id": 55}]
+        set_body(mock_response, json.dumps([{"is_read": 0, "id": 55}]).encode())
 
         mock_session.get.return_value.__aenter__.return_value = mock_response
 
@@ -168,7 +175,7 @@ async def test_coordinator_fetch_bells_fires_event(mock_session):
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json.return_value = [{"is_read": 0, "id": 101, "title": "New Bell"}]
+        set_body(mock_response, json.dumps([{"is_read": 0, "id": 101, "title": "New Bell"}]).encode())
         mock_session.get.return_value.__aenter__.return_value = mock_response
 
         # Mock bus.async_fire
@@ -195,8 +202,406 @@ async def test_coordinator_fetch_all_data_auth_propagation(mock_session):
         # Mock a 401 response for one of the fetch calls
         mock_auth_failed = AsyncMock()
         mock_auth_failed.status = 401
+        set_body(mock_auth_failed, b"")
 
         mock_session.get.return_value.__aenter__.return_value = mock_auth_failed
 
         with pytest.raises(AuthenticationFailed):
             await coordinator._fetch_all_data()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_relogin_runs_the_cycle_again(mock_session):
+    """A cycle that failed on an expired session is fetched again in full after the login."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator.activity._store = MagicMock()
+    coordinator.budget._store = MagicMock()
+    entry = _make_entry({"locations": [{"latitude": 50.0, "longitude": 10.0, "distance": 5}]})
+    entry.entry_id = "entry1"
+    coordinator.add_entry(entry)
+    coordinator._add_account_tasks = MagicMock(return_value=False)
+    coordinator._account_from_results = MagicMock(return_value={})
+    coordinator.login = AsyncMock(return_value=True)
+    coordinator.fetch_location_data = AsyncMock(return_value={"baskets": [], "fairteiler": []})
+
+    with patch("custom_components.foodsharing.coordinator.async_track_point_in_time"):
+        coordinator.data = await coordinator._fetch_all_data()
+        coordinator._due.clear()
+        coordinator._account_due = None
+        coordinator.fetch_location_data.reset_mock()
+        coordinator.fetch_location_data.side_effect = [
+            AuthenticationFailed("expired"),
+            {"baskets": [{"id": 5}], "fairteiler": []},
+        ]
+        with patch("custom_components.foodsharing.coordinator.async_delete_issue"):
+            data = await coordinator._async_update_data()
+
+    assert coordinator.fetch_location_data.await_count == 2
+    assert coordinator._add_account_tasks.call_count == 3
+    assert data["locations"]["entry1"][0]["baskets"] == [{"id": 5}]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_expires_baskets_locally(mock_session):
+    """Expired baskets are dropped at their expiry time, notifying only their slice."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator._prefetch_details = MagicMock()
+    entry = _make_entry()
+    entry.entry_id = "entry1"
+    coordinator.add_entry(entry)
+
+    now = dt_util.utcnow()
+    baskets = coordinator._process_baskets_for_location(
+        "entry1",
+        [
+            {"id": 2, "until": (now + timedelta(minutes=5)).timestamp()},
+            {"id": 1, "until": (now + timedelta(hours=5)).isoformat()},
+        ],
+    )
+    assert [b["expires_at"] for b in baskets] == [
+        dt_util.utc_from_timestamp((now + timedelta(minutes=5)).timestamp()),
+        now + timedelta(hours=5),
+    ]
+
+    coordinator.data = {
+        "account": {},
+        "locations": {"entry1": [{"baskets": baskets, "fairteiler": []}, {"baskets": [], "fairteiler": []}]},
+    }
+    expired_slice, other_slice, reconciler = MagicMock(), MagicMock(), MagicMock()
+    coordinator.async_add_listener(expired_slice, ("entry1", 0))
+    coordinator.async_add_listener(other_slice, ("entry1", 1))
+    coordinator.async_add_listener(reconciler, "entry1")
+
+    with patch("custom_components.foodsharing.coordinator.async_track_point_in_time") as mock_track:
+        coordinator._async_expire_baskets(now + timedelta(minutes=10))
+
+    assert [b["id"] for b in coordinator.data["locations"]["entry1"][0]["baskets"]] == [1]
+    expired_slice.assert_called_once()
+    reconciler.assert_called_once()
+    other_slice.assert_not_called()
+    # The next removal is scheduled for the remaining basket
+    assert mock_track.call_args[0][2] == now + timedelta(hours=5)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fetches_only_due_locations(mock_session):
+    """Each entry polls at its own interval and only its slices are notified."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator.activity._store = MagicMock()
+    coordinator.budget._store = MagicMock()
+    fast = _make_entry({"scan_interval": 1, "locations": [{"latitude": 50.0, "longitude": 10.0, "distance": 5}]})
+    fast.entry_id = "fast"
+    slow = _make_entry({"scan_interval": 10, "locations": [{"latitude": 51.0, "longitude": 11.0, "distance": 5}]})
+    slow.entry_id = "slow"
+    coordinator.add_entry(fast)
+    coordinator.add_entry(slow)
+    assert coordinator.update_interval == timedelta(minutes=1)
+
+    coordinator._add_account_tasks = MagicMock(return_value=False)
+    coordinator._account_from_results = MagicMock(return_value={"pickups": []})
+    coordinator.fetch_location_data = AsyncMock(return_value={"baskets": [], "fairteiler": []})
+    start = dt_util.utcnow()
+
+    with (
+        patch("custom_components.foodsharing.coordinator.dt_util.utcnow", return_value=start),
+        patch("custom_components.foodsharing.coordinator.async_track_point_in_time"),
+    ):
+        coordinator.data = await coordinator._fetch_all_data()
+    assert coordinator.fetch_location_data.await_count == 2
+
+    listeners = {context: MagicMock() for context in (None, "fast", ("fast", 0), "slow", ("slow", 0))}
+    for context, listener in listeners.items():
+        coordinator.async_add_listener(listener, context)
+
+    coordinator.fetch_location_data.reset_mock()
+    tick = max(coordinator._due[("fast", 0)], coordinator._account_due)
+    assert tick < start + timedelta(minutes=2) < coordinator._due[("slow", 0)]
+    with (
+        patch("custom_components.foodsharing.coordinator.dt_util.utcnow", return_value=tick),
+        patch("custom_components.foodsharing.coordinator.async_track_point_in_time"),
+    ):
+        coordinator.data = await coordinator._fetch_all_data()
+        coordinator.async_update_listeners()
+
+    coordinator.fetch_location_data.assert_awaited_once_with("fast", 50.0, 10.0, 5, fetch_walls=True)
+    assert coordinator.data["locations"]["slow"] == [{"baskets": [], "fairteiler": []}]
+    for context in (None, "fast", ("fast", 0)):
+        listeners[context].assert_called_once()
+    listeners["slow"].assert_not_called()
+    listeners[("slow", 0)].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_polling_profile(mock_session):
+    """Outside the fast profile an entry polls at the background rate and switches back immediately."""
+    hass = MagicMock()
+    hass.states.get.return_value = MagicMock(state="not_home")
+    with (
+        patch(
+            "custom_components.foodsharing.coordinator.async_get_clientsession",
+            return_value=mock_session,
+        ),
+        patch("custom_components.foodsharing.coordinator.async_track_state_change_event") as mock_track,
+    ):
+        coordinator = FoodsharingCoordinator(hass, "test@test.com", "pass")
+        entry = _make_entry({"scan_interval": 2})
+        entry.entry_id = "entry1"
+        entry.options = {"active_entities": ["person.alice"], "background_scan_interval": 20}
+        coordinator.add_entry(entry)
+
+    assert mock_track.call_args[0][1] == ["person.alice"]
+    assert coordinator.update_interval == timedelta(minutes=20)
+
+    coordinator._due[("entry1", 0)] = dt_util.utcnow() + timedelta(minutes=20)
+    hass.states.get.return_value = MagicMock(state="home")
+    with patch.object(coordinator, "async_request_refresh", new=MagicMock()) as mock_refresh:
+        mock_track.call_args[0][2](MagicMock())
+    mock_refresh.assert_called_once()
+    hass.async_create_task.assert_called_once()
+    assert ("entry1", 0) not in coordinator._due
+    assert coordinator._slice_intervals(dt_util.utcnow()) == {("entry1", 0): 2}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_overlaps_account_and_location_fetches(mock_session):
+    """Location fetches start without waiting for the account calls; region stats wait for the profile."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    for store in (coordinator.pickup_history, coordinator.activity, coordinator.budget):
+        store._store = MagicMock()
+    entry = _make_entry({"locations": [{"latitude": 50.0, "longitude": 10.0, "distance": 5}]})
+    entry.entry_id = "entry1"
+    coordinator.add_entry(entry)
+
+    location_started = asyncio.Event()
+    order: list[str] = []
+
+    async def messages():
+        # Would deadlock if the location fetch waited for the account calls
+        await asyncio.wait_for(location_started.wait(), 1)
+        return 2
+
+    async def location(*args, **kwargs):
+        location_started.set()
+        return {"baskets": [], "fairteiler": []}
+
+    async def profile():
+        order.append("profile")
+        return {"regionId": 42}
+
+    async def region(region_id):
+        order.append(f"region_{region_id}")
+        return {"savedFoodKgLastMonth": 5}
+
+    coordinator.fetch_unread_messages = messages
+    coordinator.fetch_location_data = location
+    coordinator.fetch_user_profile = profile
+    coordinator.fetch_region_statistics = region
+    for name in ("fetch_bells", "fetch_pickups", "fetch_own_baskets", "fetch_global_statistics"):
+        setattr(coordinator, name, AsyncMock(return_value=0 if name == "fetch_bells" else []))
+    for name in ("fetch_user_statistics", "fetch_bananas", "fetch_buddies"):
+        setattr(coordinator, name, AsyncMock(return_value={}))
+
+    with patch("custom_components.foodsharing.coordinator.async_track_point_in_time"):
+        data = await coordinator._fetch_all_data()
+
+    assert order == ["profile", "region_42"]
+    assert data["account"]["messages"] == 2
+    assert data["account"]["region_stats"] == {"savedFoodKgLastMonth": 5}
+    assert coordinator.region_id == 42
+
+
+@pytest.mark.asyncio
+async def test_coordinator_publishes_partial_results_at_deadline(mock_session):
+    """Slices missing the cycle deadline stay stale and are published once they arrive."""
+    hass = MagicMock()
+    background: list[asyncio.Task] = []
+    hass.async_create_background_task.side_effect = lambda coro, name: background.append(asyncio.create_task(coro))
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(hass, "test@test.com", "pass")
+    for store in (coordinator.pickup_history, coordinator.activity, coordinator.budget):
+        store._store = MagicMock()
+    entry = _make_entry(
+        {
+            "locations": [
+                {"latitude": 50.0, "longitude": 10.0, "distance": 5},
+                {"latitude": 51.0, "longitude": 11.0, "distance": 5},
+            ]
+        }
+    )
+    entry.entry_id = "entry1"
+    coordinator.add_entry(entry)
+    coordinator._add_account_tasks = MagicMock(return_value=False)
+    coordinator._account_from_results = MagicMock(return_value={"pickups": []})
+
+    release = asyncio.Event()
+
+    async def location(entry_id, lat, lon, dist, fetch_walls=True):
+        if lat == 51.0:
+            await release.wait()
+        return {"baskets": [{"id": int(lat)}], "fairteiler": []}
+
+    coordinator.fetch_location_data = location
+    listeners = {context: MagicMock() for context in (None, ("entry1", 0), ("entry1", 1))}
+    for context, listener in listeners.items():
+        coordinator.async_add_listener(listener, context)
+
+    with (
+        patch("custom_components.foodsharing.coordinator.CYCLE_DEADLINE", timedelta(milliseconds=50)),
+        patch("custom_components.foodsharing.coordinator.async_track_point_in_time"),
+    ):
+        coordinator.data = await coordinator._fetch_all_data()
+        assert coordinator.data["locations"]["entry1"][0]["baskets"] == [{"id": 50}]
+        assert coordinator.data["locations"]["entry1"][1] == {"baskets": [], "fairteiler": []}
+        assert coordinator.stale == {("entry1", 1)}
+        # The straggler still belongs to the first update and must not fire events for existing items
+        assert coordinator._is_first_update
+
+        # A tick while the straggler is running does not fetch it again
+        coordinator._due.clear()
+        coordinator._account_due = None
+        coordinator.data = await coordinator._fetch_all_data()
+        assert len(background) == 1
+
+        release.set()
+        await background[0]
+
+    assert coordinator.data["locations"]["entry1"][1]["baskets"] == [{"id": 51}]
+    assert coordinator.stale == set()
+    assert not coordinator._is_first_update
+    listeners[("entry1", 1)].assert_called_once()
+    listeners[("entry1", 0)].assert_not_called()
+    listeners[None].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_serves_last_good_data_on_failure(mock_session):
+    """Failed endpoints keep their last good value, marked stale, until it exceeds the max age."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator._prefetch_details = MagicMock()
+    for store in (coordinator.pickup_history, coordinator.activity, coordinator.budget, coordinator.retry):
+        store._store = MagicMock()
+    entry = _make_entry({"locations": [{"latitude": 50.0, "longitude": 10.0, "distance": 5}]})
+    entry.entry_id = "entry1"
+    coordinator.add_entry(entry)
+
+    payloads = {
+        "mailbox/unread-count": {"unread": 0},
+        "bells": [{"id": 1, "is_read": 0}, {"id": 2, "is_read": 0}],
+        "users/current/pickups/registered": [],
+        "baskets/own": [],
+        "statistics": {},
+        "users/current/stats": {},
+        "users/current": {"regionId": 3},
+        "users/current/bananas/meta": {},
+        "users/current/buddies": [],
+        "regions/3/statistics": {},
+        "baskets/nearby": [{"id": 5, "description": "Brot"}],
+        "foodSharePoints/nearby": [{"id": 9, "name": "Fairteiler"}],
+        "fairteiler/9/wall": [{"id": 1, "body": "Äpfel"}],
+    }
+    failing: set[str] = set()
+
+    def get(url, headers=None):
+        path = url.split("/api/", 1)[1].split("?", 1)[0]
+        response = MagicMock(status=500 if path in failing else 200, headers={})
+        set_body(response, json.dumps(payloads[path]).encode())
+        response.text = AsyncMock(return_value="")
+        request = MagicMock()
+        request.__aenter__ = AsyncMock(return_value=response)
+        request.__aexit__ = AsyncMock(return_value=None)
+        return request
+
+    mock_session.get = MagicMock(side_effect=get)
+
+    async def cycle():
+        coordinator._due.clear()
+        coordinator._account_due = None
+        # Cycles are minutes apart in practice, beyond the memoization window
+        coordinator.coalescer.clear()
+        coordinator.shared.clear()
+        coordinator.data = await coordinator._fetch_all_data()
+        return coordinator.data
+
+    with patch("custom_components.foodsharing.coordinator.async_track_point_in_time"):
+        await cycle()
+        failing.update({"bells", "baskets/nearby", "fairteiler/9/wall"})
+        data = await cycle()
+
+        assert data["account"]["bells"] == 2
+        loc = data["locations"]["entry1"][0]
+        assert [b["id"] for b in loc["baskets"]] == [5]
+        assert loc["fairteiler"][0]["latest_post"] == {"id": 1, "body": "Äpfel"}
+        assert [r["type"] for r in coordinator.search.search("Äpfel")] == ["wall_post"]
+        assert coordinator.stale == {None, ("entry1", 0)}
+        now = dt_util.utcnow()
+        assert coordinator.freshness.attributes([("entry1", 0, "baskets")], now) == {"data_age": 0, "stale": True}
+        assert coordinator.freshness.attributes([("entry1", 0, "fairteiler")], now) == {
+            "data_age": None,
+            "stale": False,
+        }
+
+        # Beyond the max age the baskets are no longer served
+        coordinator.freshness.fetched_at[("entry1", 0, "baskets")] -= timedelta(hours=7)
+        data = await cycle()
+        assert data["locations"]["entry1"][0]["baskets"] == []
+        assert coordinator.freshness.attributes([("entry1", 0, "baskets")], dt_util.utcnow())["data_age"] == 420
+
+        failing.clear()
+        data = await cycle()
+
+    assert data["locations"]["entry1"][0]["baskets"][0]["id"] == 5
+    assert coordinator.stale == set()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_meters_fallback_clears_failure(mock_session):
+    """A successful retry in meters is fresh data even though the request in km failed."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator._prefetch_details = MagicMock()
+    entry = _make_entry()
+    entry.entry_id = "entry1"
+    coordinator.add_entry(entry)
+
+    def get(url, headers=None):
+        in_km = url.endswith("distance=5")
+        response = MagicMock(status=500 if in_km else 200, headers={})
+        set_body(response, b"" if in_km else b'[{"id": 5, "description": "Brot"}]')
+        response.text = AsyncMock(return_value="")
+        request = MagicMock()
+        request.__aenter__ = AsyncMock(return_value=response)
+        request.__aexit__ = AsyncMock(return_value=None)
+        return request
+
+    mock_session.get = MagicMock(side_effect=get)
+
+    baskets = await coordinator._fresh("baskets", coordinator.fetch_baskets_for_location, "entry1", 50.0, 10.0, 5)
+
+    assert [b["id"] for b in baskets] == [5]
+    assert mock_session.get.call_count == 2
@@ -0,0 +1,99 @@
+"""Tests for the basket detail prefetch."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+from custom_components.foodsharing.details import PREFETCH_CONCURRENCY, PREFETCH_TOP, BasketDetails, parse_details
+
+from .responses import set_body
+
+
+def test_parse_details():
+    """Relative picture paths are made absolute and the creator is reduced to a name."""
+    details = parse_details(
+        {
+            "basket": {
+                "description": "Brot und Äpfel",
+                "pictures": ["/images/basket/1.jpg", "https://cdn.example/2.jpg"],
+                "contactTypes": [1, 2],
+                "creator": {"id": 5, "name": "Anna"},
+            }
+        },
+        "https://foodsharing.de",
+    )
+    assert details["pictures"] == ["https://foodsharing.de/images/basket/1.jpg", "https://cdn.example/2.jpg"]
+    assert details["contact_types"] == [1, 2]
+    assert details["creator"] == "Anna"
+    assert parse_details([], "https://foodsharing.de") is None
+
+
+def test_only_matches_and_newest_baskets_are_wanted():
+    """Keyword matches and the newest baskets are prefetched once."""
+    details = BasketDetails()
+    baskets = [{"id": i, "keyword_match": i == 1} for i in range(10, 0, -1)]
+
+    assert details.wanted(baskets) == [1, *range(10, 10 - PREFETCH_TOP, -1)]
+    # Already pending or cached ids are not requested again
+    details.release(10)
+    details.put(9, {})
+    assert details.wanted(baskets) == [10]
+
+
+@pytest.mark.asyncio
+async def test_details_are_prefetched_in_the_background(mock_session):
+    """Keyword match events don't wait for details, which are fetched a few at a time for the next poll."""
+    hass = MagicMock()
+    hass.async_create_background_task = lambda coro, name: asyncio.create_task(coro)
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(hass, "test@test.com", "pass")
+    entry = MagicMock(data={"keywords": "brot"}, options={})
+    coordinator.entries["entry1"] = entry
+    coordinator._is_first_update = False
+
+    running = peak = 0
+
+    async def answer(*args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return response
+
+    response = AsyncMock(status=200)
+    set_body(response, json.dumps({"basket": {"description": "Frisches Brot", "pictures": ["/b.jpg"]}}).encode())
+    mock_session.get.return_value.__aenter__.side_effect = answer
+
+    baskets = coordinator._process_baskets_for_location(
+        "entry1", [{"id": i, "description": "Brot" if i == 1 else "Obst"} for i in range(1, 7)]
+    )
+    assert all(b["details"] is None for b in baskets)
+    event_type, data = hass.bus.async_fire.call_args[0]
+    assert event_type == "foodsharing_keyword_match"
+    assert data["id"] == 1
+
+    await asyncio.gather(*coordinator._prefetch_tasks)
+    assert mock_session.get.call_count == PREFETCH_TOP + 1
+    assert peak <= PREFETCH_CONCURRENCY
+    # Prefetches don't inflate the learned cost of a location poll
+    assert coordinator.budget.used["details"] == PREFETCH_TOP + 1
+    assert coordinator.budget.used["location"] == 0
+    hass.bus.async_fire.assert_called_once()
+
+    # The next poll serves the cached details without new requests
+    baskets = coordinator._process_baskets_for_location("entry1", [{"id": 1, "description": "Brot"}])
+    assert baskets[0]["details"]["description"] == "Frisches Brot"
+    assert baskets[0]["details"]["pictures"] == ["https://foodsharing.de/b.jpg"]
+    assert mock_session.get.call_count == PREFETCH_TOP + 1
+
+    # Nothing is scheduled any more once the coordinator shut down
+    await coordinator.async_shutdown()
+    coordinator._process_baskets_for_location("entry1", [{"id": 20, "description": "Obst"}])
+    assert not coordinator._prefetch_tasks
@@ -0,0 +1,117 @@
+"""Tests for the per-entry basket filters."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+from custom_components.foodsharing.filters import BasketFilter
+
+NOW = datetime(2026, 5, 1, 12, tzinfo=UTC)
+CENTER = (52.52, 13.405)
+
+
+def _basket(**kwargs):
+    return {
+        "id": 1,
+        "description": "Brot und Brötchen",
+        "expires_at": NOW + timedelta(hours=2),
+        "picture": "https://foodsharing.de/b.jpg",
+        "latitude": 52.52,
+        "longitude": 13.405,
+        "keyword_match": False,
+        "user_name": "Anna",
+        **kwargs,
+    }
+
+
+def test_empty_filter_accepts_everything():
+    """Without filter options every basket passes and nothing is a keyword match."""
+    basket_filter = BasketFilter({})
+    assert basket_filter(_basket(picture=None, expires_at=None), None, NOW)
+    assert not basket_filter.keyword_match("Brot")
+
+
+def test_conditions():
+    """Each configured condition drops the baskets failing it."""
+    basket_filter = BasketFilter(
+        {
+            "exclude_keywords": "Fleisch, wurst",
+            "max_basket_distance": 1,
+            "min_time_left": 30,
+            "require_picture": True,
+            "creators_denied": "bernd",
+        }
+    )
+    assert basket_filter(_basket(), CENTER, NOW)
+    assert not basket_filter(_basket(description="Brot und Leberwurst"), CENTER, NOW)
+    assert not basket_filter(_basket(latitude=52.54), CENTER, NOW)
+    assert not basket_filter(_basket(expires_at=NOW + timedelta(minutes=10)), CENTER, NOW)
+    assert not basket_filter(_basket(picture=None), CENTER, NOW)
+    assert not basket_filter(_basket(user_name="Bernd"), CENTER, NOW)
+    # Unknown positions and expiry times are not held against a basket
+    assert basket_filter(_basket(latitude=None, expires_at=None), CENTER, NOW)
+
+    assert BasketFilter({"creators_allowed": "Anna"})(_basket(), None, NOW)
+    assert not BasketFilter({"creators_allowed": "Anna"})(_basket(user_name=None), None, NOW)
+
+
+def test_only_keyword_matches():
+    """Keywords mark matches and only filter when asked to."""
+    basket_filter = BasketFilter({"keywords": "äpfel, (bio)", "only_keyword_matches": True})
+    assert basket_filter.keyword_match("Frische ÄPFEL")
+    assert basket_filter.keyword_match("Gemüse (Bio)")
+    assert not basket_filter.keyword_match("Biomüll")
+    assert basket_filter(_basket(keyword_match=True), None, NOW)
+    assert not basket_filter(_basket(), None, NOW)
+    # Without keywords the option has nothing to match against
+    assert BasketFilter({"only_keyword_matches": True})(_basket(), None, NOW)
+
+
+def test_coordinator_drops_filtered_baskets(mock_session):
+    """Filtered baskets never reach the location data; a dropped filter is compiled anew from the options."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator._prefetch_details = MagicMock()
+    entry = MagicMock(entry_id="entry1", data={"keywords": "brot"}, options={"exclude_keywords": "wurst"})
+    coordinator.entries["entry1"] = entry
+    raw = [
+        {"id": 1, "description": "Brot"},
+        {"id": 2, "description": "Wurstbrot"},
+        {"id": 3, "description": "Obst", "lat": 52.6, "lon": 13.4},
+    ]
+
+    baskets = coordinator._process_baskets_for_location("entry1", raw, CENTER)
+    assert [b["id"] for b in baskets] == [3, 1]
+    assert [b["keyword_match"] for b in baskets] == [False, True]
+
+    entry.options = {"max_basket_distance": 5}
+    coordinator._filters.pop("entry1")
+    baskets = coordinator._process_baskets_for_location("entry1", raw, CENTER)
+    assert [b["id"] for b in baskets] == [2, 1]
+
+
+def test_baskets_leave_before_expiry_with_min_time_left(mock_session):
+    """With a minimum time left, baskets are removed once less than that remains, not at their expiry."""
+    assert BasketFilter({}).removal_time(_basket()) == NOW + timedelta(hours=2)
+    assert BasketFilter({"min_time_left": 30}).removal_time(_basket()) == NOW + timedelta(minutes=90)
+    assert BasketFilter({"min_time_left": 30}).removal_time(_basket(expires_at=None)) is None
+
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator.entries["entry1"] = MagicMock(entry_id="entry1", data={}, options={"min_time_left": 30})
+    baskets = [_basket(), _basket(id=2, expires_at=NOW + timedelta(hours=3))]
+    coordinator.data = {"account": {}, "locations": {"entry1": [{"baskets": baskets, "fairteiler": []}]}}
+
+    with patch("custom_components.foodsharing.coordinator.async_track_point_in_time") as track:
+        coordinator._schedule_basket_expiry(coordinator.data["locations"])
+        assert track.call_args[0][2] == NOW + timedelta(minutes=90)
+        coordinator._async_expire_baskets(NOW + timedelta(minutes=90))
+
+    assert [b["id"] for b in coordinator.data["locations"]["entry1"][0]["baskets"]] == [2]
+    assert track.call_args[0][2] == NOW + timedelta(minutes=150)
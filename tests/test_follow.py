@@ -0,0 +1,116 @@
+"""Tests for the search location following a tracker."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+from custom_components.foodsharing.follow import CELL_MAX_AGE, MAX_CELLS, FollowLocation, snap
+
+NOW = datetime(2026, 5, 1, 12, tzinfo=UTC)
+
+
+def test_snap_to_cell_center():
+    """Positions within a cell share its center."""
+    assert snap(52.5213, 13.4049) == snap(52.5288, 13.4001) == (52.525, 13.405)
+    assert snap(-0.001, -0.001) == (-0.005, -0.005)
+
+
+def test_moves_after_threshold_and_dwell():
+    """The center only moves once the tracker is far enough away and stays there."""
+    follow = FollowLocation(500, timedelta(minutes=2))
+    assert follow.observe(52.52, 13.40, NOW)
+    center = follow.center
+
+    # Small movements and passing through don't move the center
+    assert not follow.observe(52.521, 13.401, NOW)
+    assert not follow.observe(52.55, 13.40, NOW + timedelta(minutes=1))
+    assert not follow.observe(52.60, 13.40, NOW + timedelta(minutes=2))
+    assert follow.due == NOW + timedelta(minutes=4)
+    assert follow.center == center
+
+    assert follow.observe(52.601, 13.40, NOW + timedelta(minutes=4))
+    assert follow.center == snap(52.601, 13.40)
+    assert follow.due is None
+    assert follow.moves == 1
+
+
+def test_stationary_tracker_at_cell_edge():
+    """A tracker standing far from its cell's center does not keep moving it."""
+    follow = FollowLocation(500, timedelta(minutes=2))
+    assert follow.observe(50.0098, 10.005, NOW)
+    for minute in range(1, 61):
+        assert not follow.observe(50.0098, 10.005, NOW + timedelta(minutes=minute))
+    assert follow.moves == 0
+
+    # Settling elsewhere within the same cell keeps its center
+    assert not follow.observe(50.0002, 10.0002, NOW + timedelta(hours=1))
+    assert not follow.observe(50.0002, 10.0002, NOW + timedelta(hours=1, minutes=2))
+    assert follow.due is None
+    assert follow.moves == 0
+
+
+def test_cell_cache():
+    """Results of recently visited cells are served until they get too old."""
+    follow = FollowLocation(500, timedelta(0))
+    follow.observe(52.52, 13.40, NOW)
+    home = follow.center
+    follow.store(home, {"baskets": [{"id": 1}]}, NOW)
+    assert follow.cached(NOW) == {"baskets": [{"id": 1}]}
+
+    follow.observe(52.60, 13.40, NOW)
+    assert follow.cached(NOW) is None
+    follow.observe(52.52, 13.40, NOW)
+    assert follow.cached(NOW + CELL_MAX_AGE + timedelta(seconds=1)) is None
+    assert follow.cell_hits == 1
+
+    for i in range(MAX_CELLS):
+        follow.store((float(i), 0.0), {}, NOW)
+    assert len(follow) == MAX_CELLS
+    assert follow.cached(NOW) is None
+
+
+def test_coordinator_follows_tracker(mock_session):
+    """The primary location is fetched at the tracker's cell and returning to a cell serves its cache."""
+    hass = MagicMock()
+    position = {"latitude": 52.52, "longitude": 13.40}
+    hass.states.get.side_effect = lambda entity_id: MagicMock(attributes=position)
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(hass, "test@test.com", "pass")
+    entry = MagicMock(
+        entry_id="entry1",
+        data={},
+        options={
+            "locations": [{"latitude": 48.1, "longitude": 11.5, "distance": 3}],
+            "follow_entity": "person.anna",
+            "follow_dwell": 0,
+        },
+    )
+    with patch("custom_components.foodsharing.coordinator.async_track_state_change_event") as track:
+        coordinator.add_entry(entry)
+    track.assert_called_once()
+    assert coordinator._center("entry1", 0, entry.options["locations"][0]) == snap(52.52, 13.40)
+
+    home_slice = {"baskets": [{"id": 1, "expires_at": None}], "fairteiler": []}
+    coordinator.follows["entry1"].store(snap(52.52, 13.40), home_slice, datetime.now(UTC))
+    coordinator.data = {"account": {}, "locations": {"entry1": [{"baskets": [], "fairteiler": []}]}}
+    coordinator.async_request_refresh = MagicMock()
+
+    # A new cell is fetched right away
+    coordinator._due[("entry1", 0)] = datetime.now(UTC) + timedelta(minutes=2)
+    position.update(latitude=52.60)
+    coordinator._async_follow_moved("entry1")
+    assert ("entry1", 0) not in coordinator._due
+    hass.async_create_task.assert_called_once()
+
+    # Returning home serves the cached results
+    position.update(latitude=52.52)
+    coordinator._async_follow_moved("entry1")
+    assert coordinator.data["locations"]["entry1"][0]["baskets"] == [{"id": 1, "expires_at": None}]
+    assert hass.async_create_task.call_count == 1
+
+    coordinator.remove_entry("entry1")
+    track.return_value.assert_called_once()
+    assert coordinator._center("entry1", 0, {"latitude": 48.1, "longitude": 11.5}) == (48.1, 11.5)
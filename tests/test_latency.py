@@ -0,0 +1,63 @@
+"""Tests for the Foodsharing latency tracker."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+from custom_components.foodsharing.latency import CEILING_FACTOR, FLOOR, HEADROOM, MIN_SAMPLES, LatencyTracker
+
+
+def test_static_timeout_until_enough_samples():
+    """The static timeout applies while an endpoint has few samples."""
+    tracker = LatencyTracker()
+    for _ in range(MIN_SAMPLES - 1):
+        tracker.record("bells", 0.5)
+    assert tracker.timeout("bells", 10) == 10
+    tracker.record("bells", 0.5)
+    assert tracker.timeout("bells", 10) == pytest.approx(max(0.5 * HEADROOM, FLOOR))
+
+
+def test_timeout_follows_p95_within_bounds():
+    """Adapted timeouts track the p95 latency between the floor and the ceiling."""
+    tracker = LatencyTracker()
+    for _ in range(19):
+        tracker.record("baskets", 2.0)
+    tracker.record("baskets", 30.0)
+    assert tracker.percentile("baskets") == 2.0
+    assert tracker.timeout("baskets", 15) == pytest.approx(6.0)
+
+    for _ in range(20):
+        tracker.record("baskets", 12.0)
+    assert tracker.timeout("baskets", 15) == 15 * CEILING_FACTOR
+
+    for _ in range(50):
+        tracker.record("fast", 0.01)
+    assert tracker.timeout("fast", 10) == FLOOR
+    assert tracker.as_dict()["fast"]["timeout"] == FLOOR
+
+
+@pytest.mark.asyncio
+async def test_coordinator_records_timeouts(mock_session):
+    """A request cut off by its timeout counts with the timeout as its latency."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+
+    async def hang(*args):
+        await asyncio.sleep(1)
+
+    mock_session.get.return_value.__aenter__.side_effect = hang
+    for _ in range(MIN_SAMPLES):
+        coordinator.latency.record("bells", 0.01)
+
+    with (
+        patch("custom_components.foodsharing.latency.FLOOR", 0.05),
+        patch("custom_components.foodsharing.coordinator.backoff_delay", return_value=0),
+    ):
+        assert await coordinator.fetch_bells() == 0
+    # Each retry got more time: p95 of the recorded timeouts times the headroom
+    assert list(coordinator.latency._samples["bells"])[-3:] == pytest.approx([0.05, 0.15, 0.45])
@@ -0,0 +1,59 @@
+"""Tests for the Fairteiler metadata cache."""
+
+import json
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+from custom_components.foodsharing.metadata import METADATA_TTL, MetadataCache
+
+from .responses import set_body
+
+
+@pytest.mark.asyncio
+async def test_metadata_survives_restart_until_expired():
+    """Saved entries are loaded again; expired ones are dropped."""
+    cache = MetadataCache(MagicMock())
+    cache._store = MagicMock()
+    now = dt_util.utcnow()
+    cache.async_put(9, {"id": 9, "name": "Fairteiler"}, now)
+    cache.async_put(10, {"id": 10, "name": "Old"}, now - METADATA_TTL - timedelta(minutes=1))
+    saved = cache._store.async_delay_save.call_args[0][0]()
+    assert set(saved["fairteiler"]) == {"9"}
+
+    restored = MetadataCache(MagicMock())
+    restored._store = MagicMock(async_load=AsyncMock(return_value=saved))
+    await restored.async_load()
+    assert restored.get(9, now) == {"id": 9, "name": "Fairteiler"}
+    assert restored.get(9, now + METADATA_TTL) is None
+
+
+@pytest.mark.asyncio
+async def test_fairteiler_reuse_cached_metadata(mock_session):
+    """A known Fairteiler is not parsed again and locations share its metadata objects."""
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator.metadata._store = MagicMock()
+    response = AsyncMock(status=200)
+    set_body(
+        response,
+        json.dumps([{"id": 9, "name": "Fairteiler", "picture": "/img/9.jpg", "lat": 50.0, "lon": 10.0}]).encode(),
+    )
+    mock_session.get.return_value.__aenter__.return_value = response
+
+    with patch.object(coordinator, "_parse_fairteiler", wraps=coordinator._parse_fairteiler) as parse:
+        first = await coordinator._fetch_fairteiler_raw(50.0, 10.0, 5, fetch_walls=False)
+        second = await coordinator._fetch_fairteiler_raw(50.1, 10.0, 5, fetch_walls=False)
+
+    assert parse.call_count == 1
+    assert first == second
+    assert first[0]["picture"] == "https://foodsharing.de/img/9.jpg"
+    assert first[0] is not second[0]
+    assert first[0]["name"] is second[0]["name"]
+    assert coordinator.metadata.hits == 1
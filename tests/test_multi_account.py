@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.core import HomeAssistant
 
-from custom_components.foodsharing import async_setup_entry
+from custom_components.foodsharing import async_setup_entry, async_unload_entry
 from custom_components.foodsharing.const import (
     CONF_EMAIL,
     CONF_LATITUDE_FS,
@@ -48,6 +48,26 @@ async def test_shared_coordinator_same_account(mock_hass, mock_session):
             new_callable=AsyncMock,
         ),
         patch("custom_components.foodsharing.dr.async_get", return_value=MagicMock()),
+        patch(
+            "custom_components.foodsharing.pickup_history.PickupHistory.async_load",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.foodsharing.scheduler.ActivityModel.async_load",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.foodsharing.budget.RequestBudget.async_load",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.foodsharing.retry.RetryPolicy.async_load",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.foodsharing.metadata.MetadataCache.async_load",
+            new_callable=AsyncMock,
+        ),
     ):
         entry1 = MagicMock()
         entry1.entry_id = "entry1"
@@ -77,6 +97,15 @@ async def test_shared_coordinator_same_account(mock_hass, mock_session):
         assert coord1 is coord2
         assert len(coord1.entries) == 2
 
+        # The coordinator shuts down with the last entry of the account
+        mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+        with patch.object(coord1, "async_shutdown", new_callable=AsyncMock) as shutdown:
+            await async_unload_entry(mock_hass, entry1)
+            shutdown.assert_not_awaited()
+            await async_unload_entry(mock_hass, entry2)
+            shutdown.assert_awaited_once()
+        assert "user@example.com" not in mock_hass.data[DOMAIN]["accounts"]
+
 
 @pytest.mark.asyncio
 async def test_separate_coordinators_different_accounts(mock_hass, mock_session):
@@ -91,6 +120,26 @@ async def test_separate_coordinators_different_accounts(mock_hass, mock_session)
             new_callable=AsyncMock,
         ),
         patch("custom_components.foodsharing.dr.async_get", return_value=MagicMock()),
+        patch(
+            "custom_components.foodsharing.pickup_history.PickupHistory.async_load",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.foodsharing.scheduler.ActivityModel.async_load",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.foodsharing.budget.RequestBudget.async_load",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.foodsharing.retry.RetryPolicy.async_load",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.foodsharing.metadata.MetadataCache.async_load",
+            new_callable=AsyncMock,
+        ),
     ):
         entry1 = MagicMock()
         entry1.entry_id = "acc1"
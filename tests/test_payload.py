@@ -0,0 +1,70 @@
+"""Tests for buffered responses and their JSON decoding."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+from custom_components.foodsharing.payload import (
+    EXECUTOR_THRESHOLD,
+    MAX_BODY_SIZE,
+    BufferedResponse,
+    PayloadTooLarge,
+    check_size,
+)
+
+from .responses import set_body
+
+
+@pytest.mark.asyncio
+async def test_small_bodies_are_decoded_once_inline():
+    """Callers sharing a response share one decoded object."""
+    hass = MagicMock()
+    response = BufferedResponse(hass, 200, {}, b'[{"id": 1, "description": "\xc3\x84pfel"}]')
+
+    first = await response.json()
+    assert first == [{"id": 1, "description": "Äpfel"}]
+    assert await response.json() is first
+    hass.async_add_executor_job.assert_not_called()
+    assert await BufferedResponse(hass, 200, {}, b"").json() is None
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_decoded_in_the_executor():
+    """Bodies beyond the threshold don't block the event loop."""
+    body = json.dumps([{"id": i, "description": "x" * 100} for i in range(EXECUTOR_THRESHOLD // 100)]).encode()
+    hass = MagicMock(async_add_executor_job=AsyncMock(side_effect=lambda func, arg: func(arg)))
+
+    data = await BufferedResponse(hass, 200, {}, body).json()
+    assert hass.async_add_executor_job.await_count == 1
+    assert data[-1]["id"] == EXECUTOR_THRESHOLD // 100 - 1
+
+
+@pytest.mark.asyncio
+async def test_oversized_bodies_are_refused(mock_session):
+    """A body beyond the cap is not read when announced, and not read past the cap otherwise."""
+    check_size(None)
+    with pytest.raises(PayloadTooLarge):
+        check_size(MAX_BODY_SIZE + 1)
+
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    raw = AsyncMock(status=200, content_length=MAX_BODY_SIZE + 1)
+    with pytest.raises(PayloadTooLarge):
+        await coordinator._buffer(raw)
+    raw.content.read.assert_not_called()
+
+    # A chunked body is read no further than one byte beyond the cap
+    raw = AsyncMock(status=200, content_length=None)
+    raw.content.read = AsyncMock(side_effect=lambda n: b" " * min(n, 1024 * 1024))
+    with pytest.raises(PayloadTooLarge):
+        await coordinator._buffer(raw)
+    assert sum(min(call.args[0], 1024 * 1024) for call in raw.content.read.call_args_list) == MAX_BODY_SIZE + 1
+
+    raw = AsyncMock(status=200, content_length=None, headers={})
+    set_body(raw, b"[1]")
+    assert await (await coordinator._buffer(raw)).json() == [1]
@@ -0,0 +1,155 @@
+"""Tests for the Foodsharing retry policy."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.foodsharing.coordinator import OFFLINE_CYCLES, FoodsharingCoordinator
+from custom_components.foodsharing.latency import MIN_SAMPLES
+from custom_components.foodsharing.retry import RateLimited, RetryPolicy, parse_retry_after
+
+from .responses import set_body
+
+
+class FakeRequest:
+    """Async context manager standing in for an aiohttp request."""
+
+    def __init__(self, status, headers=None, delay=0.0):
+        self.response = MagicMock(status=status, headers=headers or {})
+        set_body(self.response, b"")
+        self.delay = delay
+        self.closed = False
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        return self.response
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+
+def _coordinator(mock_session):
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=mock_session,
+    ):
+        coordinator = FoodsharingCoordinator(MagicMock(), "test@test.com", "pass")
+    coordinator.retry._store = MagicMock()
+    return coordinator
+
+
+def test_parse_retry_after():
+    """Retry-After is accepted as delta seconds or as an HTTP date."""
+    now = dt_util.parse_datetime("2026-03-01T12:00:00+00:00")
+    assert parse_retry_after("120", now) == 120
+    assert parse_retry_after("Sun, 01 Mar 2026 12:01:00 GMT", now) == 60
+    assert parse_retry_after("Sun, 01 Mar 2026 11:00:00 GMT", now) == 0
+    assert parse_retry_after("soon", now) is None
+    assert parse_retry_after(None, now) is None
+
+
+@pytest.mark.asyncio
+async def test_cooldowns_survive_restart():
+    """Running cooldowns are saved and loaded again; expired ones are dropped."""
+    policy = RetryPolicy(MagicMock(), "test@example.com")
+    policy._store = MagicMock()
+    now = dt_util.utcnow()
+    policy.async_set_cooldown("https://foodsharing.de", 600, now)
+    saved = policy._store.async_delay_save.call_args[0][0]()
+
+    restored = RetryPolicy(MagicMock(), "test@example.com")
+    restored._store = MagicMock(async_load=AsyncMock(return_value=saved))
+    await restored.async_load()
+    assert restored.cooldown_remaining("https://foodsharing.de", now) == pytest.approx(600)
+    assert restored.cooldown_remaining("https://foodsharing.de", now + timedelta(minutes=11)) == 0
+
+
+@pytest.mark.asyncio
+async def test_request_retries_throttled_responses(mock_session):
+    """A 503 is retried after the short Retry-After; the next answer is used."""
+    coordinator = _coordinator(mock_session)
+    throttled = FakeRequest(503, {"Retry-After": "0"})
+    ok = FakeRequest(200)
+    mock_session.get = MagicMock(side_effect=[throttled, ok])
+
+    async with coordinator._request("bells", "https://foodsharing.de/api/bells", 10) as response:
+        assert response.status == 200
+
+    assert throttled.closed and ok.closed
+    assert coordinator.retry.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_api_offline_issue_needs_consecutive_cycles(mock_session):
+    """The issue is raised after several cycles of 503 answers and stays while any account still gets them."""
+    offline_accounts: set[str] = set()
+    first, second = _coordinator(mock_session), _coordinator(mock_session)
+    first._offline_accounts = second._offline_accounts = offline_accounts
+    second.email = "other@test.com"
+    mock_session.get = MagicMock(side_effect=lambda url, headers=None: FakeRequest(503, {"Retry-After": "0"}))
+
+    def cycle(coordinator, answered=False):
+        coordinator._cycle_offline = coordinator._cycle_answered = 0
+        if answered:
+            coordinator._cycle_answered += 1
+        coordinator._async_note_cycle_availability()
+
+    with (
+        patch("custom_components.foodsharing.coordinator.async_create_issue") as create,
+        patch("custom_components.foodsharing.coordinator.async_delete_issue") as delete,
+    ):
+        for coordinator in (first, second):
+            for _ in range(OFFLINE_CYCLES):
+                async with coordinator._request("bells", "https://foodsharing.de/api/bells", 10) as response:
+                    assert response.status == 503
+                assert coordinator._cycle_offline == 1
+                coordinator._async_note_cycle_availability()
+                coordinator._cycle_offline = 0
+        assert offline_accounts == {"test@test.com", "other@test.com"}
+        assert create.call_count == 2
+
+        # One good answer in a cycle resets the count, and the other account still keeps the issue
+        cycle(first, answered=True)
+        assert offline_accounts == {"other@test.com"}
+        delete.assert_not_called()
+
+        cycle(second, answered=True)
+        delete.assert_called_once()
+        assert offline_accounts == set()
+
+
+@pytest.mark.asyncio
+async def test_long_retry_after_starts_cooldown(mock_session):
+    """A long Retry-After pauses all requests instead of sleeping through it."""
+    coordinator = _coordinator(mock_session)
+    mock_session.get = MagicMock(side_effect=[FakeRequest(429, {"Retry-After": "120"})])
+
+    async with coordinator._request("bells", "https://foodsharing.de/api/bells", 10) as response:
+        assert response.status == 429
+
+    with pytest.raises(RateLimited):
+        async with coordinator._request("pickups", "https://foodsharing.de/api/pickups", 10):
+            pass
+    assert mock_session.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_uses_faster_duplicate(mock_session):
+    """With hedging, a request slower than the p95 gets a duplicate and the first answer wins."""
+    coordinator = _coordinator(mock_session)
+    coordinator._hedging = True
+    for _ in range(MIN_SAMPLES):
+        coordinator.latency.record("baskets", 0.01)
+    slow = FakeRequest(200, delay=1)
+    fast = FakeRequest(201)
+    mock_session.get = MagicMock(side_effect=[slow, fast])
+
+    async with coordinator._request("baskets", "https://foodsharing.de/api/baskets", 15) as response:
+        assert response.status == 201
+
+    assert coordinator.retry.hedged == 1
+    assert fast.closed
+    assert mock_session.get.call_count == 2
@@ -0,0 +1,97 @@
+"""Tests for the Foodsharing polling scheduler."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.foodsharing.scheduler import (
+    ActivityModel,
+    bucket_of,
+    next_due,
+    phase_offset,
+    profile_active,
+)
+
+
+def _model():
+    model = ActivityModel(MagicMock(), "test@example.com")
+    model._store = MagicMock()
+    return model
+
+
+def _learn(model, key, busy_hours, weeks=2):
+    """Poll every 10 minutes, with one new basket per poll during the busy hours."""
+    start = datetime(2026, 1, 5, tzinfo=dt_util.DEFAULT_TIME_ZONE)  # Monday
+    next_id = 0
+    ids: set[int] = set()
+    for step in range(weeks * 7 * 24 * 6):
+        now = start + timedelta(minutes=10 * step)
+        if now.hour in busy_hours:
+            next_id += 1
+            ids = {next_id}
+        model.async_observe(key, ids, now)
+    return start
+
+
+def test_observe_counts_only_new_baskets():
+    """The first observation only sets the baseline; later ones count new IDs."""
+    model = _model()
+    now = dt_util.utcnow()
+    assert model.async_observe("loc", {1, 2}, now) == 0
+    assert model.async_observe("loc", {2, 3, 4}, now + timedelta(minutes=5)) == 2
+    arrivals, minutes = model._buckets["loc"][bucket_of(now + timedelta(minutes=5))]
+    assert (arrivals, minutes) == (2, 5)
+
+
+def test_interval_follows_activity():
+    """Busy hours poll fast, quiet hours back off to the maximum."""
+    model = _model()
+    start = _learn(model, "loc", busy_hours={18, 19, 20})
+
+    evening = start.replace(hour=19)
+    night = start.replace(hour=3)
+    assert model.interval("loc", evening, 2, 30) < 5
+    assert model.interval("loc", night, 2, 30) == 30
+    # Polling speeds up in the hour before the busy period
+    assert model.interval("loc", start.replace(hour=17), 2, 30) < 5
+
+
+def test_interval_unknown_location_uses_minimum():
+    """Without enough observations the configured scan interval is used."""
+    model = _model()
+    assert model.interval("unknown", dt_util.utcnow(), 5, 30) == 5
+
+
+def test_next_due_spreads_phases():
+    """Polls land on a per-slice grid, spread over the interval and stable across restarts."""
+    now = dt_util.utcnow()
+    phases = [phase_offset("test@example.com", "entry", str(idx)) for idx in range(4)]
+    assert phases == [phase_offset("test@example.com", "entry", str(idx)) for idx in range(4)]
+    assert len({round(p, 3) for p in phases}) == 4
+
+    with patch("custom_components.foodsharing.scheduler.random.uniform", return_value=0.0):
+        for phase in phases:
+            due = next_due(now, 10, phase)
+            assert now + timedelta(minutes=5) <= due <= now + timedelta(minutes=15)
+            slots = (due.timestamp() - phase * 600) / 600
+            assert abs(slots - round(slots)) < 1e-6
+            # Polling again at the due time moves exactly one interval ahead
+            assert next_due(due, 10, phase) - due == timedelta(minutes=10)
+
+
+def test_profile_active_window_and_entities():
+    """The fast profile follows the time window (also across midnight) and the listed entities."""
+    hass = MagicMock()
+    hass.states.get.return_value = None
+    local = dt_util.as_local(dt_util.utcnow())
+    at = local.replace(hour=23, minute=30)
+
+    assert profile_active(hass, {}, at)
+    assert profile_active(hass, {"active_hours_start": "22:00:00", "active_hours_end": "06:00:00"}, at)
+    assert not profile_active(hass, {"active_hours_start": "08:00:00", "active_hours_end": "20:00:00"}, at)
+
+    options = {"active_entities": ["person.alice", "input_boolean.pickup_mode"]}
+    assert not profile_active(hass, options, at)
+    hass.states.get.side_effect = lambda entity_id: MagicMock(state="on" if entity_id.startswith("input") else "away")
+    assert profile_active(hass, options, at)
@@ -0,0 +1,89 @@
+"""Tests for the local full-text search."""
+
+from custom_components.foodsharing.search import (
+    MESSAGE,
+    WALL_POST,
+    SearchIndex,
+    conversation_documents,
+    fold,
+    slice_documents,
+    stem,
+    tokenize,
+)
+from custom_components.foodsharing.spatial import BASKET
+
+
+def _slice(*baskets, post=None):
+    return {
+        "baskets": [{"id": i, "description": text, "latitude": lat, "longitude": 10.0} for i, text, lat in baskets],
+        "fairteiler": [{"id": 9, "name": "Bahnhof", "latitude": 50.0, "longitude": 10.0, "latest_post": post}],
+    }
+
+
+def test_umlauts_and_endings_are_normalized():
+    """Spelled-out umlauts, accents and inflections map to the same terms."""
+    assert fold("Brötchen, Süßes & Café") == "broetchen, suesses & cafe"
+    assert tokenize("Brötchen") == tokenize("Broetchen")
+    assert stem("brote") == stem("brot") == "brot"
+    assert stem("bananen") == stem("banane")
+
+
+def test_search_with_and_or_and_compounds():
+    """Terms are combined with AND, alternatives with OR, and compound words match partially."""
+    index = SearchIndex()
+    index.update(
+        ("a", "entry1", 0),
+        slice_documents(
+            _slice(
+                (1, "Frisches Brot und Brötchen", 50.0),
+                (2, "Vollkornbrot", 50.0),
+                (3, "Bread and apples", 50.5),
+                (4, "Gemüse", 50.0),
+            )
+        ),
+    )
+
+    assert [r["id"] for r in index.search("Brot")] == [1, 2]
+    assert [r["id"] for r in index.search("brot broetchen")] == [1]
+    assert {r["id"] for r in index.search("Brot OR bread")} == {1, 2, 3}
+    assert index.search("Käse") == []
+    near = index.search("Brot OR bread", near=(50.0, 10.0, 2000))
+    assert {r["id"] for r in near} == {1, 2}
+    assert near[0]["distance"] == 0
+
+
+def test_index_follows_sources():
+    """Wall posts and messages are indexed; documents go when no source has them anymore."""
+    index = SearchIndex()
+    index.update(("a", "entry1", 0), slice_documents(_slice((1, "Brot", 50.0), post={"id": 5, "body": "Äpfel da"})))
+    index.update(("b", "entry2", 0), slice_documents(_slice((1, "Brot", 50.0))))
+    index.update(
+        ("a", "conversations"),
+        conversation_documents([{"id": 3, "last_message": {"id": 7, "body": "Apfelkuchen?"}}], "a"),
+    )
+
+    assert [(r["type"], r["id"]) for r in index.search("äpfel")] == [(WALL_POST, 5)]
+    assert [r["type"] for r in index.search("apfel", {MESSAGE})] == [MESSAGE]
+
+    index.update(("a", "entry1", 0), slice_documents(_slice((1, "Brot mit Butter", 50.0))))
+    assert index.search("äpfel") == []
+    assert [r["id"] for r in index.search("butter", {BASKET})] == [1]
+
+    index.prune(lambda source: source[0] == "a")
+    assert [r["description"] for r in index.search("brot")] == ["Brot mit Butter"]
+    index.prune(lambda source: source[0] == "b")
+    assert len(index) == 0
+
+
+def test_near_filter_with_string_coordinates():
+    """Coordinates given as strings are compared as numbers, documents without any are left out."""
+    index = SearchIndex()
+    data = _slice((1, "Brot", 50.0), (2, "Brot", 50.0), post={"id": 5, "body": "Brot"})
+    data["baskets"][0].update(latitude="50.0", longitude="10.0")
+    data["baskets"][1].update(latitude=None, longitude=None)
+    data["fairteiler"][0].update(latitude="", longitude="10.0")
+    index.update(("a", "entry1", 0), slice_documents(data))
+
+    assert len(index.search("brot")) == 3
+    near = index.search("brot", near=("50.0", "10.0", 2000))
+    assert [(r["id"], r["distance"]) for r in near] == [(1, 0)]
@@ -0,0 +1,126 @@
+"""Soak tests running coordinators against the local fake API server."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.foodsharing.const import CONF_EMAIL, CONF_LOCATIONS, CONF_PASSWORD
+from custom_components.foodsharing.coordinator import FoodsharingCoordinator
+
+from .fake_server import FakeFoodsharingServer, FakeServerConfig, LatencyModel
+
+
+def _make_entry(entry_id, email, locations):
+    entry = MagicMock()
+    entry.entry_id = entry_id
+    entry.data = {CONF_EMAIL: email, CONF_PASSWORD: "pw", CONF_LOCATIONS: locations}
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+async def fake_api(socket_enabled):
+    """Start a fake API server with small latency and a few injected faults."""
+    server = FakeFoodsharingServer(
+        FakeServerConfig(
+            seed=42,
+            latency=LatencyModel("uniform", 0.0, 0.01),
+            faults={500: 0.03, 429: 0.02},
+            # Retry throttled requests at once instead of cooling down for real
+            retry_after=0,
+            # Keep login deterministic; the soak targets the polling cycle
+            endpoint_faults={"login": {}, "login_page": {}, "current_user": {}},
+            baskets_per_query=25,
+        )
+    )
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def client_session():
+    """Real client session with a cookie jar that accepts IP hosts."""
+    session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True))
+    yield session
+    await session.close()
+
+
+def _make_coordinator(hass, session, server, email, entries):
+    with patch(
+        "custom_components.foodsharing.coordinator.async_get_clientsession",
+        return_value=session,
+    ):
+        coordinator = FoodsharingCoordinator(hass, email, "pw")
+    for entry in entries:
+        coordinator.add_entry(entry)
+    coordinator.base_url = server.url
+    # Store needs a real event loop to schedule the delayed save
+    coordinator.pickup_history._store = MagicMock()
+    coordinator.activity._store = MagicMock()
+    coordinator.budget._store = MagicMock()
+    coordinator.retry._store = MagicMock()
+    coordinator.metadata._store = MagicMock()
+    coordinator._prefetch_details = MagicMock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_soak_multi_account_multi_location(fake_api, client_session):
+    """Several accounts with several entries and locations survive repeated cycles."""
+    hass = MagicMock()
+    hass.config.path = MagicMock(return_value="/tmp/foodsharing_soak_session.json")
+    hass.async_add_executor_job = AsyncMock(return_value=None)
+
+    coordinators = []
+    for acc in range(2):
+        email = f"user{acc}@example.com"
+        entries = [
+            _make_entry(
+                f"acc{acc}_entry{e}",
+                email,
+                [
+                    {"latitude": 50.0 + acc + e * 0.1 + i * 0.01, "longitude": 10.0 + i * 0.01, "distance": 5}
+                    for i in range(3)
+                ],
+            )
+            for e in range(2)
+        ]
+        coordinators.append(_make_coordinator(hass, client_session, fake_api, email, entries))
+
+    # Log in once up front; the session-check retries in login() would otherwise sleep.
+    with patch("custom_components.foodsharing.coordinator.asyncio.sleep", new=AsyncMock()):
+        assert all(await asyncio.gather(*(c.login() for c in coordinators)))
+
+    failures = 0
+    with patch("custom_components.foodsharing.coordinator.async_delete_issue"):
+        for _ in range(5):
+            for coordinator in coordinators:
+                # Make every slice due, as if a full scan interval had passed
+                coordinator._due.clear()
+                coordinator._account_due = None
+                coordinator.coalescer.clear()
+                coordinator.shared.clear()
+            results = await asyncio.gather(
+                *(c._async_update_data() for c in coordinators),
+                return_exceptions=True,
+            )
+            for coordinator, result in zip(coordinators, results, strict=True):
+                if isinstance(result, UpdateFailed):
+                    failures += 1
+                    continue
+                assert not isinstance(result, BaseException), result
+                assert set(result["locations"]) == set(coordinator.entries)
+                for locs in result["locations"].values():
+                    assert len(locs) == 3
+                    for loc in locs:
+                        assert isinstance(loc["baskets"], list)
+                        assert isinstance(loc["fairteiler"], list)
+
+    assert failures == 0
+    assert sum(c.retry.retries for c in coordinators) > 0
+    assert fake_api.requests["baskets_nearby"] >= 5 * 2 * 2 * 3
+    assert fake_api.requests["fairteiler_wall"] > 0
@@ -0,0 +1,68 @@
+"""Tests for the spatial index over baskets and Fairteiler."""
+
+import random
+
+import pytest
+
+from custom_components.foodsharing.spatial import BASKET, FAIRTEILER, SpatialIndex, haversine
+
+
+def _slice(baskets=(), fairteiler=()):
+    return {
+        "baskets": [{"id": i, "latitude": lat, "longitude": lon} for i, lat, lon in baskets],
+        "fairteiler": [{"id": i, "latitude": lat, "longitude": lon, "name": f"FT {i}"} for i, lat, lon in fairteiler],
+    }
+
+
+def test_haversine():
+    """Distances match known values within a few meters."""
+    assert haversine(52.5200, 13.4050, 48.1351, 11.5820) == pytest.approx(504_000, rel=0.005)
+    assert haversine(50.0, 10.0, 50.0, 10.0) == 0
+
+
+def test_sources_are_indexed_incrementally():
+    """An item stays while any slice still reports it and moves with its position."""
+    index = SpatialIndex()
+    index.update(("a", "entry1", 0), _slice(baskets=[(1, 50.0, 10.0), (2, 50.001, 10.001)]))
+    index.update(("b", "entry2", 0), _slice(baskets=[(2, 50.001, 10.001)], fairteiler=[(9, 50.002, 10.0)]))
+    assert len(index) == 3
+
+    index.update(("a", "entry1", 0), _slice(baskets=[(1, 50.5, 10.0)]))
+    assert {r["id"] for r in index.within(50.001, 10.001, 500)} == {2, 9}
+    assert [r["id"] for r in index.within(50.5, 10.0, 10)] == [1]
+
+    index.prune(lambda source: source[:2] == ("b", "entry2"))
+    assert [(r["type"], r["id"]) for r in index.nearest(50.0, 10.0, 5)] == [(BASKET, 1)]
+
+    # Items without a position are skipped
+    index.update(("a", "entry1", 1), {"baskets": [{"id": 3, "latitude": None, "longitude": 10.0}]})
+    assert len(index) == 1
+
+
+def test_queries_match_brute_force():
+    """Radius, nearest and bounding box answers equal a scan over all items."""
+    rng = random.Random(4)
+    points = [(i, 50 + rng.uniform(-0.3, 0.3), 10 + rng.uniform(-0.3, 0.3)) for i in range(400)]
+    index = SpatialIndex()
+    for n in range(4):
+        index.update(("a", "entry1", n), _slice(baskets=points[n::4], fairteiler=[(1000 + n, 50.1, 10.1 + n / 100)]))
+
+    lat, lon = 50.05, 9.98
+    by_distance = sorted((haversine(lat, lon, p_lat, p_lon), i) for i, p_lat, p_lon in points)
+
+    assert [r["id"] for r in index.within(lat, lon, 5000, {BASKET})] == [i for d, i in by_distance if d <= 5000]
+    assert [r["id"] for r in index.nearest(lat, lon, 7, {BASKET})] == [i for _, i in by_distance[:7]]
+    assert [r["id"] for r in index.nearest(lat, lon, 2, {FAIRTEILER})] == [1000, 1001]
+
+    found = index.in_box(50.0, 10.0, 50.1, 10.1, {BASKET}, center=(lat, lon))
+    expected = [i for d, i in by_distance if 50.0 <= points[i][1] <= 50.1 and 10.0 <= points[i][2] <= 10.1]
+    assert [r["id"] for r in found] == expected
+    assert found[0]["distance"] == round(haversine(lat, lon, points[expected[0]][1], points[expected[0]][2]))
+
+
+def test_nearest_with_sparse_items():
+    """Items far apart are still found without walking every empty cell."""
+    index = SpatialIndex()
+    index.update("source", _slice(baskets=[(1, 48.1, 11.5), (2, 53.5, 10.0)]))
+    assert [r["id"] for r in index.nearest(52.5, 13.4, 1)] == [2]
+    assert index.nearest(52.5, 13.4, 5, {FAIRTEILER}) == []
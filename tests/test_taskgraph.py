@@ -0,0 +1,68 @@
+"""Tests for the Foodsharing update task graph."""
+
+import asyncio
+
+import pytest
+
+from custom_components.foodsharing.taskgraph import TaskGraph
+
+
+@pytest.mark.asyncio
+async def test_dependents_receive_results():
+    """A node runs after its dependencies and receives their results."""
+    graph = TaskGraph()
+    order: list[str] = []
+
+    async def profile():
+        await asyncio.sleep(0.01)
+        order.append("profile")
+        return {"regionId": 3}
+
+    async def region(profile):
+        order.append("region")
+        return profile["regionId"] * 2
+
+    async def other():
+        order.append("other")
+        return "x"
+
+    graph.add("profile", profile)
+    graph.add("region", region, "profile")
+    graph.add("other", other)
+
+    assert await graph.run() == {"profile": {"regionId": 3}, "region": 6, "other": "x"}
+    assert order == ["other", "profile", "region"]
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_returned_and_passed_on():
+    """Failures become results and dependents see the exception."""
+    graph = TaskGraph()
+    error = ValueError("boom")
+
+    async def failing():
+        raise error
+
+    async def dependent(value):
+        return isinstance(value, ValueError)
+
+    graph.add("failing", failing)
+    graph.add("dependent", dependent, "failing")
+
+    assert await graph.run() == {"failing": error, "dependent": True}
+
+
+def test_dependencies_must_exist():
+    """Unknown dependencies and duplicate names are rejected."""
+    graph = TaskGraph()
+
+    async def noop():
+        return None
+
+    with pytest.raises(ValueError):
+        graph.add("a", noop, "b")
+    graph.add("a", noop)
+    with pytest.raises(ValueError):
+        graph.add("a", noop)
+    assert "a" in graph
+    assert len(graph) == 1